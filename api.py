@@ -40,6 +40,33 @@ class ReengagementRequest(BaseModel):
     volunteer_id: str
     risk_level: Optional[str] = None
 
+class SkillModelRequest(BaseModel):
+    force: bool = False
+
+class LearningPathEvent(BaseModel):
+    path_id: str
+
+class CertificationEvent(BaseModel):
+    volunteer_id: str
+    certification_id: str
+    name: str
+    issue_date: Optional[str] = None
+    expiration_date: Optional[str] = None
+    revoked: bool = False
+
+class ActivityEvent(BaseModel):
+    volunteer_id: str
+    date: str
+    hours: float = 0
+    project_id: Optional[str] = None
+
+class FeedbackEvent(BaseModel):
+    volunteer_id: str
+    date: str
+    satisfaction_score: Optional[float] = None
+    comments: Optional[str] = None
+    project_id: Optional[str] = None
+
 # OnboardingPro Agent endpoints
 @app.post("/onboarding/learning-path", tags=["OnboardingPro"])
 async def generate_learning_path(request: LearningPathRequest):
@@ -57,7 +84,7 @@ async def generate_learning_path(request: LearningPathRequest):
 @app.post("/onboarding/resources", tags=["OnboardingPro"])
 async def recommend_resources(request: ResourceRequest):
     try:
-        result = onboarding_agent.recommend_resources(
+        result = await onboarding_agent.recommend_resources_async(
             request.volunteer_id,
             request.module_id
         )
@@ -77,6 +104,30 @@ async def verify_certifications(volunteer_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Follow-up queue updates, posted when a learning path is changed outside the agent
+@app.post("/onboarding/events/learning-path", tags=["OnboardingPro"])
+async def learning_path_changed(event: LearningPathEvent):
+    try:
+        updated = onboarding_agent.on_learning_path_changed(event.path_id)
+        return {"path_id": event.path_id, "updated": updated}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Certification expiry index updates, posted when a certification is earned, renewed or revoked
+@app.post("/onboarding/events/certification", tags=["OnboardingPro"])
+async def certification_changed(event: CertificationEvent):
+    try:
+        if event.revoked:
+            updated = onboarding_agent.on_certification_removed(event.volunteer_id, event.certification_id)
+        else:
+            updated = onboarding_agent.on_certification_updated(
+                event.volunteer_id,
+                event.model_dump(exclude={"revoked"})
+            )
+        return {"volunteer_id": event.volunteer_id, "updated": updated}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # RetentionGuard Agent endpoints
 @app.get("/retention/burnout-risk/{volunteer_id}", tags=["RetentionGuard"])
 async def predict_burnout_risk(volunteer_id: str):
@@ -111,6 +162,23 @@ async def suggest_reengagement_strategies(request: ReengagementRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Streaming engagement updates, posted when an activity or feedback is logged
+@app.post("/retention/events/activity", tags=["RetentionGuard"])
+async def activity_logged(event: ActivityEvent):
+    try:
+        updated = retention_agent.on_activity_logged(event.model_dump())
+        return {"volunteer_id": event.volunteer_id, "updated": updated}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/retention/events/feedback", tags=["RetentionGuard"])
+async def feedback_submitted(event: FeedbackEvent):
+    try:
+        updated = retention_agent.on_feedback_submitted(event.model_dump(exclude_none=True))
+        return {"volunteer_id": event.volunteer_id, "updated": updated}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # MatchMaker Agent endpoints
 @app.post("/matchmaker/matches", tags=["MatchMaker"])
 async def find_matches(request: MatchRequest):
@@ -138,6 +206,18 @@ async def schedule_assignment(request: AssignmentRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/matchmaker/skill-model", tags=["MatchMaker"])
+async def fit_skill_model(request: SkillModelRequest):
+    try:
+        return matchmaker_agent.refresh_skill_model(request.force)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Release agent threads and connections when the server stops
+@app.on_event("shutdown")
+def shutdown():
+    onboarding_agent.close()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,73 @@
+"""
+Streaming engagement aggregates in RetentionGuard
+
+Compares reading a volunteer's engagement features from the rolling
+window state with extracting them from Salesforce, and times replaying
+the window, ingesting single events and snapshotting to disk.
+
+Usage:
+    python benchmarks/aggregates_benchmark.py --volunteers 20000 --reads 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retentionguard import RetentionGuardAgent
+from synthetic import SyntheticRetentionConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=20000)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--reads', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    sf = SyntheticRetentionConnection(args.volunteers, args.projects, args.seed)
+    path = os.path.join(tempfile.mkdtemp(prefix='aggregates-'), 'engagement.json')
+    agent = RetentionGuardAgent(sf)
+    agent.config['aggregates']['snapshot_path'] = path
+    volunteer_ids = list(sf.volunteers)[:args.reads]
+    now = datetime.now()
+    
+    started = time.perf_counter()
+    for volunteer_id in volunteer_ids:
+        agent._extract_engagement_features(volunteer_id, now=now)
+    elapsed = time.perf_counter() - started
+    print(f"extract from salesforce    {elapsed / len(volunteer_ids) * 1e6:10.1f} us/volunteer")
+    
+    summary = agent.load_engagement_aggregates(now)
+    print(f"replay window              {summary['elapsed']:10.3f} s  "
+          f"{summary['activities']} activities, {summary['feedback']} feedback")
+    
+    started = time.perf_counter()
+    for volunteer_id in volunteer_ids:
+        agent.engagement_features(volunteer_id, now)
+    elapsed = time.perf_counter() - started
+    print(f"read streaming state       {elapsed / len(volunteer_ids) * 1e6:10.1f} us/volunteer")
+    
+    activities = [a for records in sf.activities.values() for a in records]
+    started = time.perf_counter()
+    for activity in activities:
+        agent.on_activity_logged(activity)
+    elapsed = time.perf_counter() - started
+    print(f"on_activity_logged         {elapsed / len(activities) * 1e6:10.1f} us/event")
+    
+    started = time.perf_counter()
+    agent.save_engagement_aggregates()
+    print(f"save snapshot              {time.perf_counter() - started:10.3f} s  "
+          f"{os.path.getsize(path) / 1e6:.1f} MB")
+    
+    agent.engagement_aggregates = None
+    summary = agent.load_engagement_aggregates(now)
+    print(f"load snapshot              {summary['elapsed']:10.3f} s  {summary['volunteers']} volunteers")
+
+
+if __name__ == '__main__':
+    main()
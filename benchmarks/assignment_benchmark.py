@@ -0,0 +1,54 @@
+"""
+Benchmark for MatchMakerAgent.optimize_assignments
+
+Usage:
+    python benchmarks/assignment_benchmark.py --volunteers 50000 --projects 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matchmaker import MatchMakerAgent
+from synthetic import SyntheticConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=50000)
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--min-score', type=float, default=0.05,
+                        help="Minimum match score (the default config threshold is rarely reachable)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    sf = SyntheticConnection(args.volunteers, args.projects, args.seed)
+    print(f"Generated {args.volunteers} volunteers x {args.projects} projects "
+          f"in {time.perf_counter() - started:.1f}s")
+    
+    with tempfile.TemporaryDirectory() as model_dir:
+        config = MatchMakerAgent(None).config
+        config['skill_model']['directory'] = model_dir
+        config['threshold']['min_match_score'] = args.min_score
+        
+        started = time.perf_counter()
+        agent = MatchMakerAgent(sf, config)
+        agent.fit_skill_model()
+        print(f"Fitted skill model in {time.perf_counter() - started:.1f}s")
+        
+        result = agent.optimize_assignments(commit=True)
+    
+    print(f"Assignments: {result['total_assignments']} "
+          f"(unassigned volunteers: {result['unassigned_volunteers']}, "
+          f"open positions: {result['open_positions']})")
+    print(f"Total match score: {result['total_score']:.2f}")
+    for stage, seconds in result['timings'].items():
+        print(f"  {stage:<10} {seconds:8.2f}s")
+
+
+if __name__ == '__main__':
+    main()
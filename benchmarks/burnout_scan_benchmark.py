@@ -0,0 +1,69 @@
+"""
+Org-wide burnout scan in RetentionGuard
+
+Adds a fixed delay to every Salesforce call, then compares assessing
+a sample of volunteers one at a time with predict_burnout_risk against
+the bulk scan of everyone, and reports Salesforce round trips.
+
+Usage:
+    python benchmarks/burnout_scan_benchmark.py --volunteers 40000 --sample 500 --sf-latency 0.005
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retentionguard import RetentionGuardAgent
+from synthetic import SyntheticRetentionConnection
+
+
+class DelayedConnection:
+    """Adds a fixed round-trip delay to every call on a connection"""
+    
+    def __init__(self, connection, latency):
+        self.connection = connection
+        self.latency = latency
+    
+    def __getattr__(self, name):
+        method = getattr(self.connection, name)
+        
+        def call(*args, **kwargs):
+            time.sleep(self.latency)
+            return method(*args, **kwargs)
+        return call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=40000)
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--sample', type=int, default=500)
+    parser.add_argument('--sf-latency', type=float, default=0.005)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    synthetic = SyntheticRetentionConnection(args.volunteers, args.projects, args.seed)
+    agent = RetentionGuardAgent(DelayedConnection(synthetic, args.sf_latency))
+    
+    sample = list(synthetic.volunteers)[:args.sample]
+    started = time.perf_counter()
+    for volunteer_id in sample:
+        agent.predict_burnout_risk(volunteer_id)
+    elapsed = time.perf_counter() - started
+    print(f"predict_burnout_risk   {len(sample) / elapsed:10.0f} volunteers/s  "
+          f"{sum(synthetic.round_trips.values()) / len(sample):.1f} round trips/volunteer")
+    
+    synthetic.round_trips.clear()
+    result = agent.scan_burnout_risk()
+    print(f"scan_burnout_risk      {result['throughput']:10.0f} volunteers/s  "
+          f"{sum(synthetic.round_trips.values())} round trips for {result['volunteers_scanned']} volunteers")
+    print(f"  risk levels: {result['risk_levels']}")
+    print(f"  {result['alerted_volunteers']} volunteers alerted in {result['managers_notified']} manager digests")
+    for stage, seconds in result['timings'].items():
+        print(f"  {stage:<10} {seconds:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
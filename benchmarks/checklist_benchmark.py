@@ -0,0 +1,46 @@
+"""
+Round trips and latency of OnboardingProAgent.get_onboarding_checklist
+
+Usage:
+    python benchmarks/checklist_benchmark.py --volunteers 500
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from onboardingpro import OnboardingProAgent
+from synthetic import SyntheticOnboardingConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=500)
+    parser.add_argument('--modules', type=int, default=500)
+    parser.add_argument('--roles', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    sf = SyntheticOnboardingConnection(args.volunteers, args.modules, args.roles, args.seed)
+    agent = OnboardingProAgent(sf)
+    project_ids = list(sf.projects)
+    
+    # First pass creates the learning paths, second pass reuses them
+    for label in ('new path', 'existing path'):
+        sf.round_trips.clear()
+        started = time.perf_counter()
+        for i, volunteer_id in enumerate(sf.volunteers):
+            agent.get_onboarding_checklist(volunteer_id, project_ids[i % len(project_ids)])
+        elapsed = time.perf_counter() - started
+        
+        calls = sum(sf.round_trips.values())
+        print(f"{label:<14} {elapsed / args.volunteers * 1000:7.3f} ms/checklist  "
+              f"{calls / args.volunteers:5.2f} round trips/checklist")
+        for method, count in sorted(sf.round_trips.items()):
+            print(f"  {method:<32} {count / args.volunteers:5.2f}")
+
+
+if __name__ == '__main__':
+    main()
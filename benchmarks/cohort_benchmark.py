@@ -0,0 +1,55 @@
+"""
+Benchmark for OnboardingProAgent.generate_learning_paths
+
+Usage:
+    python benchmarks/cohort_benchmark.py --volunteers 500 --modules 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from onboardingpro import OnboardingProAgent
+from synthetic import SyntheticOnboardingConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=500)
+    parser.add_argument('--modules', type=int, default=2000)
+    parser.add_argument('--roles', type=int, default=50)
+    parser.add_argument('--cohort-roles', type=int, default=3,
+                        help="Distinct roles the cohort is onboarded into")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    sf = SyntheticOnboardingConnection(args.volunteers, args.modules, args.roles, args.seed)
+    role_ids = list(sf.roles)[:args.cohort_roles]
+    cohort = [(volunteer_id, role_ids[i % len(role_ids)]) for i, volunteer_id in enumerate(sf.volunteers)]
+    print(f"Cohort of {len(cohort)} volunteers, {args.modules} modules, {len(role_ids)} roles")
+    
+    agent = OnboardingProAgent(sf)
+    sf.round_trips.clear()
+    started = time.perf_counter()
+    for volunteer_id, role_id in cohort:
+        agent.generate_learning_path(volunteer_id, role_id)
+    sequential = time.perf_counter() - started
+    print(f"sequential  {sequential:8.3f}s  {sequential / len(cohort) * 1000:7.3f} ms/volunteer  "
+          f"round trips {sum(sf.round_trips.values())}")
+    
+    agent = OnboardingProAgent(sf)
+    sf.round_trips.clear()
+    started = time.perf_counter()
+    result = agent.generate_learning_paths(cohort)
+    bulk = time.perf_counter() - started
+    print(f"cohort      {bulk:8.3f}s  {bulk / len(cohort) * 1000:7.3f} ms/volunteer  "
+          f"round trips {sum(sf.round_trips.values())}")
+    for stage, seconds in result['timings'].items():
+        print(f"  {stage:<10} {seconds:8.3f}s")
+    print(f"Path cache: {agent.path_cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Per-volunteer vs batch engagement feature extraction in RetentionGuard
+
+Usage:
+    python benchmarks/engagement_benchmark.py --volunteers 20000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retentionguard import ENGAGEMENT_FEATURES, RetentionGuardAgent
+from synthetic import SyntheticRetentionConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=20000)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    sf = SyntheticRetentionConnection(args.volunteers, args.projects, args.seed)
+    agent = RetentionGuardAgent(sf)
+    now = datetime.now()
+    
+    sf.round_trips.clear()
+    started = time.perf_counter()
+    per_volunteer = {v: agent._extract_engagement_features(v, now=now) for v in sf.volunteers}
+    elapsed = time.perf_counter() - started
+    print(f"per volunteer  {elapsed:8.3f} s  {sum(sf.round_trips.values()):7d} round trips")
+    
+    sf.round_trips.clear()
+    started = time.perf_counter()
+    matrix = agent.extract_engagement_feature_matrix(list(sf.volunteers), now=now)
+    elapsed = time.perf_counter() - started
+    print(f"batch matrix   {elapsed:8.3f} s  {sum(sf.round_trips.values()):7d} round trips")
+    
+    mismatches = sum(
+        float(features[name]) != float(matrix.at[volunteer_id, name])
+        for volunteer_id, features in per_volunteer.items()
+        for name in ENGAGEMENT_FEATURES
+    )
+    print(f"mismatched values: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+In-process fake LMS server for exercising the OnboardingPro LMS connector
+
+Serves the bulk endpoints HTTPLMSConnector calls from in-memory
+dictionaries on a local port, with an optional per-request latency to
+stand in for a remote LMS.
+"""
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+LEARNING_STYLES = ['visual', 'auditory', 'reading', 'kinesthetic']
+
+
+class FakeLMSServer:
+    """Local HTTP server answering /modules/resources and /volunteers/progress"""
+    
+    def __init__(self, resources=None, progress=None, latency=0.0, fail_ids=()):
+        self.resources = resources or {}
+        self.progress = progress or {}
+        self.latency = latency
+        # Requests asking for any of these ids get a 500
+        self.fail_ids = set(fail_ids)
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+    
+    @classmethod
+    def from_synthetic(cls, sf, seed=42, latency=0.0):
+        """Resources for every module and progress for every volunteer of a synthetic connection"""
+        rng = random.Random(seed)
+        resources = {
+            module_id: [
+                {
+                    'id': f"{module_id}-R{r}",
+                    'title': f"{module['name']} resource {r}",
+                    'learning_style': rng.choice(LEARNING_STYLES),
+                    'url': f"/lms/resources/{module_id}/{r}"
+                }
+                for r in range(rng.randint(0, 8))
+            ]
+            for module_id, module in ((m['id'], m) for m in sf.modules)
+        }
+        module_ids = [m['id'] for m in sf.modules]
+        progress = {
+            volunteer_id: [
+                {
+                    'module_id': module_id,
+                    'status': 'In Progress',
+                    'progress': rng.randint(5, 95),
+                    'score': 0,
+                    'completion_date': None
+                }
+                for module_id in rng.sample(module_ids, rng.randint(0, 3))
+            ]
+            for volunteer_id in sf.volunteers
+        }
+        return cls(resources, progress, latency)
+    
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """Start serving on a free local port in a background thread"""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def setup(self):
+                super().setup()
+                # Headers and body go out as separate writes
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                with server._lock:
+                    server.requests[parsed.path] += 1
+                
+                if server.latency:
+                    time.sleep(server.latency)
+                
+                if parsed.path == '/modules/resources':
+                    ids = query.get('module_ids', [''])[0].split(',')
+                    body = {'resources': {i: server.resources[i] for i in ids if i in server.resources}}
+                elif parsed.path == '/volunteers/progress':
+                    ids = query.get('volunteer_ids', [''])[0].split(',')
+                    body = {'progress': {i: server.progress[i] for i in ids if i in server.progress}}
+                else:
+                    self.send_error(404)
+                    return
+                
+                if server.fail_ids.intersection(ids):
+                    self.send_error(500)
+                    return
+                
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop serving and close the socket"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
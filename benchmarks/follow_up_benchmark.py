@@ -0,0 +1,56 @@
+"""
+Benchmark for OnboardingProAgent.run_follow_ups
+
+Usage:
+    python benchmarks/follow_up_benchmark.py --volunteers 100000 --days 7
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from onboardingpro import OnboardingProAgent
+from synthetic import SyntheticOnboardingConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=100000)
+    parser.add_argument('--modules', type=int, default=500)
+    parser.add_argument('--modules-per-path', type=int, default=10)
+    parser.add_argument('--days', type=int, default=7, help="Daily runs to simulate")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    sf = SyntheticOnboardingConnection(args.volunteers, args.modules, seed=args.seed)
+    sf.add_learning_paths(args.modules_per_path, seed=args.seed)
+    print(f"Generated {args.volunteers} learning paths in {time.perf_counter() - started:.1f}s")
+    
+    agent = OnboardingProAgent(sf)
+    sf.round_trips.clear()
+    
+    started = time.perf_counter()
+    queued = agent.load_follow_ups()
+    print(f"Queued {queued} follow-ups in {time.perf_counter() - started:.2f}s")
+    
+    today = datetime.now()
+    for day in range(args.days):
+        started = time.perf_counter()
+        result = agent.run_follow_ups(today + timedelta(days=day))
+        print(f"{result['run_date']}  {time.perf_counter() - started:6.2f}s  "
+              f"reminders {result['reminders']:>7}  escalations {result['escalations']:>7}  "
+              f"skipped {result['skipped_completed'] + result['skipped_superseded']:>7}  "
+              f"pending {result['pending']}")
+    
+    # Running the same day again sends nothing
+    repeat = agent.run_follow_ups(today + timedelta(days=args.days - 1))
+    print(f"Repeat run: reminders {repeat['reminders']}, escalations {repeat['escalations']}")
+    print(f"Round trips: {dict(sf.round_trips)}")
+
+
+if __name__ == '__main__':
+    main()
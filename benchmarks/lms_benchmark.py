@@ -0,0 +1,108 @@
+"""
+Latency of OnboardingPro resource recommendations backed by an LMS
+
+Runs a fake LMS over local HTTP and adds a fixed delay to every
+Salesforce call, then compares fetching one after the other with the
+overlapped, bulk, cached and asyncio paths.
+
+Usage:
+    python benchmarks/lms_benchmark.py --requests 50 --sf-latency 0.02 --lms-latency 0.02
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lmsconnector import HTTPLMSConnector
+from onboardingpro import OnboardingProAgent
+from fake_lms import FakeLMSServer
+from synthetic import SyntheticOnboardingConnection
+
+
+class DelayedConnection:
+    """Adds a fixed round-trip delay to every call on a connection"""
+    
+    def __init__(self, connection, latency):
+        self.connection = connection
+        self.latency = latency
+    
+    def __getattr__(self, name):
+        method = getattr(self.connection, name)
+        
+        def call(*args, **kwargs):
+            time.sleep(self.latency)
+            return method(*args, **kwargs)
+        return call
+
+
+def timed(label, requests, fn):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed / requests * 1000:8.2f} ms/request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--modules', type=int, default=500)
+    parser.add_argument('--sf-latency', type=float, default=0.02)
+    parser.add_argument('--lms-latency', type=float, default=0.02)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    synthetic = SyntheticOnboardingConnection(args.requests, args.modules, 20, args.seed)
+    sf = DelayedConnection(synthetic, args.sf_latency)
+    pairs = [
+        (volunteer_id, synthetic.modules[i % args.modules]['id'])
+        for i, volunteer_id in enumerate(synthetic.volunteers)
+    ]
+    
+    with FakeLMSServer.from_synthetic(synthetic, args.seed, args.lms_latency) as server:
+        lms = HTTPLMSConnector(server.url, cache_ttl=0)
+        agent = OnboardingProAgent(synthetic, lms)
+        agent.sf = sf
+        
+        def sequential():
+            for volunteer_id, module_id in pairs:
+                sf.get_training_module(module_id)
+                volunteer = sf.get_volunteer(volunteer_id)
+                agent._rank_resources(volunteer, lms.get_module_resources(module_id))
+        
+        def overlapped():
+            for volunteer_id, module_id in pairs:
+                agent.recommend_resources(volunteer_id, module_id)
+        
+        async def concurrent():
+            await asyncio.gather(*[
+                agent.recommend_resources_async(volunteer_id, module_id)
+                for volunteer_id, module_id in pairs
+            ])
+        
+        timed('sequential sf + lms', len(pairs), sequential)
+        timed('overlapped recommend_resources', len(pairs), overlapped)
+        timed('recommend_resources_async gather', len(pairs), lambda: asyncio.run(concurrent()))
+        
+        # One bulk request for a volunteer's whole path
+        module_ids = [module_id for _, module_id in pairs]
+        volunteer_id = pairs[0][0]
+        server.requests.clear()
+        timed('recommend_resources_for_modules', len(pairs),
+              lambda: agent.recommend_resources_for_modules(volunteer_id, module_ids))
+        print(f"  LMS requests: {sum(server.requests.values())} for {len(module_ids)} modules")
+        
+        # Cached resources skip the LMS entirely
+        lms.resource_cache.ttl = 300
+        lms.get_resources_for_modules(module_ids)
+        timed('overlapped, warm resource cache', len(pairs), overlapped)
+        print(f"  cache: {lms.resource_cache.stats()}")
+        
+        agent.lms_async.close()
+        agent.io_pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
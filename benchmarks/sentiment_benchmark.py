@@ -0,0 +1,67 @@
+"""
+Sentiment cache and batch feedback scoring in RetentionGuard
+
+Times feature extraction with a cold and a warm sentiment cache, and
+the batch scorer for newly arrived feedback at several worker counts.
+
+Usage:
+    python benchmarks/sentiment_benchmark.py --volunteers 20000 --workers 1 2 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retentionguard import RetentionGuardAgent, SentimentCache
+from synthetic import SyntheticRetentionConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=20000)
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    sf = SyntheticRetentionConnection(args.volunteers, args.projects, args.seed)
+    
+    # Make every comment distinct so each one needs analyzing
+    for feedback in sf.feedback.values():
+        for item in feedback:
+            if item['comments']:
+                item['comments'] = f"{item['comments']} ({item['volunteer_id']} {item['date']})"
+    feedback = [f for records in sf.feedback.values() for f in records]
+    
+    agent = RetentionGuardAgent(sf)
+    volunteer_ids = list(sf.volunteers)
+    
+    for label in ('cold cache', 'warm cache'):
+        started = time.perf_counter()
+        agent.extract_engagement_feature_matrix(volunteer_ids)
+        print(f"features, {label:<12} {time.perf_counter() - started:7.3f} s  {agent.sentiment_cache.stats()}")
+    
+    for workers in args.workers:
+        agent.sentiment_cache = SentimentCache()
+        result = agent.score_new_feedback(feedback, workers=workers)
+        print(f"score_new_feedback workers={workers:<3} {result['elapsed']:7.3f} s  "
+              f"{result['scored']} comments scored")
+    
+    # A SQLite-backed cache is warm again after a restart
+    path = os.path.join(tempfile.mkdtemp(prefix='sentiment-'), 'sentiment.db')
+    agent.sentiment_cache = SentimentCache(path)
+    agent.score_new_feedback(feedback)
+    agent.sentiment_cache.close()
+    
+    agent.sentiment_cache = SentimentCache(path)
+    started = time.perf_counter()
+    result = agent.score_new_feedback(feedback)
+    print(f"after restart             {time.perf_counter() - started:7.3f} s  "
+          f"{result['already_cached']} cached, {result['scored']} scored")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark for MatchMakerAgent.sweep_volunteer_matches
+
+Usage:
+    python benchmarks/sweep_benchmark.py --volunteers 50000 --projects 2000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matchmaker import MatchMakerAgent
+from synthetic import SyntheticConnection
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--volunteers', type=int, default=50000)
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--shard-size', type=int, default=500)
+    parser.add_argument('--min-score', type=float, default=0.05,
+                        help="Minimum match score (the default config threshold is rarely reachable)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    sf = SyntheticConnection(args.volunteers, args.projects, args.seed)
+    print(f"Generated {args.volunteers} volunteers x {args.projects} projects "
+          f"in {time.perf_counter() - started:.1f}s")
+    
+    with tempfile.TemporaryDirectory() as model_dir:
+        config = MatchMakerAgent(None).config
+        config['skill_model']['directory'] = model_dir
+        config['threshold']['min_match_score'] = args.min_score
+        
+        started = time.perf_counter()
+        agent = MatchMakerAgent(sf, config)
+        agent.fit_skill_model()
+        print(f"Fitted skill model in {time.perf_counter() - started:.1f}s")
+        
+        baseline = None
+        for workers in args.workers:
+            started = time.perf_counter()
+            shard_times = []
+            matched = 0
+            for shard in agent.sweep_volunteer_matches(workers=workers, shard_size=args.shard_size):
+                shard_times.append(shard['elapsed'])
+                matched += sum(1 for matches in shard['matches'].values() if matches)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            
+            print(f"workers={workers:<3} {elapsed:8.2f}s  speedup {baseline / elapsed:5.2f}x  "
+                  f"shards {len(shard_times)} (mean {sum(shard_times) / len(shard_times):.2f}s, "
+                  f"max {max(shard_times):.2f}s)  volunteers with matches {matched}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,564 @@
+"""
+Synthetic in-memory Salesforce connection for VolunteerForce benchmarks
+
+Generates reproducible volunteers and projects shaped like the
+vf_Volunteer__c / vf_Project__c records the agents work with, and
+training catalogs for OnboardingPro.
+"""
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+SKILLS = [
+    'teaching', 'mentoring', 'tutoring', 'construction', 'carpentry', 'painting',
+    'project management', 'first aid', 'cooking', 'driving', 'programming',
+    'web design', 'communication', 'leadership', 'gardening', 'fundraising',
+    'event planning', 'translation', 'counseling', 'photography', 'graphic design',
+    'data entry', 'accounting', 'social media', 'public speaking', 'childcare',
+    'elder care', 'plumbing', 'electrical', 'landscaping'
+]
+
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+# Common weekly blocks (start, end) so schedules repeat the way real ones do
+BLOCKS = [
+    ('08:00', '12:00'), ('09:00', '17:00'), ('13:00', '17:00'),
+    ('17:30', '20:30'), ('18:00', '21:00'), ('10:00', '14:00')
+]
+
+
+def _weekly(rng, probability):
+    return {
+        day: [dict(zip(('start', 'end'), rng.choice(BLOCKS)))]
+        for day in DAYS if rng.random() < probability
+    }
+
+
+def _location(rng):
+    if rng.random() < 0.85:
+        return {
+            'latitude': 37.6 + rng.random() * 0.5,
+            'longitude': -122.6 + rng.random() * 0.5,
+            'postal_code': f"94{rng.randint(100, 199)}"
+        }
+    return {'latitude': None, 'longitude': None, 'postal_code': f"94{rng.randint(100, 199)}"}
+
+
+class SyntheticConnection:
+    """In-memory stand-in for the Salesforce API connection"""
+    
+    def __init__(self, n_volunteers=1000, n_projects=100, seed=42):
+        rng = random.Random(seed)
+        season_start = date(2024, 1, 1)
+        
+        self.volunteers = {}
+        for i in range(n_volunteers):
+            volunteer_id = f"V{i:06d}"
+            self.volunteers[volunteer_id] = {
+                'id': volunteer_id,
+                'name': f"Volunteer {i}",
+                'skills': rng.sample(SKILLS, rng.randint(1, 5)),
+                'availability': {
+                    'weekly': _weekly(rng, 0.35),
+                    'exceptions': {
+                        'blackout_dates': [
+                            (season_start + timedelta(days=rng.randint(0, 365))).isoformat()
+                            for _ in range(rng.randint(0, 2))
+                        ]
+                    }
+                },
+                'max_commitment_hours': rng.choice([None, 10, 20, 40]),
+                'past_engagements': [
+                    {'reliability': rng.random(), 'satisfaction': rng.random(), 'impact': rng.random()}
+                    for _ in range(rng.randint(0, 3))
+                ],
+                **_location(rng)
+            }
+        
+        self.projects = {}
+        self.project_roles = []
+        for i in range(n_projects):
+            project_id = f"P{i:05d}"
+            start = season_start + timedelta(days=rng.randint(0, 180))
+            self.projects[project_id] = {
+                'id': project_id,
+                'name': f"Project {i}",
+                'manager_id': f"S{i % 50:03d}",
+                'description': '',
+                'required_skills': rng.sample(SKILLS, rng.randint(1, 4)),
+                'schedule': {
+                    'start_date': start.isoformat(),
+                    'end_date': (start + timedelta(days=rng.randint(30, 180))).isoformat(),
+                    'weekly': _weekly(rng, 0.3)
+                },
+                'min_commitment_hours': rng.choice([4, 8, 16]),
+                **_location(rng)
+            }
+            self.project_roles.append({
+                'project_id': project_id,
+                'role_id': f"R{i:05d}",
+                'positions': rng.randint(5, 40),
+                'positions_filled': rng.randint(0, 4)
+            })
+        
+        self.assignments = []
+        self.notifications = []
+    
+    def get_volunteer(self, volunteer_id):
+        return self.volunteers.get(volunteer_id)
+    
+    def get_project(self, project_id):
+        return self.projects.get(project_id)
+    
+    def get_active_volunteers(self):
+        return list(self.volunteers.values())
+    
+    def get_active_projects(self):
+        return list(self.projects.values())
+    
+    def get_project_roles(self, project_ids):
+        wanted = set(project_ids)
+        return [r for r in self.project_roles if r['project_id'] in wanted]
+    
+    def create_assignment(self, assignment):
+        self.assignments.append(assignment)
+        return f"A{len(self.assignments):07d}"
+    
+    def create_assignments(self, assignments):
+        ids = []
+        for assignment in assignments:
+            self.assignments.append(assignment)
+            ids.append(f"A{len(self.assignments):07d}")
+        return ids
+    
+    def send_notification(self, notification):
+        self.notifications.append(notification)
+        return f"N{len(self.notifications):07d}"
+
+
+SKILL_CATEGORIES = [
+    'orientation', 'safety', 'first_aid', 'tutoring', 'construction', 'food_service',
+    'technology', 'fundraising', 'outreach', 'youth_programs', 'elder_care', 'administration'
+]
+
+
+class SyntheticOnboardingConnection:
+    """
+    In-memory stand-in for the Salesforce connection used by OnboardingPro
+    
+    Every call is counted in round_trips, keyed by method name, so
+    benchmarks can report how many API requests an operation needs.
+    """
+    
+    def __init__(self, n_volunteers=1000, n_modules=2000, n_roles=50, seed=42):
+        rng = random.Random(seed)
+        season_start = date(2024, 1, 1)
+        self.round_trips = Counter()
+        
+        # Prerequisites only point to earlier modules, so the graph is acyclic
+        self.modules = []
+        for i in range(n_modules):
+            self.modules.append({
+                'id': f"M{i:05d}",
+                'name': f"Module {i}",
+                'description': '',
+                'duration_minutes': rng.choice([15, 30, 45, 60, 90]),
+                'skill_category': rng.choice(SKILL_CATEGORIES),
+                'difficulty': rng.choice(['beginner', 'intermediate', 'advanced']),
+                'required_roles': [f"R{k:04d}" for k in rng.sample(range(n_roles), rng.choice([0, 0, 0, 1, 2]))],
+                'optional_roles': [f"R{k:04d}" for k in rng.sample(range(n_roles), rng.choice([0, 0, 1]))],
+                'prerequisites': [f"M{j:05d}" for j in rng.sample(range(i), min(i, rng.choice([0, 0, 1, 2])))]
+            })
+        
+        self.roles = {}
+        for k in range(n_roles):
+            role_id = f"R{k:04d}"
+            self.roles[role_id] = {
+                'id': role_id,
+                'name': f"Role {k}",
+                'required_skills': rng.sample(SKILL_CATEGORIES, rng.randint(0, 2)),
+                'recommended_skills': rng.sample(SKILL_CATEGORIES, rng.randint(0, 2)),
+                'required_certifications': [f"C{c:03d}" for c in rng.sample(range(20), rng.randint(0, 3))]
+            }
+        
+        self.volunteers = {}
+        self.trainings = {}
+        for i in range(n_volunteers):
+            volunteer_id = f"V{i:06d}"
+            self.volunteers[volunteer_id] = {
+                'id': volunteer_id,
+                'name': f"Volunteer {i}",
+                'skills': rng.sample(SKILL_CATEGORIES, rng.randint(0, 3))
+            }
+            # Most recruits have no training history yet
+            self.trainings[volunteer_id] = [
+                {
+                    'volunteer_id': volunteer_id,
+                    'module_id': f"M{rng.randrange(n_modules):05d}",
+                    'status': rng.choice(['Completed', 'Completed', 'In Progress']),
+                    'score': round(rng.uniform(0.6, 1.0), 2),
+                    'completion_date': (season_start + timedelta(days=rng.randint(0, 365))).isoformat()
+                }
+                for _ in range(rng.choice([0, 0, 0, 2, 5, 10]))
+            ]
+        
+        # Certifications expire within a year either side of today
+        today = date.today()
+        self.certifications = {
+            f"C{c:03d}": {
+                'id': f"C{c:03d}",
+                'name': f"Certification {c}",
+                'description': '',
+                'estimated_time_minutes': rng.choice([60, 90, 120])
+            }
+            for c in range(20)
+        }
+        self.volunteer_certifications = {}
+        for volunteer_id in self.volunteers:
+            self.volunteer_certifications[volunteer_id] = [
+                {
+                    'volunteer_id': volunteer_id,
+                    'certification_id': certification_id,
+                    'name': self.certifications[certification_id]['name'],
+                    'issue_date': (today - timedelta(days=rng.randint(30, 700))).isoformat(),
+                    'expiration_date': (
+                        (today + timedelta(days=rng.randint(-365, 365))).isoformat()
+                        if rng.random() < 0.8 else None
+                    )
+                }
+                for certification_id in rng.sample(sorted(self.certifications), rng.randint(0, 3))
+            ]
+        
+        # One project per role
+        self.projects = {}
+        for k, role_id in enumerate(self.roles):
+            project_id = f"P{k:05d}"
+            self.projects[project_id] = {
+                'id': project_id,
+                'name': f"Project {k}",
+                'role_id': role_id,
+                'organization_id': f"O{k % 5:03d}",
+                'manager_id': f"S{k % 10:03d}",
+                'required_resources': [
+                    {'name': f"Resource {r}", 'description': '', 'resource_link': f"/resources/{r}"}
+                    for r in range(rng.randint(0, 2))
+                ]
+            }
+        
+        self.learning_paths = {}
+        self.notifications = []
+        self.checklists = {}
+    
+    def add_learning_paths(self, modules_per_path=10, start=None, seed=42):
+        """
+        Give every volunteer a learning path without going through the agent
+        
+        Module due dates are spread over the weeks around start, so
+        follow-up benchmarks see a realistic mix of upcoming and overdue
+        modules.
+        """
+        rng = random.Random(seed)
+        start = start or date.today()
+        for volunteer_id in self.volunteers:
+            due = start - timedelta(days=rng.randint(0, 21))
+            modules = []
+            for module in rng.sample(self.modules, modules_per_path):
+                due += timedelta(days=rng.randint(0, 3))
+                modules.append({
+                    'module_id': module['id'],
+                    'name': module['name'],
+                    'required': True,
+                    'estimated_completion': due.isoformat()
+                })
+            path_id = f"LP{len(self.learning_paths):07d}"
+            self.learning_paths[path_id] = {'path_id': path_id, 'volunteer_id': volunteer_id, 'modules': modules}
+    
+    def get_training_modules(self):
+        self.round_trips['get_training_modules'] += 1
+        return self.modules
+    
+    def get_training_module(self, module_id):
+        self.round_trips['get_training_module'] += 1
+        if not hasattr(self, '_modules_by_id'):
+            self._modules_by_id = {m['id']: m for m in self.modules}
+        return self._modules_by_id.get(module_id)
+    
+    def get_module_resources(self, module_id):
+        self.round_trips['get_module_resources'] += 1
+        return []
+    
+    def get_volunteer(self, volunteer_id):
+        self.round_trips['get_volunteer'] += 1
+        return self.volunteers.get(volunteer_id)
+    
+    def get_volunteers(self, volunteer_ids):
+        self.round_trips['get_volunteers'] += 1
+        return [self.volunteers[v] for v in volunteer_ids if v in self.volunteers]
+    
+    def get_role(self, role_id):
+        self.round_trips['get_role'] += 1
+        return self.roles.get(role_id)
+    
+    def get_roles(self, role_ids):
+        self.round_trips['get_roles'] += 1
+        return [self.roles[r] for r in role_ids if r in self.roles]
+    
+    def get_volunteer_trainings(self, volunteer_id):
+        self.round_trips['get_volunteer_trainings'] += 1
+        return self.trainings.get(volunteer_id, [])
+    
+    def get_trainings_for_volunteers(self, volunteer_ids):
+        self.round_trips['get_trainings_for_volunteers'] += 1
+        return [t for v in volunteer_ids for t in self.trainings.get(v, [])]
+    
+    def create_learning_path(self, path):
+        self.round_trips['create_learning_path'] += 1
+        path_id = f"LP{len(self.learning_paths):07d}"
+        self.learning_paths[path_id] = {**path, 'path_id': path_id}
+        return path_id
+    
+    def create_learning_paths(self, paths):
+        self.round_trips['create_learning_paths'] += 1
+        path_ids = []
+        for path in paths:
+            path_id = f"LP{len(self.learning_paths):07d}"
+            self.learning_paths[path_id] = {**path, 'path_id': path_id}
+            path_ids.append(path_id)
+        return path_ids
+    
+    def get_learning_path(self, path_id):
+        self.round_trips['get_learning_path'] += 1
+        return self.learning_paths.get(path_id)
+    
+    def get_volunteer_learning_paths(self, volunteer_id):
+        self.round_trips['get_volunteer_learning_paths'] += 1
+        # Most recent first
+        return [p for p in reversed(list(self.learning_paths.values())) if p['volunteer_id'] == volunteer_id]
+    
+    def get_active_learning_paths(self):
+        self.round_trips['get_active_learning_paths'] += 1
+        return list(self.learning_paths.values())
+    
+    def get_follow_up_keys(self, volunteer_ids):
+        self.round_trips['get_follow_up_keys'] += 1
+        recipients = set(volunteer_ids)
+        return [
+            n['follow_up_key'] for n in self.notifications
+            if 'follow_up_key' in n and n['recipient_id'] in recipients
+        ]
+    
+    def schedule_notification(self, notification):
+        self.round_trips['schedule_notification'] += 1
+        self.notifications.append(notification)
+        return f"N{len(self.notifications):07d}"
+    
+    def schedule_notifications(self, notifications):
+        self.round_trips['schedule_notifications'] += 1
+        self.notifications.extend(notifications)
+        return [f"N{i:07d}" for i in range(len(self.notifications) - len(notifications), len(self.notifications))]
+    
+    def get_certification(self, certification_id):
+        self.round_trips['get_certification'] += 1
+        return self.certifications.get(certification_id)
+    
+    def get_certifications(self, certification_ids):
+        self.round_trips['get_certifications'] += 1
+        return [self.certifications[c] for c in certification_ids if c in self.certifications]
+    
+    def get_volunteer_certifications(self, volunteer_id):
+        self.round_trips['get_volunteer_certifications'] += 1
+        return self.volunteer_certifications.get(volunteer_id, [])
+    
+    def get_all_volunteer_certifications(self):
+        self.round_trips['get_all_volunteer_certifications'] += 1
+        return [c for certs in self.volunteer_certifications.values() for c in certs]
+    
+    def send_notification(self, notification):
+        self.round_trips['send_notification'] += 1
+        self.notifications.append(notification)
+        return f"N{len(self.notifications):07d}"
+    
+    def send_notifications(self, notifications):
+        self.round_trips['send_notifications'] += 1
+        self.notifications.extend(notifications)
+        return [f"N{i:07d}" for i in range(len(self.notifications) - len(notifications), len(self.notifications))]
+    
+    def get_project(self, project_id):
+        self.round_trips['get_project'] += 1
+        return self.projects.get(project_id)
+    
+    def create_onboarding_checklist(self, checklist):
+        self.round_trips['create_onboarding_checklist'] += 1
+        checklist_id = f"CL{len(self.checklists):07d}"
+        self.checklists[checklist_id] = {**checklist, 'checklist_id': checklist_id}
+        return checklist_id
+    
+    def get_onboarding_checklist(self, checklist_id):
+        self.round_trips['get_onboarding_checklist'] += 1
+        return self.checklists.get(checklist_id)
+    
+    def update_onboarding_checklist(self, checklist):
+        self.round_trips['update_onboarding_checklist'] += 1
+        self.checklists[checklist['checklist_id']] = checklist
+
+
+FEEDBACK_COMMENTS = [
+    "Great experience overall, the team was well organized and I learned a lot.",
+    "Rewarding work, but the schedule changes were frustrating.",
+    "I feel overwhelmed by the number of shifts lately.",
+    "Wonderful people and a meaningful project. Happy to keep helping!",
+    "Not enough guidance on site, I was confused most of the day.",
+    "It was fine.",
+    "Too many hours this month, I am exhausted and need a break.",
+    "Loved working with the kids, very fulfilling.",
+    "Communication from the coordinator has been poor and disappointing.",
+    ""
+]
+
+
+class SyntheticRetentionConnection:
+    """
+    In-memory stand-in for the Salesforce connection used by RetentionGuard
+    
+    Activities and feedback cover the last 120 days before today, with
+    some volunteers inactive for weeks and some logging heavy hours.
+    Every call is counted in round_trips, keyed by method name.
+    """
+    
+    def __init__(self, n_volunteers=1000, n_projects=100, seed=42):
+        rng = random.Random(seed)
+        today = date.today()
+        self.round_trips = Counter()
+        
+        self.projects = {
+            f"P{i:05d}": {
+                'id': f"P{i:05d}",
+                'name': f"Project {i}",
+                'manager_id': f"S{i % 40:03d}"
+            }
+            for i in range(n_projects)
+        }
+        project_ids = list(self.projects)
+        
+        self.volunteers = {}
+        self.activities = {}
+        self.feedback = {}
+        self.assignments = {}
+        for i in range(n_volunteers):
+            volunteer_id = f"V{i:06d}"
+            self.volunteers[volunteer_id] = {
+                'id': volunteer_id,
+                'name': f"Volunteer {i}",
+                'start_date': (today - timedelta(days=rng.randint(30, 2000))).isoformat()
+            }
+            
+            assigned = rng.sample(project_ids, rng.randint(0, 3))
+            self.assignments[volunteer_id] = [
+                {'volunteer_id': volunteer_id, 'project_id': project_id, 'status': 'Active'}
+                for project_id in assigned
+            ]
+            
+            # Activity level and how long ago the volunteer stopped showing up
+            sessions = rng.choice([0, 2, 8, 20, 40, 80])
+            idle_days = rng.choice([0, 0, 0, 5, 20, 45])
+            self.activities[volunteer_id] = [
+                {
+                    'volunteer_id': volunteer_id,
+                    'project_id': rng.choice(assigned) if assigned and rng.random() < 0.95 else None,
+                    'date': (today - timedelta(days=rng.randint(idle_days, 120))).isoformat(),
+                    'hours': rng.choice([1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 6.5, 8.0])
+                }
+                for _ in range(sessions)
+            ]
+            
+            # Satisfaction drifts up or down over the feedback history
+            drift = rng.choice([-0.8, -0.3, 0.0, 0.2, 0.5])
+            self.feedback[volunteer_id] = [
+                {
+                    'volunteer_id': volunteer_id,
+                    'project_id': rng.choice(assigned) if assigned else None,
+                    'date': (today - timedelta(days=rng.randint(0, 120))).isoformat(),
+                    'satisfaction_score': min(10.0, max(1.0, round(7 + drift * k + rng.uniform(-1.5, 1.5), 1))),
+                    'comments': rng.choice(FEEDBACK_COMMENTS)
+                }
+                for k in range(rng.choice([0, 0, 1, 2, 3, 5]))
+            ]
+        
+        self.assessments = []
+        self.notifications = []
+    
+    def _in_window(self, records, start_date, end_date):
+        return [r for r in records if start_date <= r['date'] and (end_date is None or r['date'] <= end_date)]
+    
+    def get_volunteer(self, volunteer_id):
+        self.round_trips['get_volunteer'] += 1
+        return self.volunteers.get(volunteer_id)
+    
+    def get_volunteers(self, volunteer_ids):
+        self.round_trips['get_volunteers'] += 1
+        return [self.volunteers[v] for v in volunteer_ids if v in self.volunteers]
+    
+    def get_active_volunteers(self):
+        self.round_trips['get_active_volunteers'] += 1
+        return list(self.volunteers.values())
+    
+    def get_project(self, project_id):
+        self.round_trips['get_project'] += 1
+        return self.projects.get(project_id)
+    
+    def get_projects(self, project_ids):
+        self.round_trips['get_projects'] += 1
+        return [self.projects[p] for p in project_ids if p in self.projects]
+    
+    def get_volunteer_activities(self, volunteer_id, start_date, end_date=None):
+        self.round_trips['get_volunteer_activities'] += 1
+        return self._in_window(self.activities.get(volunteer_id, []), start_date, end_date)
+    
+    def get_volunteer_feedback(self, volunteer_id, start_date, end_date=None):
+        self.round_trips['get_volunteer_feedback'] += 1
+        return self._in_window(self.feedback.get(volunteer_id, []), start_date, end_date)
+    
+    def get_activities(self, start_date, end_date=None, volunteer_ids=None):
+        self.round_trips['get_activities'] += 1
+        ids = self.activities if volunteer_ids is None else volunteer_ids
+        return [a for v in ids for a in self._in_window(self.activities.get(v, []), start_date, end_date)]
+    
+    def get_feedback(self, start_date, end_date=None, volunteer_ids=None):
+        self.round_trips['get_feedback'] += 1
+        ids = self.feedback if volunteer_ids is None else volunteer_ids
+        return [f for v in ids for f in self._in_window(self.feedback.get(v, []), start_date, end_date)]
+    
+    def get_volunteer_assignments(self, volunteer_id):
+        self.round_trips['get_volunteer_assignments'] += 1
+        return self.assignments.get(volunteer_id, [])
+    
+    def get_assignments_for_volunteers(self, volunteer_ids):
+        self.round_trips['get_assignments_for_volunteers'] += 1
+        return [a for v in volunteer_ids for a in self.assignments.get(v, [])]
+    
+    def create_burnout_assessment(self, assessment):
+        self.round_trips['create_burnout_assessment'] += 1
+        self.assessments.append(assessment)
+        return f"BA{len(self.assessments):07d}"
+    
+    def create_burnout_assessments(self, assessments):
+        self.round_trips['create_burnout_assessments'] += 1
+        ids = []
+        for assessment in assessments:
+            self.assessments.append(assessment)
+            ids.append(f"BA{len(self.assessments):07d}")
+        return ids
+    
+    def send_notification(self, notification):
+        self.round_trips['send_notification'] += 1
+        self.notifications.append(notification)
+        return f"N{len(self.notifications):07d}"
+    
+    def send_notifications(self, notifications):
+        self.round_trips['send_notifications'] += 1
+        self.notifications.extend(notifications)
+        return [f"N{len(self.notifications) - len(notifications) + i + 1:07d}" for i in range(len(notifications))]
+    
+    def get_burnout_assessments(self, start_date=None):
+        self.round_trips['get_burnout_assessments'] += 1
+        return [a for a in self.assessments if start_date is None or a['assessment_date'] >= start_date]
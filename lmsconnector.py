@@ -0,0 +1,285 @@
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time to live
+    """
+    
+    def __init__(self, maxsize=1024, ttl=300):
+        """
+        Initialize an empty cache
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid, 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def get_many(self, keys):
+        """
+        Look up several keys at once
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Tuple of (dictionary of key to cached value, list of missing keys)
+        """
+        found = {}
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self.entries.move_to_end(key)
+                    found[key] = entry[1]
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self.entries[key]
+                    missing.append(key)
+                    self.misses += 1
+        return found, missing
+    
+    def put_many(self, values):
+        """
+        Store several values, evicting the least recently used entries
+        
+        Args:
+            values: Dictionary of key to value
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in values.items():
+                self.entries[key] = (expires, value)
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self.entries.clear()
+    
+    def stats(self):
+        """Cache size and hit statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+class LMSConnector(ABC):
+    """
+    Interface OnboardingPro uses to read from a Learning Management System
+    
+    Implementations provide the bulk calls; the single-item calls are
+    built on top of them. Ids whose request failed are left out of the
+    bulk results, so callers can fall back for them.
+    """
+    
+    @abstractmethod
+    def get_resources_for_modules(self, module_ids):
+        """
+        Learning resources for several training modules
+        
+        Args:
+            module_ids: Training module identifiers
+            
+        Returns:
+            Dictionary of module id to list of resources
+        """
+    
+    @abstractmethod
+    def get_progress_for_volunteers(self, volunteer_ids):
+        """
+        LMS progress records for several volunteers
+        
+        Args:
+            volunteer_ids: Volunteer identifiers
+            
+        Returns:
+            Dictionary of volunteer id to list of progress records with
+            module_id, status, progress, score and completion_date
+        """
+    
+    def get_module_resources(self, module_id):
+        """Learning resources for one training module"""
+        return self.get_resources_for_modules([module_id]).get(module_id, [])
+    
+    def get_volunteer_progress(self, volunteer_id):
+        """LMS progress records for one volunteer"""
+        return self.get_progress_for_volunteers([volunteer_id]).get(volunteer_id, [])
+    
+    def close(self):
+        """Release any connections held by the connector"""
+
+
+class HTTPLMSConnector(LMSConnector):
+    """
+    LMS connector over a pooled HTTP session
+    
+    Bulk calls are split into batches of ids, one GET per batch, and
+    module resources are cached for cache_ttl seconds. Progress changes
+    as volunteers train and is cached only if progress_ttl is set.
+    """
+    
+    def __init__(self, base_url, api_key=None, timeout=10, pool_size=10, batch_size=100,
+                 cache_size=1024, cache_ttl=300, progress_ttl=0, max_retries=2):
+        """
+        Initialize the connector
+        
+        Args:
+            base_url: LMS API root URL
+            api_key: Optional bearer token
+            timeout: Request timeout in seconds
+            pool_size: Maximum pooled connections to the LMS host
+            batch_size: Maximum ids per bulk request
+            cache_size: Maximum cached entries per cache
+            cache_ttl: Seconds module resources stay cached
+            progress_ttl: Seconds volunteer progress stays cached
+            max_retries: Connection retries per request
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.logger = logging.getLogger('volunteerforce.lms')
+        
+        # One keep-alive session shared by all calls and threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=max_retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if api_key:
+            self.session.headers['Authorization'] = f"Bearer {api_key}"
+        
+        self.resource_cache = ResponseCache(cache_size, cache_ttl)
+        self.progress_cache = ResponseCache(cache_size, progress_ttl)
+    
+    def get_resources_for_modules(self, module_ids):
+        return self._fetch_bulk('/modules/resources', 'module_ids', 'resources',
+                                module_ids, self.resource_cache)
+    
+    def get_progress_for_volunteers(self, volunteer_ids):
+        return self._fetch_bulk('/volunteers/progress', 'volunteer_ids', 'progress',
+                                volunteer_ids, self.progress_cache)
+    
+    def _fetch_bulk(self, path, param, field, ids, cache):
+        """
+        Fetch records for several ids, serving what it can from the cache
+        
+        Args:
+            path: Endpoint path
+            param: Query parameter carrying the comma-separated ids
+            field: Response field holding the records by id
+            ids: Identifiers to fetch
+            cache: ResponseCache for this endpoint
+            
+        Returns:
+            Dictionary of id to records; ids whose request failed are left out
+        """
+        ids = list(dict.fromkeys(ids))
+        results, missing = cache.get_many(ids)
+        
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            fetched = self._get(path, {param: ','.join(batch)})
+            if fetched is None:
+                continue
+            
+            # Ids the LMS knows nothing about get an empty list
+            records = fetched.get(field, {})
+            batch_results = {i: records.get(i, []) for i in batch}
+            cache.put_many(batch_results)
+            results.update(batch_results)
+        
+        return results
+    
+    def _get(self, path, params):
+        """GET a JSON document, or None on failure"""
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            self.logger.error(f"LMS request {path} failed: {str(e)}")
+            return None
+    
+    def close(self):
+        self.session.close()
+
+
+class AsyncLMSConnector:
+    """
+    Asyncio wrapper around an LMS connector
+    
+    The batches of a bulk call run concurrently on a thread pool sharing
+    the wrapped connector's pooled session and caches.
+    """
+    
+    def __init__(self, connector, max_workers=None):
+        """
+        Initialize the wrapper
+        
+        Args:
+            connector: LMSConnector to wrap
+            max_workers: Threads running requests, defaults to the batch fan-out
+        """
+        self.connector = connector
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='lms')
+    
+    async def get_resources_for_modules(self, module_ids):
+        return await self._gather(self.connector.get_resources_for_modules, module_ids)
+    
+    async def get_progress_for_volunteers(self, volunteer_ids):
+        return await self._gather(self.connector.get_progress_for_volunteers, volunteer_ids)
+    
+    async def get_module_resources(self, module_id):
+        return (await self.get_resources_for_modules([module_id])).get(module_id, [])
+    
+    async def get_volunteer_progress(self, volunteer_id):
+        return (await self.get_progress_for_volunteers([volunteer_id])).get(volunteer_id, [])
+    
+    async def _gather(self, fetch, ids):
+        """Run a bulk fetch as concurrent batches and merge the results"""
+        ids = list(dict.fromkeys(ids))
+        batch_size = getattr(self.connector, 'batch_size', None) or len(ids) or 1
+        loop = asyncio.get_running_loop()
+        
+        batches = await asyncio.gather(*[
+            loop.run_in_executor(self.executor, fetch, ids[start:start + batch_size])
+            for start in range(0, len(ids), batch_size)
+        ])
+        
+        results = {}
+        for batch in batches:
+            results.update(batch)
+        return results
+    
+    def close(self):
+        """Shut down the thread pool and the wrapped connector"""
+        self.executor.shutdown(wait=False)
+        self.connector.close()
@@ -1,10 +1,518 @@
 import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.neighbors import BallTree
 import pandas as pd
 from datetime import datetime
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import itertools
 import json
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Weekly availability bitmaps use one bit per minute of the day
+MINUTES_PER_DAY = 24 * 60
+MASK_WORDS = (MINUTES_PER_DAY + 63) // 64
+
+EARTH_RADIUS_KM = 6371
+
+# Relative model directories in the config are resolved against this root
+MODEL_ROOT = os.environ.get(
+    'VOLUNTEERFORCE_MODEL_ROOT',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')
+)
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in kilometers between points given in radians
+    
+    Works on scalars and broadcasts over arrays, so per-pair and batch
+    scoring share the exact same arithmetic.
+    """
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = np.square(np.sin(dlat/2)) + np.cos(lat1) * np.cos(lat2) * np.square(np.sin(dlon/2))
+    c = 2 * np.arcsin(np.sqrt(a))
+    return c * EARTH_RADIUS_KM
+
+
+# Agent, extracted features and project matrices of each running sweep,
+# by sweep key. Registered in the parent before its pool forks so workers
+# read them copy-on-write instead of receiving them pickled with every
+# task; concurrent sweeps each use their own key.
+_sweep_contexts = {}
+_sweep_keys = itertools.count()
+_sweep_lock = threading.Lock()
+
+
+def _sweep_shard(key, shard, start, stop):
+    """
+    Rank the best projects for one shard of the swept volunteers
+    
+    Args:
+        key: Key of the sweep in _sweep_contexts
+        shard: Shard number
+        start: Index of the first volunteer of the shard
+        stop: Index past the last volunteer of the shard
+        
+    Returns:
+        Dictionary with the shard's matches per volunteer and timing
+    """
+    agent, volunteer_features, project_features, project_matrices, top_n = _sweep_contexts[key]
+    started = time.perf_counter()
+    
+    chunk = volunteer_features[start:stop]
+    match_matrix = agent._score_features(
+        chunk, project_features, prune=True, project_matrices=project_matrices
+    )
+    
+    # Volunteers pruned from the matrix have no passing match
+    matches = {f['id']: [] for f in chunk}
+    matches.update(agent._rank_rows(match_matrix, top_n))
+    
+    return {
+        'shard': shard,
+        'pid': os.getpid(),
+        'volunteers': len(chunk),
+        'matches': matches,
+        'elapsed': time.perf_counter() - started
+    }
+
+
+class _FeatureRecord:
+    """
+    Compact extracted features with read-only dict-style access
+    
+    Subclasses list their fields in __slots__; features['name'] and
+    features.get('name') read the matching attribute.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+    
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+    
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+    
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class VolunteerFeatures(_FeatureRecord):
+    """Extracted features of one volunteer"""
+    
+    __slots__ = (
+        'id', 'name', 'skills_text', 'skills_list', 'availability_mask', 'blackout_ordinals',
+        'location', 'performance_score', 'max_commitment_hours'
+    )
+
+
+class ProjectFeatures(_FeatureRecord):
+    """Extracted features of one project"""
+    
+    __slots__ = (
+        'id', 'name', 'required_skills_text', 'required_skills_list', 'start_date', 'end_date',
+        'schedule_mask', 'date_window', 'location', 'min_commitment_hours'
+    )
+
+
+class _FeatureEntry:
+    """Cached features of one record"""
+    
+    __slots__ = ('features', 'stamp', 'expires_at')
+    
+    def __init__(self, features, stamp, expires_at):
+        self.features = features
+        self.stamp = stamp
+        self.expires_at = expires_at
+
+
+class FeatureStore:
+    """
+    Cache of extracted features keyed by record id and last-modified stamp
+    
+    An entry is reused while the record's stamp is unchanged and its TTL
+    has not run out. The stamp is the record's Salesforce modification
+    timestamp, so an edited record is re-extracted on its next lookup.
+    Records without one are reused until the TTL runs out or their id is
+    invalidated, as the update hooks do.
+    """
+    
+    # Modification timestamps, in order of preference
+    STAMP_FIELDS = ('SystemModstamp', 'LastModifiedDate', 'last_modified')
+    
+    def __init__(self, extract, ttl, clock=time.monotonic):
+        """
+        Initialize an empty store
+        
+        Args:
+            extract: Function building the features of one record
+            ttl: Seconds an entry stays valid
+            clock: Monotonic time source
+        """
+        self.extract = extract
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._next_sweep = clock() + ttl
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    @classmethod
+    def stamp_of(cls, record):
+        """
+        Value that changes whenever a record is modified
+        
+        Args:
+            record: Volunteer or project data
+            
+        Returns:
+            The record's modification timestamp, or None if it has none
+        """
+        for field in cls.STAMP_FIELDS:
+            stamp = record.get(field)
+            if stamp:
+                return stamp
+        
+        return None
+    
+    def get(self, record):
+        """
+        Get the features of a record, extracting them on a miss
+        
+        Args:
+            record: Volunteer or project data
+            
+        Returns:
+            Extracted features of the record
+        """
+        now = self.clock()
+        if now >= self._next_sweep:
+            self.evict_expired(now)
+        
+        record_id = record.get('id')
+        stamp = self.stamp_of(record)
+        entry = self.entries.get(record_id)
+        
+        if entry is not None and entry.stamp == stamp and entry.expires_at > now:
+            self.hits += 1
+            return entry.features
+        
+        self.misses += 1
+        features = self.extract(record)
+        self.entries[record_id] = _FeatureEntry(features, stamp, now + self.ttl)
+        return features
+    
+    def get_many(self, records):
+        """Get the features of several records, in order"""
+        return [self.get(record) for record in records]
+    
+    def invalidate(self, record_id):
+        """Drop a record's cached features"""
+        self.entries.pop(record_id, None)
+    
+    def evict_expired(self, now=None):
+        """
+        Remove all expired entries
+        
+        Args:
+            now: Optional current clock value
+            
+        Returns:
+            Number of entries removed
+        """
+        now = self.clock() if now is None else now
+        expired = [record_id for record_id, entry in self.entries.items() if entry.expires_at <= now]
+        for record_id in expired:
+            del self.entries[record_id]
+        
+        self.evictions += len(expired)
+        self._next_sweep = now + self.ttl
+        return len(expired)
+    
+    def stats(self):
+        """Hit/miss counters and current size"""
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+class PostalCentroids:
+    """
+    Postal prefix to centroid table
+    
+    Built from locations with coordinates; a location with only a postal
+    code resolves to the centroid of its 3-digit (or failing that 2-digit)
+    postal prefix. An empty table only places locations with coordinates.
+    """
+    
+    def __init__(self, locations=()):
+        """
+        Build the table
+        
+        Args:
+            locations: Iterable of locations with latitude, longitude and
+                postal_code entries
+        """
+        sums = defaultdict(lambda: [0.0, 0.0, 0])
+        for location in locations:
+            if location['latitude'] and location['longitude'] and location['postal_code']:
+                for prefix in (location['postal_code'][:3], location['postal_code'][:2]):
+                    total = sums[prefix]
+                    total[0] += float(location['latitude'])
+                    total[1] += float(location['longitude'])
+                    total[2] += 1
+        self.centroids = {
+            prefix: (lat / count, lon / count) for prefix, (lat, lon, count) in sums.items()
+        }
+    
+    def __len__(self):
+        return len(self.centroids)
+    
+    @classmethod
+    def from_table(cls, table):
+        """
+        Restore a table saved from the centroids attribute
+        
+        Args:
+            table: Dictionary of postal prefix to [latitude, longitude]
+            
+        Returns:
+            PostalCentroids instance
+        """
+        centroids = cls()
+        centroids.centroids = {prefix: (lat, lon) for prefix, (lat, lon) in table.items()}
+        return centroids
+    
+    def locate(self, location):
+        """
+        Resolve a location to coordinates
+        
+        Args:
+            location: Location with latitude, longitude and postal_code
+            
+        Returns:
+            (latitude, longitude) in degrees, or None if it cannot be placed
+        """
+        if location['latitude'] and location['longitude']:
+            return float(location['latitude']), float(location['longitude'])
+        
+        postal_code = location['postal_code']
+        if postal_code:
+            for prefix in (postal_code[:3], postal_code[:2]):
+                if prefix in self.centroids:
+                    return self.centroids[prefix]
+        
+        return None
+
+
+class LocationIndex:
+    """
+    Spatial index over record locations
+    
+    Records with coordinates are placed directly; records with only a
+    postal code are placed at their postal prefix centroid. Points live in
+    a haversine BallTree for radius queries.
+    """
+    
+    def __init__(self, records, centroids=None):
+        """
+        Build the index
+        
+        Args:
+            records: List of (record_id, location) pairs, where location has
+                latitude, longitude and postal_code entries
+            centroids: Optional PostalCentroids (defaults to one built from
+                the records)
+        """
+        self.signature = self.signature_of(records)
+        self.centroids = centroids or PostalCentroids(location for _, location in records)
+        
+        self.ids = []
+        points = []
+        for record_id, location in records:
+            point = self.locate(location)
+            if point:
+                self.ids.append(record_id)
+                points.append(point)
+        
+        self.tree = BallTree(np.radians(points), metric='haversine') if points else None
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    @staticmethod
+    def signature_of(records):
+        """Value identifying the indexed records and their locations"""
+        return tuple(
+            (record_id, location['latitude'], location['longitude'], location['postal_code'])
+            for record_id, location in records
+        )
+    
+    def locate(self, location):
+        """Resolve a location to coordinates, see PostalCentroids.locate"""
+        return self.centroids.locate(location)
+    
+    def within(self, point, radius_km):
+        """
+        Find records within a radius of a point
+        
+        Args:
+            point: (latitude, longitude) in degrees
+            radius_km: Search radius in kilometers
+            
+        Returns:
+            Dictionary of record id to distance in kilometers
+        """
+        if self.tree is None:
+            return {}
+        
+        rows, distances = self.tree.query_radius(
+            np.radians([point]), r=radius_km / EARTH_RADIUS_KM, return_distance=True
+        )
+        return {
+            self.ids[row]: distance * EARTH_RADIUS_KM
+            for row, distance in zip(rows[0], distances[0])
+        }
+
+
+class SkillIndex:
+    """
+    Inverted index from skill terms to record ids
+    
+    Keys are the TF-IDF vocabulary terms (n-grams included) of a record's
+    skill text plus its raw skill names, so any volunteer/project pair with
+    a non-zero skill match shares at least one key. Each entry remembers the
+    features it was built from, so records are re-indexed only when they
+    are added or their features are re-extracted.
+    """
+    
+    def __init__(self, analyzer, vocabulary):
+        """
+        Initialize an empty index
+        
+        Args:
+            analyzer: Text analyzer of the fitted skill vectorizer
+            vocabulary: Vocabulary of the fitted skill vectorizer
+        """
+        self.analyzer = analyzer
+        self.vocabulary = vocabulary
+        self.postings = defaultdict(set)
+        self.record_keys = {}
+        self.signatures = {}
+        self.sources = {}
+    
+    def __len__(self):
+        return len(self.record_keys)
+    
+    def is_current(self, record_id, features):
+        """Whether a record is indexed from these exact features"""
+        return self.sources.get(record_id) is features
+    
+    def keys_for(self, skills_text, skills_list):
+        """Index keys for a skill text and skill list"""
+        keys = {term for term in self.analyzer(skills_text) if term in self.vocabulary}
+        keys.update(('skill', skill) for skill in skills_list)
+        return keys
+    
+    def update(self, record_id, skills_text, skills_list, source=None):
+        """
+        Index a record, replacing its previous entry
+        
+        Args:
+            record_id: Volunteer or project identifier
+            skills_text: Skill text used for TF-IDF matching
+            skills_list: Skill names used for direct matching
+            source: Optional features the entry was built from
+            
+        Returns:
+            True if the index changed, False if the record was unchanged
+        """
+        self.sources[record_id] = source
+        signature = (skills_text, frozenset(skills_list))
+        if self.signatures.get(record_id) == signature:
+            return False
+        
+        self.remove(record_id)
+        keys = self.keys_for(skills_text, skills_list)
+        for key in keys:
+            self.postings[key].add(record_id)
+        
+        self.record_keys[record_id] = keys
+        self.signatures[record_id] = signature
+        return True
+    
+    def remove(self, record_id):
+        """Remove a record from the index"""
+        for key in self.record_keys.pop(record_id, ()):
+            ids = self.postings[key]
+            ids.discard(record_id)
+            if not ids:
+                del self.postings[key]
+        
+        self.signatures.pop(record_id, None)
+        self.sources.pop(record_id, None)
+    
+    def retain(self, record_ids):
+        """
+        Remove every record not in a set of ids
+        
+        Args:
+            record_ids: Ids of the records to keep
+            
+        Returns:
+            Number of records removed
+        """
+        stale = [record_id for record_id in self.record_keys if record_id not in record_ids]
+        for record_id in stale:
+            self.remove(record_id)
+        return len(stale)
+    
+    def candidates(self, skills_text, skills_list):
+        """
+        Find records sharing at least one key with a query
+        
+        Args:
+            skills_text: Query skill text
+            skills_list: Query skill names
+            
+        Returns:
+            Set of matching record ids
+        """
+        matched = set()
+        for key in self.keys_for(skills_text, skills_list):
+            matched |= self.postings.get(key, set())
+        return matched
+
 
 class MatchMakerAgent:
     """
@@ -27,11 +535,11 @@ class MatchMakerAgent:
         self.logger = logging.getLogger('volunteerforce.matchmaker')
         
         # Initialize NLP components
-        self.skill_vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
+        self.skill_vectorizer = self._new_skill_vectorizer()
+        
+        # Materialized match results and their change subscribers
+        self.match_cache = None
+        self.subscribers = []
         
         # Load models and cached data
         self._load_models()
@@ -49,17 +557,312 @@ class MatchMakerAgent:
                 'min_match_score': 0.65,
                 'top_n_recommendations': 5
             },
+            'skill_model': {
+                'directory': 'skill_model',  # relative to MODEL_ROOT
+                'max_features': 1000,
+                'ngram_range': [1, 2]
+            },
+            'assignment': {
+                'candidates_per_volunteer': 10,
+                'max_assignments_per_volunteer': 1,
+                'chunk_size': 2000,
+                'bulk_batch_size': 200  # Assignments per bulk Salesforce insert
+            },
+            'sweep': {
+                'workers': None,  # defaults to the CPU count
+                'shard_size': 500
+            },
             'cache_ttl': 3600  # seconds
         }
     
+    def _new_skill_vectorizer(self, params=None):
+        """
+        Create an unfitted skill vectorizer
+        
+        Args:
+            params: Optional vectorizer parameters (defaults from config)
+            
+        Returns:
+            TfidfVectorizer instance
+        """
+        params = params or self._skill_model_params()
+        return TfidfVectorizer(
+            max_features=params['max_features'],
+            stop_words='english',
+            ngram_range=tuple(params['ngram_range'])
+        )
+    
+    def _skill_model_params(self):
+        """Vectorizer parameters recorded with each skill model artifact"""
+        model_config = self.config.get('skill_model', {})
+        return {
+            'max_features': model_config.get('max_features', 1000),
+            'ngram_range': list(model_config.get('ngram_range', [1, 2]))
+        }
+    
     def _load_models(self):
         """Load pre-trained models and cached data"""
-        # In a real implementation, this would load saved models
+        # Extracted features, reused until a record changes or expires
+        cache_ttl = self.config.get('cache_ttl', 3600)
+        self.volunteer_store = FeatureStore(self._extract_volunteer_features, cache_ttl)
+        self.project_store = FeatureStore(self._extract_project_features, cache_ttl)
+        
         self.volunteer_skill_matrix = None
         self.project_skill_matrix = None
+        self.volunteer_index = None
+        self.project_index = None
+        self.volunteer_locations = None
         
-        # For demo purposes, we'll generate these on first use
+        # Saved with the skill model; until one is fitted, locations without
+        # coordinates fall back to comparing postal code prefixes
+        self.postal_centroids = PostalCentroids()
+        
+        # Warm start from the latest skill model artifact
         self.skill_corpus_trained = False
+        self.skill_model_info = None
+        
+        artifact = self._load_skill_model()
+        if artifact:
+            self.skill_vectorizer, self.skill_model_info, self.postal_centroids = artifact
+            self.skill_corpus_trained = True
+            self._reset_skill_indexes()
+        else:
+            # Fitting reads the whole roster, so it is never done implicitly
+            self.logger.warning(
+                f"No skill model artifact in {self._skill_model_directory()}; "
+                f"run fit_skill_model() before matching"
+            )
+    
+    def fit_skill_model(self, volunteers=None, projects=None):
+        """
+        Fit the skill vectorizer over the full corpus and save it as a new version
+        
+        The postal prefix centroid table is rebuilt from the same records and
+        saved with the model, so it is loaded at startup instead of being
+        built from the rosters on a request.
+        
+        Args:
+            volunteers: Optional list of volunteer data (defaults to all active volunteers)
+            projects: Optional list of project data (defaults to all active projects)
+            
+        Returns:
+            Metadata of the saved skill model
+        """
+        if volunteers is None:
+            volunteers = self.sf.get_active_volunteers()
+        if projects is None:
+            projects = self.sf.get_active_projects()
+        volunteer_features = self.volunteer_store.get_many(volunteers)
+        project_features = self.project_store.get_many(projects)
+        
+        texts = self._skill_corpus(volunteer_features, project_features)
+        centroids = PostalCentroids(f['location'] for f in volunteer_features + project_features)
+        
+        params = self._skill_model_params()
+        vectorizer = self._new_skill_vectorizer(params)
+        vectorizer.fit(texts)
+        
+        info = self._save_skill_model(vectorizer, params, self._corpus_hash(texts), len(texts), centroids)
+        
+        # Swap in the new model
+        self.skill_vectorizer = vectorizer
+        self.skill_model_info = info
+        self.postal_centroids = centroids
+        self.skill_corpus_trained = True
+        self.volunteer_skill_matrix = None
+        self.project_skill_matrix = None
+        self._reset_skill_indexes()
+        
+        self.logger.info(f"Skill model v{info['version']} fitted on {len(texts)} documents")
+        return info
+    
+    def refresh_skill_model(self, force=False):
+        """
+        Rebuild the skill model if the volunteer/project corpus has drifted
+        
+        Args:
+            force: Refit even if the corpus is unchanged
+            
+        Returns:
+            Dictionary with refresh status and current model metadata
+        """
+        texts = self._skill_corpus()
+        corpus_hash = self._corpus_hash(texts)
+        
+        if not force and self.skill_model_info and self.skill_model_info['corpus_hash'] == corpus_hash:
+            return {'refreshed': False, 'model': self.skill_model_info}
+        
+        info = self.fit_skill_model()
+        return {'refreshed': True, 'model': info}
+    
+    def _skill_corpus(self, volunteer_features=None, project_features=None):
+        """
+        Collect skill texts from volunteers and projects
+        
+        Args:
+            volunteer_features: Optional extracted volunteer features (defaults to all active volunteers)
+            project_features: Optional extracted project features (defaults to all active projects)
+            
+        Returns:
+            List of skill documents
+        """
+        if volunteer_features is None:
+            volunteer_features = self.volunteer_store.get_many(self.sf.get_active_volunteers())
+        if project_features is None:
+            project_features = self.project_store.get_many(self.sf.get_active_projects())
+        
+        return [f['skills_text'] for f in volunteer_features] + \
+               [f['required_skills_text'] for f in project_features]
+    
+    def _corpus_hash(self, texts):
+        """Order-independent hash of a skill corpus"""
+        digest = hashlib.sha256()
+        for text in sorted(texts):
+            digest.update(text.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def _skill_model_directory(self):
+        """Absolute directory holding versioned skill model artifacts"""
+        directory = self.config.get('skill_model', {}).get('directory', 'skill_model')
+        return os.path.join(MODEL_ROOT, directory)
+    
+    def _skill_model_versions(self):
+        """List saved skill model versions in ascending order"""
+        directory = self._skill_model_directory()
+        if not os.path.isdir(directory):
+            return []
+        
+        versions = []
+        for name in os.listdir(directory):
+            if name.startswith('v') and name[1:].isdigit() and \
+                    os.path.exists(os.path.join(directory, name, 'metadata.json')):
+                versions.append(int(name[1:]))
+        
+        return sorted(versions)
+    
+    def _save_skill_model(self, vectorizer, params, corpus_hash, n_documents, centroids):
+        """
+        Save a fitted vectorizer as the next skill model version
+        
+        The artifact is a directory with the vocabulary (terms in column
+        order), the IDF vector as .npy, the postal prefix centroids and a
+        metadata file. It is written to a temporary directory and renamed
+        into place.
+        
+        Args:
+            vectorizer: Fitted TfidfVectorizer
+            params: Vectorizer parameters
+            corpus_hash: Hash of the training corpus
+            n_documents: Number of documents in the training corpus
+            centroids: PostalCentroids built from the same records
+            
+        Returns:
+            Metadata of the saved skill model
+        """
+        directory = self._skill_model_directory()
+        os.makedirs(directory, exist_ok=True)
+        
+        versions = self._skill_model_versions()
+        version = versions[-1] + 1 if versions else 1
+        
+        info = {
+            'version': version,
+            'corpus_hash': corpus_hash,
+            'n_documents': n_documents,
+            'n_features': len(vectorizer.vocabulary_),
+            'params': params,
+            'created_at': datetime.now().isoformat()
+        }
+        
+        terms = [None] * len(vectorizer.vocabulary_)
+        for term, column in vectorizer.vocabulary_.items():
+            terms[column] = term
+        
+        staging = tempfile.mkdtemp(dir=directory)
+        try:
+            with open(os.path.join(staging, 'vocabulary.json'), 'w') as f:
+                json.dump(terms, f)
+            np.save(os.path.join(staging, 'idf.npy'), vectorizer.idf_)
+            with open(os.path.join(staging, 'postal_centroids.json'), 'w') as f:
+                json.dump(centroids.centroids, f)
+            with open(os.path.join(staging, 'metadata.json'), 'w') as f:
+                json.dump(info, f, indent=2)
+            os.rename(staging, os.path.join(directory, f"v{version:04d}"))
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        
+        return info
+    
+    def _load_skill_model(self, version=None):
+        """
+        Load a saved skill model without refitting
+        
+        Args:
+            version: Optional version to load (defaults to the latest)
+            
+        Returns:
+            Tuple of (vectorizer, metadata, PostalCentroids), or None if no
+            artifact exists
+        """
+        if version is None:
+            versions = self._skill_model_versions()
+            if not versions:
+                return None
+            version = versions[-1]
+        
+        path = os.path.join(self._skill_model_directory(), f"v{version:04d}")
+        with open(os.path.join(path, 'metadata.json')) as f:
+            info = json.load(f)
+        with open(os.path.join(path, 'vocabulary.json')) as f:
+            terms = json.load(f)
+        
+        vectorizer = self._new_skill_vectorizer(info['params'])
+        vectorizer.vocabulary_ = {term: column for column, term in enumerate(terms)}
+        vectorizer.idf_ = np.load(os.path.join(path, 'idf.npy'), mmap_mode='r')
+        
+        # Artifacts saved before the centroids were added leave the table empty
+        centroids = PostalCentroids()
+        centroids_path = os.path.join(path, 'postal_centroids.json')
+        if os.path.exists(centroids_path):
+            with open(centroids_path) as f:
+                centroids = PostalCentroids.from_table(json.load(f))
+        
+        self.logger.info(f"Loaded skill model v{version} ({info['n_features']} features)")
+        return vectorizer, info, centroids
+    
+    def _reset_skill_indexes(self):
+        """Start empty skill indexes for the current vectorizer vocabulary"""
+        analyzer = self.skill_vectorizer.build_analyzer()
+        self.volunteer_index = SkillIndex(analyzer, self.skill_vectorizer.vocabulary_)
+        self.project_index = SkillIndex(analyzer, self.skill_vectorizer.vocabulary_)
+    
+    def refresh_postal_centroids(self, volunteer_features=None, project_features=None):
+        """
+        Rebuild the postal prefix centroid table used to place records without coordinates
+        
+        Args:
+            volunteer_features: Optional extracted volunteer features (defaults to all active volunteers)
+            project_features: Optional extracted project features (defaults to all active projects)
+            
+        Returns:
+            Number of postal prefixes with a centroid
+        """
+        if volunteer_features is None:
+            volunteer_features = self.volunteer_store.get_many(self.sf.get_active_volunteers()) if self.sf else []
+        if project_features is None:
+            project_features = self.project_store.get_many(self.sf.get_active_projects()) if self.sf else []
+        
+        self.postal_centroids = PostalCentroids(
+            f['location'] for f in list(volunteer_features) + list(project_features)
+        )
+        return len(self.postal_centroids)
+    
+    def _check_skill_model(self):
+        """Ensure a fitted skill model is loaded before scoring"""
+        if not self.skill_corpus_trained:
+            raise RuntimeError("Skill model is not fitted; run fit_skill_model() first")
     
     def _extract_volunteer_features(self, volunteer):
         """
@@ -69,13 +872,15 @@ class MatchMakerAgent:
             volunteer: Dictionary containing volunteer data
             
         Returns:
-            Dictionary of extracted features
+            VolunteerFeatures of the volunteer
         """
         # Extract skills as a concatenated string for vectorization
         skills_text = ' '.join(volunteer.get('skills', []))
         
-        # Extract availability as a structured object
+        # Extract availability as a structured object and compile it for matching
         availability = self._parse_availability(volunteer.get('availability', {}))
+        availability_mask = self._compile_weekly(availability['weekly'])
+        blackout_ordinals = self._compile_dates(availability['exceptions']['blackout_dates'])
         
         # Extract location for proximity calculation
         location = {
@@ -89,15 +894,17 @@ class MatchMakerAgent:
             volunteer.get('past_engagements', [])
         )
         
-        return {
-            'id': volunteer.get('id'),
-            'name': volunteer.get('name'),
-            'skills_text': skills_text,
-            'skills_list': volunteer.get('skills', []),
-            'availability': availability,
-            'location': location,
-            'performance_score': performance
-        }
+        return VolunteerFeatures(
+            id=volunteer.get('id'),
+            name=volunteer.get('name'),
+            skills_text=skills_text,
+            skills_list=volunteer.get('skills', []),
+            availability_mask=availability_mask,
+            blackout_ordinals=blackout_ordinals,
+            location=location,
+            performance_score=performance,
+            max_commitment_hours=volunteer.get('max_commitment_hours')
+        )
     
     def _extract_project_features(self, project):
         """
@@ -107,14 +914,16 @@ class MatchMakerAgent:
             project: Dictionary containing project data
             
         Returns:
-            Dictionary of extracted features
+            ProjectFeatures of the project
         """
         # Extract required skills as text
         required_skills_text = ' '.join(project.get('required_skills', []))
         required_skills_text += ' ' + project.get('description', '')
         
-        # Extract schedule
+        # Extract schedule and compile it for matching
         schedule = self._parse_schedule(project.get('schedule', {}))
+        schedule_mask = self._compile_weekly(schedule['weekly'])
+        date_window = self._compile_window(schedule)
         
         # Extract location
         location = {
@@ -123,15 +932,18 @@ class MatchMakerAgent:
             'postal_code': project.get('postal_code')
         }
         
-        return {
-            'id': project.get('id'),
-            'name': project.get('name'),
-            'required_skills_text': required_skills_text,
-            'required_skills_list': project.get('required_skills', []),
-            'schedule': schedule,
-            'location': location,
-            'min_commitment_hours': project.get('min_commitment_hours', 0)
-        }
+        return ProjectFeatures(
+            id=project.get('id'),
+            name=project.get('name'),
+            required_skills_text=required_skills_text,
+            required_skills_list=project.get('required_skills', []),
+            start_date=schedule['start_date'],
+            end_date=schedule['end_date'],
+            schedule_mask=schedule_mask,
+            date_window=date_window,
+            location=location,
+            min_commitment_hours=project.get('min_commitment_hours', 0)
+        )
     
     def _parse_availability(self, availability):
         """
@@ -209,6 +1021,60 @@ class MatchMakerAgent:
         
         return structured
     
+    def _compile_weekly(self, weekly):
+        """
+        Compile weekly time slots into per-day minute bitmaps
+        
+        Bit m of a day's mask is set when minute m is covered by a slot,
+        slot ends included, so two slots overlap exactly when their masks
+        share a bit. Slots ending before they start run to midnight.
+        
+        Args:
+            weekly: Mapping of weekday name to time slots
+            
+        Returns:
+            Tuple of 7 integer masks, Monday first
+        """
+        masks = []
+        for day in WEEKDAYS:
+            mask = 0
+            for slot in weekly.get(day, []):
+                start = self._time_to_minutes(slot['start'])
+                end = self._time_to_minutes(slot['end'])
+                if end < start:
+                    end = MINUTES_PER_DAY - 1
+                mask |= ((1 << (end - start + 1)) - 1) << start
+            masks.append(mask)
+        
+        return tuple(masks)
+    
+    def _time_to_minutes(self, value):
+        """Convert an 'HH:MM' string to minutes since midnight"""
+        parsed = datetime.strptime(value, '%H:%M')
+        return parsed.hour * 60 + parsed.minute
+    
+    def _compile_dates(self, dates):
+        """Convert 'YYYY-MM-DD' strings into a sorted list of date ordinals"""
+        return sorted(datetime.strptime(date, '%Y-%m-%d').toordinal() for date in dates)
+    
+    def _compile_window(self, schedule):
+        """
+        Convert a schedule's date range into date ordinals
+        
+        Args:
+            schedule: Structured project schedule
+            
+        Returns:
+            Tuple of (start, end) ordinals, or None without a full date range
+        """
+        if not (schedule['start_date'] and schedule['end_date']):
+            return None
+        
+        return (
+            datetime.strptime(schedule['start_date'], '%Y-%m-%d').toordinal(),
+            datetime.strptime(schedule['end_date'], '%Y-%m-%d').toordinal()
+        )
+    
     def _calculate_performance_score(self, past_engagements):
         """
         Calculate a performance score based on past volunteer engagements
@@ -246,13 +1112,7 @@ class MatchMakerAgent:
         Returns:
             Skill match score between 0 and 1
         """
-        # Train vectorizer if not already trained
-        if not self.skill_corpus_trained:
-            # Collect skill texts from all volunteers and projects
-            all_texts = [v['skills_text'] for v in self.volunteer_features] + \
-                       [p['required_skills_text'] for p in self.project_features]
-            self.skill_vectorizer.fit(all_texts)
-            self.skill_corpus_trained = True
+        self._check_skill_model()
         
         # Vectorize volunteer skills and project requirements
         volunteer_vector = self.skill_vectorizer.transform([volunteer_features['skills_text']])
@@ -286,179 +1146,814 @@ class MatchMakerAgent:
         Returns:
             Availability match score between 0 and 1
         """
-        match_score = 0.0
-        total_days = 7
-        days_with_overlap = 0
+        return self._availability_score(
+            self._compile_weekly(volunteer_availability['weekly']),
+            self._compile_dates(volunteer_availability['exceptions']['blackout_dates']),
+            self._compile_weekly(project_schedule['weekly']),
+            self._compile_window(project_schedule)
+        )
+    
+    def _availability_score(self, availability_mask, blackout_ordinals, schedule_mask, date_window):
+        """
+        Calculate availability match score from compiled availability
         
-        # Check each day of the week for time slot overlaps
-        for day in volunteer_availability['weekly']:
-            volunteer_slots = volunteer_availability['weekly'][day]
-            project_slots = project_schedule['weekly'][day]
-            
-            if not project_slots:
-                # No project activity on this day
-                continue
-            
-            if not volunteer_slots:
-                # Volunteer not available on this day
-                continue
+        Args:
+            availability_mask: Volunteer weekly bitmaps from _compile_weekly
+            blackout_ordinals: Sorted volunteer blackout date ordinals
+            schedule_mask: Project weekly bitmaps from _compile_weekly
+            date_window: Project (start, end) ordinals, or None
             
-            # Check for overlapping time slots
-            overlap_found = False
-            for p_slot in project_slots:
-                p_start = datetime.strptime(p_slot['start'], '%H:%M').time()
-                p_end = datetime.strptime(p_slot['end'], '%H:%M').time()
-                
-                for v_slot in volunteer_slots:
-                    v_start = datetime.strptime(v_slot['start'], '%H:%M').time()
-                    v_end = datetime.strptime(v_slot['end'], '%H:%M').time()
-                    
-                    # Check if slots overlap
-                    if (v_start <= p_end) and (v_end >= p_start):
-                        overlap_found = True
-                        break
-                
-                if overlap_found:
-                    break
-            
-            if overlap_found:
-                days_with_overlap += 1
+        Returns:
+            Availability match score between 0 and 1
+        """
+        # A day counts when the volunteer and project bitmaps share a minute
+        days_with_overlap = sum(1 for v, p in zip(availability_mask, schedule_mask) if v & p)
         
         # Calculate base availability score
-        base_score = days_with_overlap / total_days
-        
-        # Check blackout dates against project dates
-        if project_schedule['start_date'] and project_schedule['end_date']:
-            # Convert to datetime objects
-            project_start = datetime.strptime(project_schedule['start_date'], '%Y-%m-%d')
-            project_end = datetime.strptime(project_schedule['end_date'], '%Y-%m-%d')
-            
-            # Check blackout dates
-            blackout_conflict = False
-            for blackout_date in volunteer_availability['exceptions']['blackout_dates']:
-                blackout = datetime.strptime(blackout_date, '%Y-%m-%d')
-                if project_start <= blackout <= project_end:
-                    blackout_conflict = True
-                    break
-            
-            # Penalize for blackout date conflicts
-            if blackout_conflict:
+        base_score = days_with_overlap / 7
+        
+        # Penalize for a blackout date inside the project date range
+        if date_window:
+            i = bisect_left(blackout_ordinals, date_window[0])
+            if i < len(blackout_ordinals) and blackout_ordinals[i] <= date_window[1]:
                 base_score *= 0.7
         
         return base_score
     
-    def _calculate_location_match(self, volunteer_location, project_location):
+    def _calculate_location_match(self, volunteer_location, project_location):
+        """
+        Calculate location proximity score
+        
+        Args:
+            volunteer_location: Volunteer location data
+            project_location: Project location data
+            
+        Returns:
+            Location match score between 0 and 1
+        """
+        # Records without coordinates are placed at their postal prefix centroid
+        centroids = self.postal_centroids
+        volunteer_point = centroids.locate(volunteer_location)
+        project_point = centroids.locate(project_location)
+        
+        # If either location cannot be placed, fall back to postal code
+        if volunteer_point is None or project_point is None:
+            
+            # Simple postal code comparison (first 3 digits for proximity)
+            vol_postal = volunteer_location['postal_code'][:3] if volunteer_location['postal_code'] else ''
+            proj_postal = project_location['postal_code'][:3] if project_location['postal_code'] else ''
+            
+            if vol_postal and proj_postal and vol_postal == proj_postal:
+                return 1.0
+            elif vol_postal and proj_postal and vol_postal[:2] == proj_postal[:2]:
+                return 0.8
+            else:
+                return 0.4  # Default medium-distance score when we can't calculate precisely
+        
+        # Calculate Haversine distance between coordinates
+        lat1, lon1 = volunteer_point
+        lat2, lon2 = project_point
+        
+        # Convert to radians
+        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
+        
+        # Haversine formula
+        distance = _haversine_km(lat1, lon1, lat2, lon2)
+        
+        # Convert distance to score (inversely proportional)
+        # Assuming 50km is the max reasonable distance (score = 0.1)
+        # and 0km is perfect match (score = 1.0)
+        max_distance = 50
+        min_score = 0.1
+        
+        if distance >= max_distance:
+            return min_score
+        
+        # Linear interpolation between 1.0 and min_score
+        score = 1.0 - ((1.0 - min_score) * distance / max_distance)
+        return score
+    
+    def calculate_match_score(self, volunteer, project):
+        """
+        Calculate overall match score between volunteer and project
+        
+        Args:
+            volunteer: Volunteer data
+            project: Project data
+            
+        Returns:
+            Match score dictionary with overall score and component scores
+        """
+        # Extract features
+        volunteer_features = self.volunteer_store.get(volunteer)
+        project_features = self.project_store.get(project)
+        
+        # Calculate component scores
+        skill_score = self._calculate_skill_match(
+            volunteer_features, project_features
+        )
+        
+        availability_score = self._availability_score(
+            volunteer_features['availability_mask'], volunteer_features['blackout_ordinals'],
+            project_features['schedule_mask'], project_features['date_window']
+        )
+        
+        location_score = self._calculate_location_match(
+            volunteer_features['location'], project_features['location']
+        )
+        
+        # Apply weights from configuration
+        weights = self.config['weights']
+        weighted_skill = skill_score * weights['skill_match']
+        weighted_availability = availability_score * weights['availability']
+        weighted_location = location_score * weights['location_proximity']
+        weighted_performance = volunteer_features['performance_score'] * weights['past_performance']
+        
+        # Calculate overall score
+        overall_score = (weighted_skill + weighted_availability + weighted_location) * weighted_performance
+        
+        # Return detailed score breakdown
+        return {
+            'volunteer_id': volunteer['id'],
+            'project_id': project['id'],
+            'overall_score': overall_score,
+            'component_scores': {
+                'skill_match': skill_score,
+                'availability_match': availability_score,
+                'location_match': location_score,
+                'performance_factor': volunteer_features['performance_score']
+            }
+        }
+    
+    def calculate_match_matrix(self, volunteers, projects, prune=False):
+        """
+        Calculate match scores for every volunteer/project pair at once
+        
+        Features are extracted once per record and each score component is
+        computed as a matrix operation over the full volunteer x project grid.
+        Scores are identical to calling calculate_match_score for each pair.
+        
+        Args:
+            volunteers: List of volunteer data
+            projects: List of project data
+            prune: Drop volunteers/projects that cannot reach the minimum
+                match score with any counterpart before scoring availability
+                and location
+            
+        Returns:
+            Dictionary with volunteer/project ids and score matrices
+            (rows are volunteers, columns are projects)
+        """
+        volunteer_features = self.volunteer_store.get_many(volunteers)
+        project_features = self.project_store.get_many(projects)
+        
+        return self._score_features(volunteer_features, project_features, prune)
+    
+    def _score_features(self, volunteer_features, project_features, prune=False, top_n=None, distances=None,
+                        project_matrices=None):
+        """
+        Calculate score matrices from extracted features
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: List of extracted project features
+            prune: Drop rows/columns whose score upper bound is below the
+                minimum match score before the availability and location math
+            top_n: When set, also drop rows/columns that cannot reach the
+                top N scores; the components are computed in stages and the
+                bounds are tightened after each one
+            distances: Optional dictionary of (volunteer_id, project_id) to
+                kilometers already known, e.g. from a radius query
+            project_matrices: Optional result of _project_matrices for
+                project_features, shared across volunteer chunks
+            
+        Returns:
+            Dictionary with volunteer/project ids and score matrices
+        """
+        weights = self.config['weights']
+        if project_matrices is None:
+            project_matrices = self._project_matrices(project_features)
+        
+        skill_scores = self._skill_match_matrix(volunteer_features, project_matrices)
+        performance_scores = np.array(
+            [f['performance_score'] for f in volunteer_features], dtype=float
+        )
+        weighted_performance = performance_scores * weights['past_performance']
+        weighted_skill = skill_scores * weights['skill_match']
+        
+        if prune or top_n is not None:
+            # Availability and location lie in [0, 1], which bounds the overall score
+            factor = weighted_performance[:, np.newaxis]
+            upper_bound = (weighted_skill + weights['availability'] +
+                           weights['location_proximity']) * factor
+            rows, cols = self._reachable(upper_bound, weighted_skill * factor, prune, top_n)
+            
+            volunteer_features = [volunteer_features[i] for i in rows]
+            project_features = [project_features[j] for j in cols]
+            project_matrices = self._take_project_matrices(project_matrices, cols)
+            skill_scores = skill_scores[np.ix_(rows, cols)]
+            weighted_skill = weighted_skill[np.ix_(rows, cols)]
+            performance_scores = performance_scores[rows]
+            weighted_performance = weighted_performance[rows]
+        
+        availability_scores = self._availability_match_matrix(volunteer_features, project_features, project_matrices)
+        weighted_availability = availability_scores * weights['availability']
+        
+        if top_n is not None:
+            # Tighten the bounds now that availability is known
+            factor = weighted_performance[:, np.newaxis]
+            partial = weighted_skill + weighted_availability
+            upper_bound = (partial + weights['location_proximity']) * factor
+            rows, cols = self._reachable(upper_bound, partial * factor, prune, top_n)
+            
+            volunteer_features = [volunteer_features[i] for i in rows]
+            project_features = [project_features[j] for j in cols]
+            project_matrices = self._take_project_matrices(project_matrices, cols)
+            skill_scores = skill_scores[np.ix_(rows, cols)]
+            weighted_skill = weighted_skill[np.ix_(rows, cols)]
+            availability_scores = availability_scores[np.ix_(rows, cols)]
+            weighted_availability = weighted_availability[np.ix_(rows, cols)]
+            performance_scores = performance_scores[rows]
+            weighted_performance = weighted_performance[rows]
+        
+        location_scores = self._location_match_matrix(
+            volunteer_features, project_features, distances, project_matrices
+        )
+        weighted_location = location_scores * weights['location_proximity']
+        
+        overall_scores = (weighted_skill + weighted_availability + weighted_location) * \
+            weighted_performance[:, np.newaxis]
+        
+        return {
+            'volunteer_ids': [f['id'] for f in volunteer_features],
+            'project_ids': [f['id'] for f in project_features],
+            'overall_score': overall_scores,
+            'skill_match': skill_scores,
+            'availability_match': availability_scores,
+            'location_match': location_scores,
+            'performance_factor': performance_scores
+        }
+    
+    def _reachable(self, upper_bound, lower_bound, prune, top_n):
+        """
+        Find rows/columns holding a cell that can still make the ranking
+        
+        Args:
+            upper_bound: Upper bound of each cell's overall score
+            lower_bound: Lower bound of each cell's overall score
+            prune: Whether cells below the minimum match score are dropped
+            top_n: Number of top scores wanted, or None
+            
+        Returns:
+            Tuple of (row indices, column indices) to keep
+        """
+        cutoff = self.config['threshold']['min_match_score'] if prune else -np.inf
+        
+        # At least top_n cells score at or above the top_n-th largest lower
+        # bound, so a cell whose upper bound is below it cannot be ranked
+        if top_n is not None and 0 < top_n < lower_bound.size:
+            lower_bound = lower_bound.ravel()
+            kth = lower_bound.size - top_n
+            cutoff = max(cutoff, np.partition(lower_bound, kth)[kth])
+        
+        reachable = upper_bound >= cutoff
+        return np.flatnonzero(reachable.any(axis=1)), np.flatnonzero(reachable.any(axis=0))
+    
+    def _project_matrices(self, project_features):
+        """
+        Project-side inputs of the score matrices
+        
+        Computed once per set of projects and shared by every volunteer
+        chunk scored against it, then narrowed with _take_project_matrices
+        when projects are pruned.
+        
+        Args:
+            project_features: List of extracted project features
+            
+        Returns:
+            Dictionary with the TF-IDF skill matrix, skill incidence matrix
+            and its skill ids, required skill counts, packed schedule masks
+            and radian coordinates of the projects
+        """
+        self._check_skill_model()
+        
+        skill_ids = {}
+        latitude, longitude, located = self._coordinate_arrays(project_features)
+        return {
+            'skill_matrix': self.skill_vectorizer.transform(
+                [f['required_skills_text'] for f in project_features]
+            ) if project_features else None,
+            'skill_ids': skill_ids,
+            'incidence': self._skill_incidence_matrix(
+                [f['required_skills_list'] for f in project_features], skill_ids
+            ),
+            'required_counts': np.array(
+                [max(len(f['required_skills_list']), 1) for f in project_features], dtype=float
+            ),
+            'schedule_words': self._pack_masks([f['schedule_mask'] for f in project_features]),
+            'latitude': latitude,
+            'longitude': longitude,
+            'located': located
+        }
+    
+    def _take_project_matrices(self, project_matrices, cols):
+        """
+        Narrow project matrices to a subset of projects
+        
+        Args:
+            project_matrices: Result of _project_matrices
+            cols: Indices of the projects to keep
+            
+        Returns:
+            Dictionary like project_matrices with only those projects
+        """
+        taken = {'skill_ids': project_matrices['skill_ids']}
+        for key in ('skill_matrix', 'incidence'):
+            matrix = project_matrices[key]
+            taken[key] = matrix[cols] if matrix is not None else None
+        for key in ('required_counts', 'schedule_words', 'latitude', 'longitude', 'located'):
+            taken[key] = project_matrices[key][cols]
+        return taken
+    
+    def _skill_match_matrix(self, volunteer_features, project_matrices):
+        """
+        Calculate skill match scores for all volunteer/project pairs
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_matrices: Result of _project_matrices for the projects
+            
+        Returns:
+            Matrix of skill match scores between 0 and 1
+        """
+        self._check_skill_model()
+        
+        n_projects = len(project_matrices['required_counts'])
+        if not volunteer_features or not n_projects:
+            return np.zeros((len(volunteer_features), n_projects))
+        
+        # Vectorize all volunteers in one pass; projects are vectorized already
+        self.volunteer_skill_matrix = self.skill_vectorizer.transform(
+            [f['skills_text'] for f in volunteer_features]
+        )
+        self.project_skill_matrix = project_matrices['skill_matrix']
+        similarity = cosine_similarity(self.volunteer_skill_matrix, self.project_skill_matrix)
+        
+        # Direct skill matching via sparse skill incidence matrices; volunteer
+        # skills no project requires cannot match and are left out
+        volunteer_incidence = self._skill_incidence_matrix(
+            [f['skills_list'] for f in volunteer_features], project_matrices['skill_ids'], extend=False
+        )
+        direct_matches = (volunteer_incidence @ project_matrices['incidence'].T).toarray()
+        
+        direct_match_bonus = direct_matches / project_matrices['required_counts'] * 0.3
+        
+        # Final skill match score (capped at 1.0)
+        return np.minimum(similarity + direct_match_bonus, 1.0)
+    
+    def _skill_incidence_matrix(self, skill_lists, skill_ids, extend=True):
+        """
+        Build a binary record x skill matrix
+        
+        Args:
+            skill_lists: List of skill lists, one per record
+            skill_ids: Mapping of skill name to column
+            extend: Add unknown skills to skill_ids in place; otherwise
+                they are skipped
+            
+        Returns:
+            Sparse CSR matrix with a 1 for each distinct skill of a record
+        """
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in set(skills):
+                if extend:
+                    column = skill_ids.setdefault(skill, len(skill_ids))
+                else:
+                    column = skill_ids.get(skill)
+                    if column is None:
+                        continue
+                rows.append(row)
+                cols.append(column)
+        
+        return sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(skill_lists), len(skill_ids))
+        )
+    
+    def _availability_match_matrix(self, volunteer_features, project_features, project_matrices=None):
+        """
+        Calculate availability match scores for all volunteer/project pairs
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: List of extracted project features
+            project_matrices: Optional result of _project_matrices holding
+                the packed project schedules
+            
+        Returns:
+            Matrix of availability match scores between 0 and 1
+        """
+        if project_matrices is not None:
+            schedule_words = project_matrices['schedule_words']
+        else:
+            schedule_words = self._pack_masks([f['schedule_mask'] for f in project_features])
+        
+        days_with_overlap = self._overlap_days_matrix(
+            self._pack_masks([f['availability_mask'] for f in volunteer_features]),
+            schedule_words
+        )
+        
+        # Calculate base availability score
+        scores = days_with_overlap / 7
+        
+        # Penalize for blackout date conflicts
+        scores[self._blackout_conflict_matrix(volunteer_features, project_features)] *= 0.7
+        
+        return scores
+    
+    def _pack_masks(self, weekly_masks):
+        """
+        Pack weekly bitmaps into a word array
+        
+        Args:
+            weekly_masks: List of 7-tuples of integer day masks
+            
+        Returns:
+            uint64 array of shape (records, 7, MASK_WORDS)
+        """
+        n_bytes = MASK_WORDS * 8
+        buffer = b''.join(
+            mask.to_bytes(n_bytes, 'little') for masks in weekly_masks for mask in masks
+        )
+        return np.frombuffer(buffer, dtype='<u8').reshape(len(weekly_masks), len(WEEKDAYS), MASK_WORDS)
+    
+    def _overlap_days_matrix(self, volunteer_words, project_words):
+        """
+        Count weekdays on which volunteer and project bitmaps overlap
+        
+        Identical weekly patterns are collapsed first, so the bitwise work
+        scales with the number of distinct schedules, not roster size.
+        
+        Args:
+            volunteer_words: Packed volunteer masks from _pack_masks
+            project_words: Packed project masks from _pack_masks
+            
+        Returns:
+            Integer matrix of overlapping days (volunteers x projects)
+        """
+        n_volunteers, n_projects = len(volunteer_words), len(project_words)
+        if not n_volunteers or not n_projects:
+            return np.zeros((n_volunteers, n_projects), dtype=np.int64)
+        
+        volunteer_patterns, volunteer_rows = np.unique(
+            volunteer_words.reshape(n_volunteers, -1), axis=0, return_inverse=True
+        )
+        project_patterns, project_rows = np.unique(
+            project_words.reshape(n_projects, -1), axis=0, return_inverse=True
+        )
+        volunteer_patterns = volunteer_patterns.reshape(-1, len(WEEKDAYS), MASK_WORDS)
+        project_patterns = project_patterns.reshape(-1, len(WEEKDAYS), MASK_WORDS)
+        
+        days = np.zeros((len(volunteer_patterns), len(project_patterns)), dtype=np.int64)
+        for day in range(len(WEEKDAYS)):
+            overlap = np.zeros(days.shape, dtype=bool)
+            for word in range(MASK_WORDS):
+                v_word = volunteer_patterns[:, day, word]
+                p_word = project_patterns[:, day, word]
+                if v_word.any() and p_word.any():
+                    overlap |= (v_word[:, np.newaxis] & p_word[np.newaxis, :]) != 0
+            days += overlap
+        
+        return days[np.ix_(volunteer_rows.ravel(), project_rows.ravel())]
+    
+    def _blackout_conflict_matrix(self, volunteer_features, project_features):
+        """
+        Find volunteer blackout dates falling inside project date ranges
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: List of extracted project features
+            
+        Returns:
+            Boolean matrix, True where a blackout date conflicts
+        """
+        conflicts = np.zeros((len(volunteer_features), len(project_features)), dtype=bool)
+        
+        # Projects without a full date range are never penalized
+        dated = [j for j, f in enumerate(project_features) if f['date_window']]
+        if not dated:
+            return conflicts
+        
+        # Sorted (volunteer, date ordinal) keys so each check is a range search
+        span = 1 << 32
+        keys = np.array([
+            row * span + ordinal
+            for row, f in enumerate(volunteer_features)
+            for ordinal in f['blackout_ordinals']
+        ], dtype=np.int64)
+        if not len(keys):
+            return conflicts
+        
+        starts = np.array([project_features[j]['date_window'][0] for j in dated], dtype=np.int64)
+        ends = np.array([project_features[j]['date_window'][1] for j in dated], dtype=np.int64)
+        
+        offsets = np.arange(len(volunteer_features), dtype=np.int64)[:, np.newaxis] * span
+        first = np.searchsorted(keys, offsets + starts, side='left')
+        last = np.searchsorted(keys, offsets + ends, side='right')
+        conflicts[:, dated] = last > first
+        
+        return conflicts
+    
+    def _location_match_matrix(self, volunteer_features, project_features, distances=None,
+                               project_matrices=None):
+        """
+        Calculate location proximity scores for all volunteer/project pairs
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: List of extracted project features
+            distances: Optional dictionary of (volunteer_id, project_id) to
+                kilometers; only the other pairs are computed
+            project_matrices: Optional result of _project_matrices holding
+                the project coordinates
+            
+        Returns:
+            Matrix of location match scores between 0 and 1
+        """
+        v_lat, v_lon, v_located = self._coordinate_arrays(volunteer_features)
+        if project_matrices is not None:
+            p_lat, p_lon, p_located = (
+                project_matrices['latitude'], project_matrices['longitude'], project_matrices['located']
+            )
+        else:
+            p_lat, p_lon, p_located = self._coordinate_arrays(project_features)
+        
+        # Haversine distance between all coordinate pairs
+        lat1, lon1 = v_lat[:, np.newaxis], v_lon[:, np.newaxis]
+        lat2, lon2 = p_lat[np.newaxis, :], p_lon[np.newaxis, :]
+        
+        if distances:
+            distance = np.array([
+                [distances.get((v['id'], p['id']), np.nan) for p in project_features]
+                for v in volunteer_features
+            ], dtype=float).reshape(len(volunteer_features), len(project_features))
+            missing = np.isnan(distance)
+            if missing.any():
+                distance = np.where(missing, _haversine_km(lat1, lon1, lat2, lon2), distance)
+        else:
+            distance = _haversine_km(lat1, lon1, lat2, lon2)
+        
+        # Linear interpolation between 1.0 and min_score up to max_distance
+        max_distance = 50
+        min_score = 0.1
+        scores = np.where(
+            distance >= max_distance,
+            min_score,
+            1.0 - ((1.0 - min_score) * distance / max_distance)
+        )
+        
+        # Fall back to postal code comparison where a record cannot be placed
+        fallback = ~(v_located[:, np.newaxis] & p_located[np.newaxis, :])
+        if fallback.any():
+            prefix_ids = {}
+            v_prefix3, v_prefix2 = self._postal_prefix_codes(volunteer_features, prefix_ids)
+            p_prefix3, p_prefix2 = self._postal_prefix_codes(project_features, prefix_ids)
+            
+            both_known = (v_prefix3[:, np.newaxis] >= 0) & (p_prefix3[np.newaxis, :] >= 0)
+            postal_scores = np.where(
+                both_known & (v_prefix3[:, np.newaxis] == p_prefix3[np.newaxis, :]),
+                1.0,
+                np.where(both_known & (v_prefix2[:, np.newaxis] == p_prefix2[np.newaxis, :]), 0.8, 0.4)
+            )
+            scores = np.where(fallback, postal_scores, scores)
+        
+        return scores
+    
+    def _coordinate_arrays(self, features):
+        """
+        Convert record locations into radian coordinate arrays
+        
+        Records without coordinates are placed at their postal prefix centroid.
+        
+        Args:
+            features: List of extracted features with a 'location' entry
+            
+        Returns:
+            Tuple of (latitude, longitude, located) arrays
+        """
+        centroids = self.postal_centroids
+        points = [centroids.locate(f['location']) for f in features]
+        located = np.array([point is not None for point in points], dtype=bool)
+        lat = np.array([point[0] if point else np.nan for point in points], dtype=float)
+        lon = np.array([point[1] if point else np.nan for point in points], dtype=float)
+        
+        return np.radians(lat), np.radians(lon), located
+    
+    def _postal_prefix_codes(self, features, prefix_ids):
+        """
+        Encode 3- and 2-character postal code prefixes as integers
+        
+        Args:
+            features: List of extracted features with a 'location' entry
+            prefix_ids: Mapping of prefix string to code, extended in place
+            
+        Returns:
+            Tuple of (prefix3, prefix2) code arrays, -1 where unknown
+        """
+        prefix3 = np.full(len(features), -1, dtype=np.int64)
+        prefix2 = np.full(len(features), -1, dtype=np.int64)
+        
+        for row, f in enumerate(features):
+            postal_code = f['location']['postal_code']
+            if postal_code:
+                prefix3[row] = prefix_ids.setdefault(('3', postal_code[:3]), len(prefix_ids))
+                prefix2[row] = prefix_ids.setdefault(('2', postal_code[:2]), len(prefix_ids))
+        
+        return prefix3, prefix2
+    
+    def _skill_candidates(self, index, features, text_key, skills_key, query_text, query_skills,
+                          performance_scores):
+        """
+        Select records that can reach the minimum match score with a query
+        
+        Records added or re-extracted since they were indexed are indexed
+        first; edits and removals reported through on_volunteer_updated and
+        on_project_updated are applied there. Records with no shared skill
+        key have a skill match of 0 and are kept only if availability and
+        location alone could lift them over the threshold.
+        
+        Args:
+            index: SkillIndex over the records
+            features: List of extracted features for the records
+            text_key: Feature key holding the record's skill text
+            skills_key: Feature key holding the record's skill list
+            query_text: Skill text of the record being matched
+            query_skills: Skill list of the record being matched
+            performance_scores: Performance factor for each record pair
+            
+        Returns:
+            List of candidate features, in input order
+        """
+        self._check_skill_model()
+        
+        for f in features:
+            if not index.is_current(f['id'], f):
+                index.update(f['id'], f[text_key], f[skills_key], source=f)
+        matched = index.candidates(query_text, query_skills)
+        
+        weights = self.config['weights']
+        min_score = self.config['threshold']['min_match_score']
+        
+        return [
+            f for f, performance in zip(features, performance_scores)
+            if f['id'] in matched or
+            (weights['availability'] + weights['location_proximity']) *
+            (performance * weights['past_performance']) >= min_score
+        ]
+    
+    def _build_match_result(self, match_matrix, row, col):
+        """
+        Build a match score dictionary for one cell of a match matrix
+        
+        Args:
+            match_matrix: Result of calculate_match_matrix
+            row: Volunteer row index
+            col: Project column index
+            
+        Returns:
+            Match score dictionary with overall score and component scores
+        """
+        return {
+            'volunteer_id': match_matrix['volunteer_ids'][row],
+            'project_id': match_matrix['project_ids'][col],
+            'overall_score': float(match_matrix['overall_score'][row, col]),
+            'component_scores': {
+                'skill_match': float(match_matrix['skill_match'][row, col]),
+                'availability_match': float(match_matrix['availability_match'][row, col]),
+                'location_match': float(match_matrix['location_match'][row, col]),
+                'performance_factor': float(match_matrix['performance_factor'][row])
+            }
+        }
+    
+    def _rank_matches(self, match_matrix, top_n):
+        """
+        Select the top scoring pairs above the minimum match score
+        
+        Args:
+            match_matrix: Result of calculate_match_matrix
+            top_n: Number of top matches to return
+            
+        Returns:
+            List of match score dictionaries sorted by overall score
+        """
+        ranked = self._top_indices(match_matrix['overall_score'].ravel(), top_n)
+        n_cols = match_matrix['overall_score'].shape[1]
+        
+        return [self._build_match_result(match_matrix, *divmod(i, n_cols)) for i in ranked]
+    
+    def _rank_rows(self, match_matrix, top_n):
+        """
+        Select the top scoring projects of each volunteer row
+        
+        Args:
+            match_matrix: Result of calculate_match_matrix
+            top_n: Number of top matches to return per volunteer
+            
+        Returns:
+            Dictionary mapping volunteer id to its sorted match score dictionaries
+        """
+        return {
+            volunteer_id: [
+                self._build_match_result(match_matrix, row, col)
+                for col in self._top_indices(match_matrix['overall_score'][row], top_n)
+            ]
+            for row, volunteer_id in enumerate(match_matrix['volunteer_ids'])
+        }
+    
+    def _top_indices(self, scores, top_n):
         """
-        Calculate location proximity score
+        Indices of the top scores at or above the minimum match score
         
         Args:
-            volunteer_location: Volunteer location data
-            project_location: Project location data
+            scores: 1-D array of overall scores
+            top_n: Number of indices to return
             
         Returns:
-            Location match score between 0 and 1
+            Array of indices sorted by descending score
         """
-        # If either location is missing coordinates, fall back to postal code
-        if (not volunteer_location['latitude'] or not volunteer_location['longitude'] or
-            not project_location['latitude'] or not project_location['longitude']):
-            
-            # Simple postal code comparison (first 3 digits for proximity)
-            vol_postal = volunteer_location['postal_code'][:3] if volunteer_location['postal_code'] else ''
-            proj_postal = project_location['postal_code'][:3] if project_location['postal_code'] else ''
-            
-            if vol_postal and proj_postal and vol_postal == proj_postal:
-                return 1.0
-            elif vol_postal and proj_postal and vol_postal[:2] == proj_postal[:2]:
-                return 0.8
-            else:
-                return 0.4  # Default medium-distance score when we can't calculate precisely
-        
-        # Calculate Haversine distance between coordinates
-        lat1, lon1 = volunteer_location['latitude'], volunteer_location['longitude']
-        lat2, lon2 = project_location['latitude'], project_location['longitude']
-        
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        c = 2 * np.arcsin(np.sqrt(a))
-        r = 6371  # Radius of earth in kilometers
-        distance = c * r
-        
-        # Convert distance to score (inversely proportional)
-        # Assuming 50km is the max reasonable distance (score = 0.1)
-        # and 0km is perfect match (score = 1.0)
-        max_distance = 50
-        min_score = 0.1
-        
-        if distance >= max_distance:
-            return min_score
-        
-        # Linear interpolation between 1.0 and min_score
-        score = 1.0 - ((1.0 - min_score) * distance / max_distance)
-        return score
+        passing = np.flatnonzero(scores >= self.config['threshold']['min_match_score'])
+        if top_n <= 0:
+            return passing[:0]
+        
+        # Partition down to the cells tied with or above the top_n-th score
+        # so only those are sorted
+        if len(passing) > top_n:
+            passing_scores = scores[passing]
+            kth = len(passing) - top_n
+            passing = passing[passing_scores >= np.partition(passing_scores, kth)[kth]]
+        
+        # Stable sort keeps ties in roster order, like list.sort
+        return passing[np.argsort(-scores[passing], kind='stable')][:top_n]
     
-    def calculate_match_score(self, volunteer, project):
+    def volunteers_within(self, project, radius_km, volunteers=None):
         """
-        Calculate overall match score between volunteer and project
+        Find volunteers located within a radius of a project
         
         Args:
-            volunteer: Volunteer data
             project: Project data
+            radius_km: Search radius in kilometers
+            volunteers: Optional list of volunteer data (defaults to all active volunteers)
             
         Returns:
-            Match score dictionary with overall score and component scores
+            Dictionary of volunteer id to distance in kilometers
         """
-        # Extract features
-        volunteer_features = self._extract_volunteer_features(volunteer)
-        project_features = self._extract_project_features(project)
-        
-        # Calculate component scores
-        skill_score = self._calculate_skill_match(
-            volunteer_features, project_features
-        )
+        if volunteers is None:
+            volunteers = self.sf.get_active_volunteers()
         
-        availability_score = self._calculate_availability_match(
-            volunteer_features['availability'], project_features['schedule']
+        return self._volunteers_within(
+            self.volunteer_store.get_many(volunteers),
+            self.project_store.get(project),
+            radius_km
         )
+    
+    def _volunteers_within(self, volunteer_features, project_features, radius_km):
+        """
+        Radius query against the volunteer location index
         
-        location_score = self._calculate_location_match(
-            volunteer_features['location'], project_features['location']
-        )
-        
-        # Apply weights from configuration
-        weights = self.config['weights']
-        weighted_skill = skill_score * weights['skill_match']
-        weighted_availability = availability_score * weights['availability']
-        weighted_location = location_score * weights['location_proximity']
-        weighted_performance = volunteer_features['performance_score'] * weights['past_performance']
-        
-        # Calculate overall score
-        overall_score = (weighted_skill + weighted_availability + weighted_location) * weighted_performance
+        The index is rebuilt only when volunteer locations or the postal
+        centroid table change.
         
-        # Return detailed score breakdown
-        return {
-            'volunteer_id': volunteer['id'],
-            'project_id': project['id'],
-            'overall_score': overall_score,
-            'component_scores': {
-                'skill_match': skill_score,
-                'availability_match': availability_score,
-                'location_match': location_score,
-                'performance_factor': volunteer_features['performance_score']
-            }
-        }
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: Extracted project features
+            radius_km: Search radius in kilometers
+            
+        Returns:
+            Dictionary of volunteer id to distance in kilometers
+        """
+        records = [(f['id'], f['location']) for f in volunteer_features]
+        centroids = self.postal_centroids
+        if self.volunteer_locations is None or self.volunteer_locations.centroids is not centroids or \
+                self.volunteer_locations.signature != LocationIndex.signature_of(records):
+            self.volunteer_locations = LocationIndex(records, centroids)
+        
+        point = self.volunteer_locations.locate(project_features['location'])
+        if point is None:
+            self.logger.warning(f"Project {project_features['id']} has no usable location")
+            return {}
+        
+        return self.volunteer_locations.within(point, radius_km)
     
-    def find_matches_for_project(self, project_id, top_n=None):
+    def find_matches_for_project(self, project_id, top_n=None, radius_km=None):
         """
         Find best matching volunteers for a specific project
         
         Args:
             project_id: Project identifier
             top_n: Number of top matches to return (default from config)
+            radius_km: Optional radius; only volunteers located within it
+                (by coordinates or postal code centroid) are considered
             
         Returns:
             List of top volunteer matches with scores
@@ -474,19 +1969,28 @@ class MatchMakerAgent:
         
         # Get all active volunteers
         volunteers = self.sf.get_active_volunteers()
-        
-        # Calculate match scores for all volunteers
-        match_scores = []
-        for volunteer in volunteers:
-            score = self.calculate_match_score(volunteer, project)
-            if score['overall_score'] >= self.config['threshold']['min_match_score']:
-                match_scores.append(score)
-        
-        # Sort by overall score (descending)
-        match_scores.sort(key=lambda x: x['overall_score'], reverse=True)
+        volunteer_features = self.volunteer_store.get_many(volunteers)
+        project_features = self.project_store.get(project)
+        
+        # Restrict to volunteers near the project, keeping their distances for scoring
+        distances = None
+        if radius_km is not None:
+            nearby = self._volunteers_within(volunteer_features, project_features, radius_km)
+            volunteer_features = [f for f in volunteer_features if f['id'] in nearby]
+            distances = {(volunteer_id, project_id): km for volunteer_id, km in nearby.items()}
+        
+        # Only score volunteers that can reach the threshold
+        candidates = self._skill_candidates(
+            self.volunteer_index, volunteer_features, 'skills_text', 'skills_list',
+            project_features['required_skills_text'], project_features['required_skills_list'],
+            [f['performance_score'] for f in volunteer_features]
+        )
+        match_matrix = self._score_features(
+            candidates, [project_features], prune=True, top_n=top_n, distances=distances
+        )
         
         # Return top N matches
-        return match_scores[:top_n]
+        return self._rank_matches(match_matrix, top_n)
     
     def find_matches_for_volunteer(self, volunteer_id, top_n=None):
         """
@@ -510,19 +2014,454 @@ class MatchMakerAgent:
         
         # Get all active projects
         projects = self.sf.get_active_projects()
+        volunteer_features = self.volunteer_store.get(volunteer)
+        project_features = self.project_store.get_many(projects)
+        
+        # Only score projects that can reach the threshold
+        candidates = self._skill_candidates(
+            self.project_index, project_features, 'required_skills_text', 'required_skills_list',
+            volunteer_features['skills_text'], volunteer_features['skills_list'],
+            [volunteer_features['performance_score']] * len(project_features)
+        )
+        match_matrix = self._score_features([volunteer_features], candidates, prune=True, top_n=top_n)
+        
+        # Return top N matches
+        return self._rank_matches(match_matrix, top_n)
+    
+    def sweep_volunteer_matches(self, volunteer_ids=None, top_n=None, workers=None, shard_size=None):
+        """
+        Find the best projects for every active volunteer across a process pool
+        
+        Volunteers are split into shards scored in worker processes. The
+        fitted skill model, the extracted features and the project-side
+        matrices are built once here and shared with the workers by forking,
+        so each task only carries its sweep key and shard bounds.
+        Per-volunteer results are the same as find_matches_for_volunteer.
         
-        # Calculate match scores for all projects
-        match_scores = []
-        for project in projects:
-            score = self.calculate_match_score(volunteer, project)
-            if score['overall_score'] >= self.config['threshold']['min_match_score']:
-                match_scores.append(score)
+        Args:
+            volunteer_ids: Optional volunteer ids to restrict the sweep to
+            top_n: Number of top matches per volunteer (default from config)
+            workers: Number of worker processes (default from config);
+                1 runs the shards in this process
+            shard_size: Volunteers per shard (default from config)
+            
+        Yields:
+            Dictionary per shard, in completion order, with the shard number,
+            worker pid, volunteer count, matches per volunteer id and
+            elapsed seconds
+        """
+        sweep_config = self.config.get('sweep', {})
+        if top_n is None:
+            top_n = self.config['threshold']['top_n_recommendations']
+        if workers is None:
+            workers = sweep_config.get('workers') or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = sweep_config.get('shard_size', 500)
         
-        # Sort by overall score (descending)
-        match_scores.sort(key=lambda x: x['overall_score'], reverse=True)
+        self._check_skill_model()
         
-        # Return top N matches
-        return match_scores[:top_n]
+        volunteers = self.sf.get_active_volunteers()
+        if volunteer_ids is not None:
+            wanted = set(volunteer_ids)
+            volunteers = [v for v in volunteers if v['id'] in wanted]
+        
+        # Extract everything up front so the workers inherit it
+        volunteer_features = self.volunteer_store.get_many(volunteers)
+        project_features = self.project_store.get_many(self.sf.get_active_projects())
+        project_matrices = self._project_matrices(project_features)
+        
+        shards = [
+            (shard, start, min(start + shard_size, len(volunteer_features)))
+            for shard, start in enumerate(range(0, len(volunteer_features), shard_size))
+        ]
+        if not shards:
+            return
+        
+        with _sweep_lock:
+            key = next(_sweep_keys)
+            _sweep_contexts[key] = (self, volunteer_features, project_features, project_matrices, top_n)
+        try:
+            # Sharing by copy-on-write needs the fork start method
+            if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+                for shard in shards:
+                    yield _sweep_shard(key, *shard)
+                return
+            
+            pool = ProcessPoolExecutor(
+                max_workers=min(workers, len(shards)),
+                mp_context=multiprocessing.get_context('fork')
+            )
+            try:
+                futures = [pool.submit(_sweep_shard, key, *shard) for shard in shards]
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # Drop pending shards if the caller stops consuming early
+                pool.shutdown(cancel_futures=True)
+        finally:
+            with _sweep_lock:
+                del _sweep_contexts[key]
+    
+    def materialize_matches(self, top_n=None):
+        """
+        Score all active volunteers against all active projects and keep the results
+        
+        The overall score matrix and the top matches of every volunteer and
+        project are kept in match_cache, so on_volunteer_updated and
+        on_project_updated can refresh them without a full rescan. Cells
+        that cannot reach the minimum match score are stored as NaN.
+        
+        Args:
+            top_n: Number of top matches kept per volunteer and project
+                (default from config)
+            
+        Returns:
+            Dictionary with the number of volunteers, projects and passing pairs
+        """
+        if top_n is None:
+            top_n = self.config['threshold']['top_n_recommendations']
+        
+        volunteer_features = self.volunteer_store.get_many(self.sf.get_active_volunteers())
+        project_features = self.project_store.get_many(self.sf.get_active_projects())
+        
+        self.refresh_postal_centroids(volunteer_features, project_features)
+        
+        # Drop records that left the active rosters without an update event
+        self.volunteer_index.retain({f['id'] for f in volunteer_features})
+        self.project_index.retain({f['id'] for f in project_features})
+        
+        cache = {
+            'top_n': top_n,
+            'volunteer_features': list(volunteer_features),
+            'project_features': list(project_features),
+            'volunteer_rows': {f['id']: i for i, f in enumerate(volunteer_features)},
+            'project_cols': {f['id']: j for j, f in enumerate(project_features)},
+            'scores': np.full((len(volunteer_features), len(project_features)), np.nan),
+            'volunteer_matches': {f['id']: [] for f in volunteer_features},
+            'project_matches': {f['id']: [] for f in project_features}
+        }
+        
+        chunk_size = self.config.get('assignment', {}).get('chunk_size', 2000)
+        project_matrices = self._project_matrices(project_features)
+        for offset in range(0, len(volunteer_features), chunk_size):
+            match_matrix = self._score_features(
+                volunteer_features[offset:offset + chunk_size], project_features, prune=True,
+                project_matrices=project_matrices
+            )
+            self._store_scores(cache, match_matrix)
+            cache['volunteer_matches'].update(self._rank_rows(match_matrix, top_n))
+            
+            # Each chunk's best are candidates for the project's overall best
+            for col, project_id in enumerate(match_matrix['project_ids']):
+                cache['project_matches'][project_id].extend(
+                    self._build_match_result(match_matrix, row, col)
+                    for row in self._top_indices(match_matrix['overall_score'][:, col], top_n)
+                )
+        
+        # Chunks are in roster order, so a stable sort keeps ties in roster order
+        for project_id, matches in cache['project_matches'].items():
+            matches.sort(key=lambda x: x['overall_score'], reverse=True)
+            del matches[top_n:]
+        
+        self.match_cache = cache
+        
+        return {
+            'volunteers': len(volunteer_features),
+            'projects': len(project_features),
+            'passing_pairs': int(np.count_nonzero(
+                cache['scores'] >= self.config['threshold']['min_match_score']
+            ))
+        }
+    
+    def cached_matches_for_volunteer(self, volunteer_id):
+        """
+        Get the materialized top matches of a volunteer
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            
+        Returns:
+            List of match score dictionaries, or None if not materialized
+        """
+        if self.match_cache is None:
+            return None
+        return self.match_cache['volunteer_matches'].get(volunteer_id)
+    
+    def cached_matches_for_project(self, project_id):
+        """
+        Get the materialized top matches of a project
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            List of match score dictionaries, or None if not materialized
+        """
+        if self.match_cache is None:
+            return None
+        return self.match_cache['project_matches'].get(project_id)
+    
+    def on_volunteer_updated(self, volunteer_id):
+        """
+        Refresh cached features and match results after a volunteer changed
+        
+        Only the volunteer's row of the cached score matrix is rescored.
+        Project top matches are refreshed where the volunteer was ranked
+        before or can pass the threshold now. A volunteer that no longer
+        exists is dropped.
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            
+        Returns:
+            Dictionary with the volunteer id, whether it was removed and the
+            projects whose top matches changed
+        """
+        self.volunteer_store.invalidate(volunteer_id)
+        volunteer = self.sf.get_volunteer(volunteer_id)
+        features = self.volunteer_store.get(volunteer) if volunteer else None
+        if features is None:
+            self.volunteer_index.remove(volunteer_id)
+        else:
+            self.volunteer_index.update(volunteer_id, features['skills_text'], features['skills_list'], source=features)
+        
+        result = {'volunteer_id': volunteer_id, 'removed': features is None, 'changed_projects': []}
+        cache = self.match_cache
+        if cache is None:
+            return result
+        
+        row = cache['volunteer_rows'].get(volunteer_id)
+        if row is None:
+            if features is None:
+                return result
+            row = len(cache['volunteer_features'])
+            cache['volunteer_features'].append(None)
+            cache['volunteer_rows'][volunteer_id] = row
+            cache['scores'] = np.vstack([cache['scores'], np.full((1, cache['scores'].shape[1]), np.nan)])
+        
+        old_scores = cache['scores'][row].copy()
+        cache['scores'][row] = np.nan
+        cache['volunteer_features'][row] = features
+        
+        if features is None:
+            del cache['volunteer_rows'][volunteer_id]
+            self._set_cached_matches(cache, 'volunteer', volunteer_id, None)
+        else:
+            projects = [f for f in cache['project_features'] if f is not None]
+            candidates = self._skill_candidates(
+                self.project_index, projects, 'required_skills_text', 'required_skills_list',
+                features['skills_text'], features['skills_list'],
+                [features['performance_score']] * len(projects)
+            )
+            self._store_scores(cache, self._score_features([features], candidates, prune=True))
+            self._refresh_cached_matches(cache, 'volunteer', row, stale=True)
+        
+        # Projects that ranked the volunteer before or may rank it now
+        min_score = self.config['threshold']['min_match_score']
+        affected = np.flatnonzero((old_scores >= min_score) | (cache['scores'][row] >= min_score))
+        for col in affected:
+            if self._refresh_cached_matches(cache, 'project', col, stale=volunteer_id):
+                result['changed_projects'].append(cache['project_features'][col]['id'])
+        
+        return result
+    
+    def on_project_updated(self, project_id):
+        """
+        Refresh cached features and match results after a project changed
+        
+        Only the project's column of the cached score matrix is rescored.
+        Volunteer top matches are refreshed where the project was ranked
+        before or can pass the threshold now. A project that no longer
+        exists is dropped.
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            Dictionary with the project id, whether it was removed and the
+            volunteers whose top matches changed
+        """
+        self.project_store.invalidate(project_id)
+        project = self.sf.get_project(project_id)
+        features = self.project_store.get(project) if project else None
+        if features is None:
+            self.project_index.remove(project_id)
+        else:
+            self.project_index.update(
+                project_id, features['required_skills_text'], features['required_skills_list'], source=features
+            )
+        
+        result = {'project_id': project_id, 'removed': features is None, 'changed_volunteers': []}
+        cache = self.match_cache
+        if cache is None:
+            return result
+        
+        col = cache['project_cols'].get(project_id)
+        if col is None:
+            if features is None:
+                return result
+            col = len(cache['project_features'])
+            cache['project_features'].append(None)
+            cache['project_cols'][project_id] = col
+            cache['scores'] = np.hstack([cache['scores'], np.full((cache['scores'].shape[0], 1), np.nan)])
+        
+        old_scores = cache['scores'][:, col].copy()
+        cache['scores'][:, col] = np.nan
+        cache['project_features'][col] = features
+        
+        if features is None:
+            del cache['project_cols'][project_id]
+            self._set_cached_matches(cache, 'project', project_id, None)
+        else:
+            volunteers = [f for f in cache['volunteer_features'] if f is not None]
+            candidates = self._skill_candidates(
+                self.volunteer_index, volunteers, 'skills_text', 'skills_list',
+                features['required_skills_text'], features['required_skills_list'],
+                [f['performance_score'] for f in volunteers]
+            )
+            self._store_scores(cache, self._score_features(candidates, [features], prune=True))
+            self._refresh_cached_matches(cache, 'project', col, stale=True)
+        
+        # Volunteers that ranked the project before or may rank it now
+        min_score = self.config['threshold']['min_match_score']
+        affected = np.flatnonzero((old_scores >= min_score) | (cache['scores'][:, col] >= min_score))
+        for row in affected:
+            if self._refresh_cached_matches(cache, 'volunteer', row, stale=project_id):
+                result['changed_volunteers'].append(cache['volunteer_features'][row]['id'])
+        
+        return result
+    
+    def _store_scores(self, cache, match_matrix):
+        """
+        Write the overall scores of a match matrix into the cached score matrix
+        
+        Args:
+            cache: Materialized match cache
+            match_matrix: Result of calculate_match_matrix
+        """
+        rows = [cache['volunteer_rows'][v] for v in match_matrix['volunteer_ids']]
+        cols = [cache['project_cols'][p] for p in match_matrix['project_ids']]
+        cache['scores'][np.ix_(rows, cols)] = match_matrix['overall_score']
+    
+    def _refresh_cached_matches(self, cache, side, index, stale=None):
+        """
+        Rerank the cached top matches of one volunteer row or project column
+        
+        Match dictionaries already in the list are reused; only pairs that
+        enter the ranking, or are stale, are scored again.
+        
+        Args:
+            cache: Materialized match cache
+            side: 'volunteer' to rerank a row or 'project' to rerank a column
+            index: Row or column in the cached score matrix
+            stale: Id of the counterpart whose cached matches are outdated,
+                or True if all of them are
+            
+        Returns:
+            True if the top matches changed
+        """
+        if side == 'volunteer':
+            owner = cache['volunteer_features'][index]
+            scores = cache['scores'][index]
+            others = cache['project_features']
+            other_key = 'project_id'
+        else:
+            owner = cache['project_features'][index]
+            scores = cache['scores'][:, index]
+            others = cache['volunteer_features']
+            other_key = 'volunteer_id'
+        
+        known = {}
+        if stale is not True:
+            known = {
+                m[other_key]: m for m in cache[side + '_matches'].get(owner['id'], [])
+                if m[other_key] != stale
+            }
+        
+        ranked = [others[i] for i in self._top_indices(scores, cache['top_n'])]
+        missing = [f for f in ranked if f['id'] not in known]
+        if missing:
+            if side == 'volunteer':
+                match_matrix = self._score_features([owner], missing)
+                cells = [(0, k) for k in range(len(missing))]
+            else:
+                match_matrix = self._score_features(missing, [owner])
+                cells = [(k, 0) for k in range(len(missing))]
+            for f, cell in zip(missing, cells):
+                known[f['id']] = self._build_match_result(match_matrix, *cell)
+        
+        return self._set_cached_matches(cache, side, owner['id'], [known[f['id']] for f in ranked])
+    
+    def _set_cached_matches(self, cache, side, record_id, matches):
+        """
+        Store new top matches and notify subscribers if they changed
+        
+        Args:
+            cache: Materialized match cache
+            side: 'volunteer' or 'project'
+            record_id: Id of the volunteer or project
+            matches: New list of match dictionaries, or None to drop the record
+            
+        Returns:
+            True if the top matches changed
+        """
+        lists = cache[side + '_matches']
+        old = lists.get(record_id, [])
+        if matches is None:
+            lists.pop(record_id, None)
+            matches = []
+        else:
+            lists[record_id] = matches
+        
+        if old == matches:
+            return False
+        
+        self._publish({
+            'type': side + '_matches_changed',
+            side + '_id': record_id,
+            'matches': matches
+        })
+        return True
+    
+    def subscribe(self, callback):
+        """
+        Register a callback for match change notifications
+        
+        The callback receives a dictionary with 'type' ('volunteer_matches_changed'
+        or 'project_matches_changed'), the volunteer or project id and the
+        new top matches.
+        
+        Args:
+            callback: Callable taking one event dictionary
+            
+        Returns:
+            The callback, for use with unsubscribe
+        """
+        self.subscribers.append(callback)
+        return callback
+    
+    def unsubscribe(self, callback):
+        """
+        Remove a callback registered with subscribe
+        
+        Args:
+            callback: Previously registered callable
+        """
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+    
+    def _publish(self, event):
+        """
+        Deliver a match change notification to all subscribers
+        
+        Args:
+            event: Event dictionary
+        """
+        for callback in list(self.subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                self.logger.error(f"Match change subscriber failed: {str(e)}")
     
     def schedule_assignment(self, volunteer_id, project_id):
         """
@@ -575,6 +2514,271 @@ class MatchMakerAgent:
             "match_score": match_score
         }
     
+    def optimize_assignments(self, volunteers=None, projects=None, capacities=None, commit=False):
+        """
+        Assign volunteers to projects globally under project capacity
+        
+        Scores the full volunteer x project grid in chunks, keeps the best
+        candidate projects per volunteer and solves a minimum-cost bipartite
+        matching against one slot per open project position, maximizing the
+        total match score. When volunteers may take several projects
+        (config['assignment']['max_assignments_per_volunteer']), one
+        matching is solved per round against the remaining capacity and
+        hours. A project is only offered to a volunteer whose remaining
+        max_commitment_hours cover its min_commitment_hours.
+        
+        Args:
+            volunteers: Optional list of volunteer data (defaults to all active volunteers)
+            projects: Optional list of project data (defaults to all active projects)
+            capacities: Optional mapping of project id to open positions
+                (defaults to open positions in vf_ProjectRole__c)
+            commit: Create the planned assignments in Salesforce, in batches
+                of config['assignment']['bulk_batch_size']
+            
+        Returns:
+            Dictionary with the assignment plan, totals and stage timings
+        """
+        timings = {}
+        started = time.perf_counter()
+        
+        if volunteers is None:
+            volunteers = self.sf.get_active_volunteers()
+        if projects is None:
+            projects = self.sf.get_active_projects()
+        if capacities is None:
+            capacities = self._project_capacities([p['id'] for p in projects])
+        
+        volunteer_features = self.volunteer_store.get_many(volunteers)
+        project_features = self.project_store.get_many(projects)
+        timings['features'] = time.perf_counter() - started
+        
+        # Sparse candidate edges from the chunked score matrix
+        stage = time.perf_counter()
+        rows, cols, scores = self._candidate_edges(volunteer_features, project_features)
+        timings['scoring'] = time.perf_counter() - stage
+        
+        # Capacity- and hour-constrained matching
+        stage = time.perf_counter()
+        volunteer_hours = np.array([
+            f['max_commitment_hours'] if f['max_commitment_hours'] is not None else np.inf
+            for f in volunteer_features
+        ], dtype=float)
+        project_hours = np.array(
+            [f['min_commitment_hours'] or 0 for f in project_features], dtype=float
+        )
+        project_capacity = np.array(
+            [capacities.get(f['id'], 0) for f in project_features], dtype=np.int64
+        )
+        matched = self._solve_assignment(
+            rows, cols, scores, volunteer_hours, project_hours, project_capacity
+        )
+        timings['solve'] = time.perf_counter() - stage
+        
+        assignments = []
+        for edge in matched:
+            volunteer = volunteer_features[rows[edge]]
+            project = project_features[cols[edge]]
+            assignments.append({
+                "volunteer_id": volunteer['id'],
+                "project_id": project['id'],
+                "start_date": project['start_date'],
+                "end_date": project['end_date'],
+                "status": "Assigned",
+                "match_score": float(scores[edge])
+            })
+        
+        # Write the plan with batched inserts
+        if commit:
+            stage = time.perf_counter()
+            batch_size = self.config['assignment'].get('bulk_batch_size', 200)
+            for offset in range(0, len(assignments), batch_size):
+                batch = assignments[offset:offset + batch_size]
+                for assignment, assignment_id in zip(batch, self.sf.create_assignments(batch)):
+                    assignment['assignment_id'] = assignment_id
+            timings['commit'] = time.perf_counter() - stage
+        
+        timings['total'] = time.perf_counter() - started
+        assigned_volunteers = len({a['volunteer_id'] for a in assignments})
+        
+        return {
+            'total_assignments': len(assignments),
+            'assigned_volunteers': assigned_volunteers,
+            'unassigned_volunteers': len(volunteer_features) - assigned_volunteers,
+            'open_positions': int(project_capacity.sum()) - len(assignments),
+            'total_score': float(sum(a['match_score'] for a in assignments)),
+            'committed': commit,
+            'timings': timings,
+            'assignments': assignments
+        }
+    
+    def _project_capacities(self, project_ids):
+        """
+        Open positions per project from project roles
+        
+        Args:
+            project_ids: List of project identifiers
+            
+        Returns:
+            Dictionary of project id to open positions
+        """
+        capacities = dict.fromkeys(project_ids, 0)
+        for role in self.sf.get_project_roles(project_ids):
+            if role.get('project_id') in capacities:
+                open_positions = role.get('positions', 0) - role.get('positions_filled', 0)
+                capacities[role['project_id']] += max(open_positions, 0)
+        
+        return capacities
+    
+    def _candidate_edges(self, volunteer_features, project_features):
+        """
+        Score all pairs in volunteer chunks and keep the best projects per volunteer
+        
+        Args:
+            volunteer_features: List of extracted volunteer features
+            project_features: List of extracted project features
+            
+        Returns:
+            Tuple of (volunteer rows, project columns, scores) arrays for
+            pairs at or above the minimum match score
+        """
+        assignment_config = self.config.get('assignment', {})
+        top_k = assignment_config.get('candidates_per_volunteer', 10)
+        chunk_size = assignment_config.get('chunk_size', 2000)
+        min_score = self.config['threshold']['min_match_score']
+        
+        project_columns = {f['id']: j for j, f in enumerate(project_features)}
+        project_matrices = self._project_matrices(project_features)
+        all_rows, all_cols, all_scores = [], [], []
+        
+        for offset in range(0, len(volunteer_features), chunk_size):
+            chunk = volunteer_features[offset:offset + chunk_size]
+            match_matrix = self._score_features(
+                chunk, project_features, prune=True, project_matrices=project_matrices
+            )
+            scores = match_matrix['overall_score']
+            if not scores.size:
+                continue
+            
+            chunk_rows = {f['id']: offset + i for i, f in enumerate(chunk)}
+            rows = np.array([chunk_rows[v] for v in match_matrix['volunteer_ids']], dtype=np.int64)
+            cols = np.array([project_columns[p] for p in match_matrix['project_ids']], dtype=np.int64)
+            
+            # Keep the top_k passing projects of each volunteer
+            scores = np.where(scores >= min_score, scores, -np.inf)
+            if scores.shape[1] > top_k:
+                best = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+            else:
+                best = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            keep = np.isfinite(best_scores)
+            
+            all_rows.append(np.broadcast_to(rows[:, np.newaxis], best.shape)[keep])
+            all_cols.append(cols[best[keep]])
+            all_scores.append(best_scores[keep])
+        
+        if not all_rows:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        
+        return np.concatenate(all_rows), np.concatenate(all_cols), np.concatenate(all_scores)
+    
+    def _solve_assignment(self, rows, cols, scores, volunteer_hours, project_hours, capacity):
+        """
+        Choose candidate edges maximizing total score under the constraints
+        
+        Args:
+            rows: Volunteer index of each candidate edge
+            cols: Project index of each candidate edge
+            scores: Match score of each candidate edge
+            volunteer_hours: Hour limit per volunteer (inf for none)
+            project_hours: Hours required per project
+            capacity: Open positions per project
+            
+        Returns:
+            Array of selected edge indexes
+        """
+        max_assignments = self.config.get('assignment', {}).get('max_assignments_per_volunteer', 1)
+        remaining_capacity = capacity.copy()
+        remaining_hours = volunteer_hours.copy()
+        taken = np.zeros(len(rows), dtype=bool)
+        
+        for _ in range(max_assignments):
+            usable = np.flatnonzero(
+                ~taken & (remaining_capacity[cols] > 0) &
+                (project_hours[cols] <= remaining_hours[rows])
+            )
+            if not len(usable):
+                break
+            
+            matched = usable[self._max_weight_matching(
+                rows[usable], cols[usable], scores[usable], remaining_capacity
+            )]
+            if not len(matched):
+                break
+            
+            taken[matched] = True
+            np.subtract.at(remaining_capacity, cols[matched], 1)
+            np.subtract.at(remaining_hours, rows[matched], project_hours[cols[matched]])
+        
+        return np.flatnonzero(taken)
+    
+    def _max_weight_matching(self, rows, cols, scores, capacity):
+        """
+        Maximum-score matching of volunteers to project positions
+        
+        Each project is replicated into one slot per open position (capped
+        at its number of candidates) and every volunteer gets a private
+        "unassigned" slot, so a full matching of volunteers always exists.
+        Costs are offset so that taking any edge is never worse than
+        leaving the volunteer unassigned.
+        
+        Args:
+            rows: Volunteer index of each edge
+            cols: Project index of each edge
+            scores: Match score of each edge
+            capacity: Open positions per project
+            
+        Returns:
+            Array of matched edge indexes
+        """
+        volunteers, local_rows = np.unique(rows, return_inverse=True)
+        n_volunteers, n_projects = len(volunteers), len(capacity)
+        
+        # Slots per project: open positions, capped by candidate count
+        slots = np.minimum(capacity, np.bincount(cols, minlength=n_projects))
+        slot_start = np.concatenate([[0], np.cumsum(slots)])
+        n_slots = int(slot_start[-1])
+        
+        # Replicate every edge across the slots of its project
+        per_edge = slots[cols]
+        edge_of_entry = np.repeat(np.arange(len(rows)), per_edge)
+        slot_offset = np.arange(len(edge_of_entry)) - np.repeat(np.cumsum(per_edge) - per_edge, per_edge)
+        entry_cols = slot_start[cols[edge_of_entry]] + slot_offset
+        
+        offset = scores.max() + 1.0
+        matrix = sparse.csr_matrix(
+            (
+                np.concatenate([offset - scores[edge_of_entry], np.full(n_volunteers, offset)]),
+                (
+                    np.concatenate([local_rows[edge_of_entry], np.arange(n_volunteers)]),
+                    np.concatenate([entry_cols, n_slots + np.arange(n_volunteers)])
+                )
+            ),
+            shape=(n_volunteers, n_slots + n_volunteers)
+        )
+        
+        matched_rows, matched_cols = min_weight_full_bipartite_matching(matrix)
+        real = matched_cols < n_slots
+        matched_rows, matched_cols = matched_rows[real], matched_cols[real]
+        
+        # Map (volunteer, slot) back to the edge it came from
+        slot_project = np.repeat(np.arange(n_projects), slots)
+        edge_keys = local_rows * n_projects + cols
+        order = np.argsort(edge_keys)
+        positions = np.searchsorted(
+            edge_keys[order], matched_rows * n_projects + slot_project[matched_cols]
+        )
+        return order[positions]
+    
     def _send_assignment_notifications(self, volunteer, project, assignment_id):
         """
         Send notifications about a new assignment
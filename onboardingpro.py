@@ -1,11 +1,618 @@
 import networkx as nx
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import copy
+import heapq
 import json
 import logging
+import os
+import tempfile
+import threading
+import time
 import requests
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from lmsconnector import AsyncLMSConnector, HTTPLMSConnector
+
+
+def _expiration_ordinal(expiration_date):
+    """
+    Date ordinal of a certification expiration date
+    
+    Certifications are valid through their expiration day, so days until
+    expiration are whole calendar days between ordinals: 0 on the day
+    itself and negative once expired.
+    """
+    return date.fromisoformat(expiration_date[:10]).toordinal()
+
+class TrainingGraphIndex:
+    """
+    Compiled form of the training module graph
+    
+    Modules get integer positions in topological order, so ascending
+    positions put prerequisites first. Sets of modules are Python int
+    bitsets over those positions, and each module keeps the bitset of
+    all its transitive prerequisites. Reverse indexes map role ids and
+    skill categories to bitsets of modules.
+    """
+    
+    def __init__(self, graph):
+        """
+        Compile a training module graph
+        
+        Args:
+            graph: NetworkX DiGraph of training modules with prerequisite edges
+        """
+        try:
+            self.module_ids = list(nx.topological_sort(graph))
+            self.acyclic = True
+        except nx.NetworkXUnfeasible:
+            self.module_ids = list(graph.nodes)
+            self.acyclic = False
+        
+        self.positions = {module_id: i for i, module_id in enumerate(self.module_ids)}
+        self.attributes = [graph.nodes[module_id] for module_id in self.module_ids]
+        self.prerequisites = [list(graph.predecessors(module_id)) for module_id in self.module_ids]
+        self.prerequisite_masks = [self.mask(prereqs) for prereqs in self.prerequisites]
+        
+        # Reverse indexes: role -> required/optional modules, category -> modules
+        self.required_by_role = {}
+        self.optional_by_role = {}
+        self.by_category = {}
+        for position in range(len(self.module_ids)):
+            self.index_module(position)
+        
+        if self.acyclic:
+            # Prerequisites come first, so their closures are already built
+            self.ancestor_masks = []
+            for i, prereqs in enumerate(self.prerequisite_masks):
+                closure = prereqs
+                for j in self.bit_positions(prereqs):
+                    closure |= self.ancestor_masks[j]
+                self.ancestor_masks.append(closure)
+        else:
+            self.ancestor_masks = [
+                self.mask(nx.ancestors(graph, module_id)) for module_id in self.module_ids
+            ]
+    
+    def __len__(self):
+        return len(self.module_ids)
+    
+    def with_attributes(self, graph, module_id):
+        """
+        Copy of the index after a module's attributes changed
+        
+        The module's prerequisites must be unchanged, so positions and
+        closures are shared with this index; only the reverse indexes and
+        attribute list are copied.
+        
+        Args:
+            graph: Training graph holding the module's new attributes
+            module_id: Module identifier
+            
+        Returns:
+            New TrainingGraphIndex
+        """
+        position = self.positions[module_id]
+        index = copy.copy(self)
+        index.attributes = list(self.attributes)
+        index.required_by_role = dict(self.required_by_role)
+        index.optional_by_role = dict(self.optional_by_role)
+        index.by_category = dict(self.by_category)
+        
+        index.unindex_module(position)
+        index.attributes[position] = graph.nodes[module_id]
+        index.index_module(position)
+        return index
+    
+    def index_module(self, position):
+        """
+        Add a module to the reverse indexes
+        
+        Args:
+            position: Module position
+        """
+        bit = 1 << position
+        attrs = self.attributes[position]
+        for role_id in attrs.get('required_roles', []):
+            self.required_by_role[role_id] = self.required_by_role.get(role_id, 0) | bit
+        for role_id in attrs.get('optional_roles', []):
+            self.optional_by_role[role_id] = self.optional_by_role.get(role_id, 0) | bit
+        category = attrs.get('skill_category')
+        self.by_category[category] = self.by_category.get(category, 0) | bit
+    
+    def unindex_module(self, position):
+        """
+        Remove a module from the reverse indexes
+        
+        Must be called before the module's attributes change.
+        
+        Args:
+            position: Module position
+        """
+        bit = 1 << position
+        attrs = self.attributes[position]
+        for reverse_index, keys in (
+            (self.required_by_role, attrs.get('required_roles', [])),
+            (self.optional_by_role, attrs.get('optional_roles', [])),
+            (self.by_category, [attrs.get('skill_category')])
+        ):
+            for key in keys:
+                mask = reverse_index.get(key, 0) & ~bit
+                if mask:
+                    reverse_index[key] = mask
+                else:
+                    reverse_index.pop(key, None)
+    
+    def role_modules(self, role_id, required_skills, recommended_skills, known_skills):
+        """
+        Bitsets of the modules required and recommended for a role
+        
+        A module required for the role wins over optional for the role,
+        which wins over a required skill category, which wins over a
+        recommended one. Categories in known_skills are skipped.
+        
+        Args:
+            role_id: Role identifier
+            required_skills: Skill categories the role requires
+            recommended_skills: Skill categories the role recommends
+            known_skills: Skill categories the volunteer already has
+            
+        Returns:
+            Tuple of (required, recommended) int bitsets
+        """
+        known = set(known_skills)
+        
+        by_role = self.required_by_role.get(role_id, 0)
+        optional = self.optional_by_role.get(role_id, 0) & ~by_role
+        taken = by_role | optional
+        
+        by_skill = 0
+        for category in set(required_skills) - known:
+            by_skill |= self.by_category.get(category, 0)
+        by_skill &= ~taken
+        taken |= by_skill
+        
+        recommended = 0
+        for category in set(recommended_skills) - known:
+            recommended |= self.by_category.get(category, 0)
+        recommended &= ~taken
+        
+        return by_role | by_skill, optional | recommended
+    
+    def mask(self, module_ids):
+        """
+        Bitset of the given modules; unknown ids are ignored
+        
+        Args:
+            module_ids: Iterable of module identifiers
+            
+        Returns:
+            Int bitset over module positions
+        """
+        mask = 0
+        for module_id in module_ids:
+            position = self.positions.get(module_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+    
+    def bit_positions(self, mask):
+        """
+        Positions set in a bitset, ascending
+        
+        Args:
+            mask: Int bitset over module positions
+            
+        Returns:
+            List of positions
+        """
+        positions = []
+        while mask:
+            low = mask & -mask
+            positions.append(low.bit_length() - 1)
+            mask ^= low
+        return positions
+    
+    def ids(self, mask):
+        """
+        Module ids set in a bitset, in topological order
+        
+        Args:
+            mask: Int bitset over module positions
+            
+        Returns:
+            List of module identifiers
+        """
+        return [self.module_ids[i] for i in self.bit_positions(mask)]
+    
+    def closure(self, mask):
+        """
+        Bitset of the given modules and all their transitive prerequisites
+        
+        Args:
+            mask: Int bitset over module positions
+            
+        Returns:
+            Int bitset over module positions
+        """
+        closure = mask
+        for i in self.bit_positions(mask):
+            closure |= self.ancestor_masks[i]
+        return closure
+
+
+class TrainingGraphSnapshot:
+    """
+    A training graph with its compiled index and version number
+    
+    Snapshots are never modified once installed; changes build a new
+    snapshot that replaces the current one in a single assignment.
+    """
+    
+    __slots__ = ('graph', 'index', 'version', 'created_at')
+    
+    def __init__(self, graph, index, version, created_at=None):
+        self.graph = graph
+        self.index = index
+        self.version = version
+        self.created_at = created_at or datetime.now().isoformat()
+
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry
+    
+    Tracks hits, misses and evictions for monitoring.
+    """
+    
+    def __init__(self, maxsize):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key):
+        """
+        Get a cached value and mark it as recently used
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if full
+        
+        Args:
+            key: Cache key
+            value: Value to cache (not None)
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop all entries, keeping the counters"""
+        self.entries.clear()
+    
+    def stats(self):
+        """
+        Cache counters
+        
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class FollowUpQueue:
+    """
+    Queue of training follow-ups ordered by the date they become due
+    
+    A min-heap holds the distinct due dates, each with a bucket of the
+    follow-ups due that day, so popping a day's follow-ups costs one heap
+    operation however many there are. Each follow-up has a key
+    identifying the path, module, type and reminder offset. Keys already
+    sent or queued are never queued again, so queueing a path twice is
+    idempotent. Follow-ups are grouped (by learning path), so a changed
+    path's follow-ups can be discarded and queued again.
+    """
+    
+    def __init__(self, sent_keys=()):
+        """
+        Initialize the queue
+        
+        Args:
+            sent_keys: Keys of follow-ups that were already sent
+        """
+        self.heap = []
+        self.buckets = {}
+        self.queued = {}
+        self.groups = defaultdict(set)
+        self.sent = set(sent_keys)
+    
+    def __len__(self):
+        return len(self.queued)
+    
+    def push(self, due_ordinal, key, follow_up, group=None):
+        """
+        Queue a follow-up unless it was already queued or sent
+        
+        Args:
+            due_ordinal: Date ordinal the follow-up becomes due
+            key: Follow-up key
+            follow_up: Follow-up tuple
+            group: Optional group the follow-up belongs to
+            
+        Returns:
+            True if the follow-up was queued
+        """
+        if key in self.queued or key in self.sent:
+            return False
+        
+        bucket = self.buckets.get(due_ordinal)
+        if bucket is None:
+            bucket = self.buckets[due_ordinal] = []
+            heapq.heappush(self.heap, due_ordinal)
+        bucket.append((key, follow_up))
+        self.queued[key] = (due_ordinal, group)
+        self.groups[group].add(key)
+        return True
+    
+    def discard_group(self, group):
+        """
+        Remove every queued follow-up of a group
+        
+        Args:
+            group: Group identifier
+            
+        Returns:
+            Number of follow-ups removed
+        """
+        keys = self.groups.pop(group, set())
+        due_ordinals = {self.queued.pop(key)[0] for key in keys}
+        for due_ordinal in due_ordinals:
+            # Emptied buckets stay on the heap and pop as empty days
+            self.buckets[due_ordinal] = [item for item in self.buckets[due_ordinal] if item[0] not in keys]
+        return len(keys)
+    
+    def pop_due(self, today_ordinal):
+        """
+        Remove and return every follow-up due on or before a date
+        
+        Args:
+            today_ordinal: Date ordinal of the current day
+            
+        Returns:
+            List of (due_ordinal, key, follow_up) tuples in due order
+        """
+        due = []
+        while self.heap and self.heap[0] <= today_ordinal:
+            due_ordinal = heapq.heappop(self.heap)
+            for key, follow_up in self.buckets.pop(due_ordinal):
+                _, group = self.queued.pop(key)
+                self.groups[group].discard(key)
+                if not self.groups[group]:
+                    del self.groups[group]
+                due.append((due_ordinal, key, follow_up))
+        return due
+    
+    def mark_sent(self, key):
+        """
+        Record a follow-up as sent
+        
+        Args:
+            key: Follow-up key
+        """
+        self.sent.add(key)
+
+
+class CertificationExpiryIndex:
+    """
+    Volunteer certifications ordered by expiration date
+    
+    Keeps a sorted list of (expiration ordinal, volunteer id, certification
+    id) entries with a parallel list of ordinals, so all certifications
+    expiring in a date range are found with two bisections. Entries are
+    inserted and removed in place as certifications are earned, renewed
+    or revoked. Certifications without an expiration date are not indexed.
+    """
+    
+    def __init__(self, certifications=()):
+        """
+        Build the index
+        
+        Args:
+            certifications: Volunteer certification records, each with
+                volunteer_id, certification_id and expiration_date
+        """
+        # Duplicate records keep the last one seen
+        self.records = {}
+        for cert in certifications:
+            entry = self._entry(cert['volunteer_id'], cert)
+            if entry is not None:
+                self.records[entry[1:]] = (entry[0], cert)
+        
+        self.entries = sorted((ordinal, *key) for key, (ordinal, _) in self.records.items())
+        self.ordinals = [entry[0] for entry in self.entries]
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def _entry(self, volunteer_id, cert):
+        """
+        Index entry of a certification record, or None if it never expires
+        """
+        if not cert.get('expiration_date'):
+            return None
+        return (_expiration_ordinal(cert['expiration_date']), volunteer_id, cert['certification_id'])
+    
+    def update(self, volunteer_id, cert):
+        """
+        Add a certification or move it to its new expiration date
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            cert: Certification record
+        """
+        self.remove(volunteer_id, cert['certification_id'])
+        
+        entry = self._entry(volunteer_id, cert)
+        if entry is None:
+            return
+        
+        position = bisect_right(self.entries, entry)
+        self.entries.insert(position, entry)
+        self.ordinals.insert(position, entry[0])
+        self.records[entry[1:]] = (entry[0], cert)
+    
+    def remove(self, volunteer_id, certification_id):
+        """
+        Remove a certification from the index if present
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            certification_id: Certification identifier
+        """
+        indexed = self.records.pop((volunteer_id, certification_id), None)
+        if indexed is None:
+            return
+        
+        position = bisect_left(self.entries, (indexed[0], volunteer_id, certification_id))
+        del self.entries[position]
+        del self.ordinals[position]
+    
+    def expiring_between(self, start_ordinal, end_ordinal):
+        """
+        Certifications expiring within a date range, inclusive
+        
+        Args:
+            start_ordinal: First date ordinal of the range (None for unbounded)
+            end_ordinal: Last date ordinal of the range
+            
+        Returns:
+            List of (expiration ordinal, volunteer id, certification record)
+            in expiration order
+        """
+        lo = 0 if start_ordinal is None else bisect_left(self.ordinals, start_ordinal)
+        hi = bisect_right(self.ordinals, end_ordinal)
+        return [
+            (ordinal, volunteer_id, self.records[(volunteer_id, certification_id)][1])
+            for ordinal, volunteer_id, certification_id in self.entries[lo:hi]
+        ]
+
+
+class OnboardingDataContext:
+    """
+    Per-request cache of the Salesforce records an onboarding operation uses
+    
+    Each record is fetched at most once per context, including records
+    that were not found, and certifications are fetched in bulk by id.
+    """
+    
+    def __init__(self, sf_connection):
+        """
+        Initialize an empty context
+        
+        Args:
+            sf_connection: Salesforce API connection
+        """
+        self.sf = sf_connection
+        self.volunteers = {}
+        self.projects = {}
+        self.roles = {}
+        self.certifications = {}
+        self.volunteer_certifications = {}
+        self.learning_paths = {}
+    
+    def volunteer(self, volunteer_id):
+        """Volunteer record, or None if not found"""
+        if volunteer_id not in self.volunteers:
+            self.volunteers[volunteer_id] = self.sf.get_volunteer(volunteer_id)
+        return self.volunteers[volunteer_id]
+    
+    def project(self, project_id):
+        """Project record, or None if not found"""
+        if project_id not in self.projects:
+            self.projects[project_id] = self.sf.get_project(project_id)
+        return self.projects[project_id]
+    
+    def role(self, role_id):
+        """Role record, or None if not found"""
+        if role_id not in self.roles:
+            self.roles[role_id] = self.sf.get_role(role_id)
+        return self.roles[role_id]
+    
+    def certifications_by_id(self, certification_ids):
+        """
+        Certification records by id, fetching the missing ones in one request
+        
+        Args:
+            certification_ids: Iterable of certification identifiers
+            
+        Returns:
+            Dictionary of certification id to record, for the ids found
+        """
+        certification_ids = list(dict.fromkeys(certification_ids))
+        missing = [c for c in certification_ids if c not in self.certifications]
+        if missing:
+            self.certifications.update(dict.fromkeys(missing))
+            for cert in self.sf.get_certifications(missing):
+                self.certifications[cert['id']] = cert
+        
+        return {
+            c: self.certifications[c] for c in certification_ids
+            if self.certifications[c] is not None
+        }
+    
+    def volunteer_certification_ids(self, volunteer_id):
+        """Set of certification ids the volunteer holds"""
+        if volunteer_id not in self.volunteer_certifications:
+            self.volunteer_certifications[volunteer_id] = {
+                vc['certification_id'] for vc in self.sf.get_volunteer_certifications(volunteer_id)
+            }
+        return self.volunteer_certifications[volunteer_id]
+    
+    def volunteer_learning_paths(self, volunteer_id):
+        """Volunteer's learning paths, most recent first"""
+        if volunteer_id not in self.learning_paths:
+            self.learning_paths[volunteer_id] = self.sf.get_volunteer_learning_paths(volunteer_id)
+        return self.learning_paths[volunteer_id]
+
 
 class OnboardingProAgent:
     """
@@ -25,12 +632,41 @@ class OnboardingProAgent:
             config: Configuration dictionary for the agent
         """
         self.sf = sf_connection
-        self.lms = lms_connection
         self.config = config or self._default_config()
         self.logger = logging.getLogger('volunteerforce.onboardingpro')
         
-        # Initialize training module graph
-        self.training_graph = self._build_training_graph()
+        # LMS connector, built from the configuration when none is passed
+        lms_config = dict(self.config.get('lms', {}))
+        io_workers = lms_config.pop('io_workers', 4)
+        if lms_connection is None and lms_config.get('base_url'):
+            lms_connection = HTTPLMSConnector(**lms_config)
+        self.lms = lms_connection
+        self.lms_async = AsyncLMSConnector(self.lms) if self.lms is not None else None
+        
+        # Threads overlapping LMS requests with Salesforce calls
+        self.io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='onboarding-io')
+        
+        # Computed module sequences, keyed by role, relevant completions,
+        # relevant skills and training graph version
+        self.path_cache = LRUCache(self.config['training'].get('path_cache_size', 1024))
+        
+        # Initialize training module graph and its compiled index, from the
+        # on-disk snapshot when there is one
+        self.training_snapshot = None
+        self._training_lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
+        
+        # Org-wide follow-up queue, loaded on the first run
+        self.follow_up_queue = None
+        
+        # Certification expiry index, loaded on the first sweep and kept
+        # up to date by the certification hooks
+        self.certification_index = None
+        self.last_certification_sweep = None
+        
+        if not self._load_training_snapshot():
+            self.refresh_training_graph(validate=False)
     
     def _default_config(self):
         """Default configuration settings"""
@@ -39,7 +675,21 @@ class OnboardingProAgent:
                 'max_daily_hours': 2,
                 'min_module_completion': 0.85,
                 'reminder_days': [3, 1],  # Days before deadline to send reminders
-                'escalation_threshold': 7  # Days past deadline to escalate
+                'escalation_threshold': 7,  # Days past deadline to escalate
+                'path_cache_size': 1024,  # Learning path sequences kept in memory
+                'bulk_batch_size': 200  # Records per bulk Salesforce request
+            },
+            'training_graph': {
+                'snapshot_path': None,  # JSON snapshot loaded at startup and saved on refresh
+                'refresh_interval': 3600  # Seconds between background refreshes
+            },
+            'lms': {
+                'base_url': None,  # Builds an HTTPLMSConnector when no connection is passed
+                'timeout': 10,
+                'pool_size': 10,  # Pooled keep-alive connections to the LMS
+                'batch_size': 100,  # Ids per bulk LMS request
+                'cache_ttl': 300,  # Seconds module resources stay cached
+                'io_workers': 4  # Threads overlapping LMS and Salesforce calls
             },
             'certification': {
                 'auto_verify': ['basic_orientation', 'safety_guidelines'],
@@ -51,10 +701,28 @@ class OnboardingProAgent:
             }
         }
     
-    def _build_training_graph(self):
+    @property
+    def training_graph(self):
+        """Training module graph of the current snapshot"""
+        return self.training_snapshot.graph
+    
+    @property
+    def training_index(self):
+        """Compiled index of the current snapshot"""
+        return self.training_snapshot.index
+    
+    @property
+    def training_graph_version(self):
+        """Version of the current snapshot"""
+        return self.training_snapshot.version
+    
+    def _build_training_graph(self, modules=None):
         """
         Build a directed graph of training modules with prerequisites
         
+        Args:
+            modules: Optional training module records (fetched if not provided)
+            
         Returns:
             NetworkX DiGraph of training modules
         """
@@ -62,20 +730,12 @@ class OnboardingProAgent:
         G = nx.DiGraph()
         
         # Fetch training modules from Salesforce
-        modules = self.sf.get_training_modules()
+        if modules is None:
+            modules = self.sf.get_training_modules()
         
         # Add nodes for each module
         for module in modules:
-            G.add_node(
-                module['id'],
-                name=module['name'],
-                description=module['description'],
-                duration_minutes=module['duration_minutes'],
-                skill_category=module['skill_category'],
-                difficulty=module['difficulty'],
-                required_roles=module.get('required_roles', []),
-                optional_roles=module.get('optional_roles', [])
-            )
+            G.add_node(module['id'], **self._module_attributes(module))
         
         # Add edges for prerequisites
         for module in modules:
@@ -84,35 +744,429 @@ class OnboardingProAgent:
         
         return G
     
-    def generate_learning_path(self, volunteer_id, role_id):
+    def _validate_training_graph(self, graph):
+        """
+        Check a training graph for cycles and dangling prerequisites
+        
+        Args:
+            graph: NetworkX DiGraph of training modules
+            
+        Returns:
+            List of problem descriptions, empty if the graph is valid
+        """
+        problems = []
+        
+        try:
+            cycle = nx.find_cycle(graph)
+            problems.append(f"Prerequisite cycle: {' -> '.join(str(u) for u, v in cycle)}")
+        except nx.NetworkXNoCycle:
+            pass
+        
+        # Prerequisite ids without a module record only exist as edge ends
+        for node, attrs in graph.nodes(data=True):
+            if 'name' not in attrs:
+                dependents = ', '.join(str(m) for m in graph.successors(node))
+                problems.append(f"Unknown prerequisite {node} of {dependents}")
+        
+        return problems
+    
+    def refresh_training_graph(self, validate=True):
+        """
+        Fetch the training modules and swap in a new graph snapshot
+        
+        The new graph is built and compiled before the swap, so requests in
+        flight keep using the previous snapshot. Bumps the version, clears
+        cached learning paths and writes the on-disk snapshot if configured.
+        
+        Args:
+            validate: Reject graphs with cycles or dangling prerequisites,
+                keeping the current snapshot
+            
+        Returns:
+            Dictionary with whether the graph was swapped, its version and
+            any validation problems
+        """
+        graph = self._build_training_graph()
+        problems = self._validate_training_graph(graph)
+        
+        if problems and validate and self.training_snapshot is not None:
+            for problem in problems:
+                self.logger.error(f"Training graph refresh rejected: {problem}")
+            return {'swapped': False, 'version': self.training_graph_version, 'problems': problems}
+        
+        for problem in problems:
+            self.logger.warning(f"Training graph loaded with problem: {problem}")
+        
+        with self._training_lock:
+            snapshot = self._install_training_graph(graph)
+        self._save_training_snapshot(snapshot)
+        
+        return {'swapped': True, 'version': snapshot.version, 'problems': problems}
+    
+    def rebuild_training_graph(self):
+        """
+        Rebuild the training graph and its index from Salesforce
+        
+        Bumps the training graph version and clears cached learning paths.
+        """
+        self.refresh_training_graph(validate=False)
+    
+    def start_training_refresh(self, interval=None):
+        """
+        Refresh the training graph periodically in a background thread
+        
+        Args:
+            interval: Seconds between refreshes (default from config)
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
+        if interval is None:
+            interval = self.config.get('training_graph', {}).get('refresh_interval', 3600)
+        
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, args=(interval,),
+            name='training-graph-refresh', daemon=True
+        )
+        self._refresh_thread.start()
+    
+    def stop_training_refresh(self):
+        """Stop the background refresh thread"""
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+    
+    def close(self):
+        """
+        Stop background work and release the agent's threads and LMS connections
+        """
+        self.stop_training_refresh()
+        self.io_pool.shutdown(wait=True)
+        if self.lms_async is not None:
+            self.lms_async.close()
+        elif self.lms is not None:
+            self.lms.close()
+    
+    def _refresh_loop(self, interval):
+        """
+        Background refresh loop
+        
+        Args:
+            interval: Seconds between refreshes
+        """
+        while not self._refresh_stop.wait(interval):
+            try:
+                self.refresh_training_graph()
+            except Exception as e:
+                self.logger.error(f"Error refreshing training graph: {str(e)}")
+    
+    def _install_training_graph(self, graph, index=None, version=None, created_at=None):
+        """
+        Compile a graph if needed and make it the current snapshot
+        
+        Must be called with the training lock held.
+        
+        Args:
+            graph: NetworkX DiGraph of training modules
+            index: Optional compiled index for the graph
+            version: Optional version (default: current version + 1)
+            created_at: Optional creation timestamp (default: now)
+            
+        Returns:
+            The installed TrainingGraphSnapshot
+        """
+        if index is None:
+            index = TrainingGraphIndex(graph)
+            if not index.acyclic:
+                self.logger.error("Cycle detected in training module graph")
+        
+        if version is None:
+            version = self.training_graph_version + 1 if self.training_snapshot else 1
+        
+        snapshot = TrainingGraphSnapshot(graph, index, version, created_at)
+        self.training_snapshot = snapshot
+        self.path_cache.clear()
+        
+        return snapshot
+    
+    def _training_snapshot_path(self):
+        """Path of the on-disk training graph snapshot, or None"""
+        return self.config.get('training_graph', {}).get('snapshot_path')
+    
+    def _save_training_snapshot(self, snapshot):
+        """
+        Write a training graph snapshot to disk if a path is configured
+        
+        The file is written next to the target and renamed into place, so
+        readers never see a partial snapshot.
+        
+        Args:
+            snapshot: TrainingGraphSnapshot to write
+        """
+        path = self._training_snapshot_path()
+        if not path:
+            return
+        
+        graph = snapshot.graph
+        data = {
+            'version': snapshot.version,
+            'created_at': snapshot.created_at,
+            'modules': [
+                {'id': node, **attrs, 'prerequisites': list(graph.predecessors(node))}
+                for node, attrs in graph.nodes(data=True)
+                if 'name' in attrs
+            ]
+        }
+        
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError) as e:
+            self.logger.error(f"Error saving training graph snapshot: {str(e)}")
+    
+    def _load_training_snapshot(self):
+        """
+        Install the on-disk training graph snapshot if there is one
+        
+        Returns:
+            True if a snapshot was loaded
+        """
+        path = self._training_snapshot_path()
+        if not path or not os.path.exists(path):
+            return False
+        
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            graph = self._build_training_graph(data['modules'])
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Error loading training graph snapshot: {str(e)}")
+            return False
+        
+        with self._training_lock:
+            self._install_training_graph(graph, version=data['version'], created_at=data.get('created_at'))
+        
+        return True
+    
+    def _copy_training_graph(self, graph):
+        """
+        Copy a training graph, keeping each module's prerequisite order
+        
+        Args:
+            graph: NetworkX DiGraph of training modules
+            
+        Returns:
+            New DiGraph with copied node attributes
+        """
+        G = nx.DiGraph()
+        G.add_nodes_from((node, dict(attrs)) for node, attrs in graph.nodes(data=True))
+        G.add_edges_from((prereq_id, node) for node in graph for prereq_id in graph.predecessors(node))
+        return G
+    
+    def _module_attributes(self, module):
+        """
+        Node attributes of a training module record
+        
+        Args:
+            module: Training module record
+            
+        Returns:
+            Dictionary of node attributes
+        """
+        return {
+            'name': module['name'],
+            'description': module['description'],
+            'duration_minutes': module['duration_minutes'],
+            'skill_category': module['skill_category'],
+            'difficulty': module['difficulty'],
+            'required_roles': module.get('required_roles', []),
+            'optional_roles': module.get('optional_roles', [])
+        }
+    
+    def upsert_training_module(self, module):
+        """
+        Add a training module or apply changes to an existing one
+        
+        Changes are applied to a copy of the current graph and swapped in
+        as a new snapshot. Attribute-only changes reuse the compiled
+        closures and only update the reverse indexes; new modules and
+        prerequisite changes recompile the training index. The new
+        snapshot is written to disk if a snapshot path is configured.
+        
+        Args:
+            module: Training module record
+        """
+        module_id = module['id']
+        prerequisites = module.get('prerequisites', [])
+        
+        with self._training_lock:
+            index = self.training_index
+            graph = self._copy_training_graph(self.training_graph)
+            position = index.positions.get(module_id)
+            
+            if position is not None and set(index.prerequisites[position]) == set(prerequisites):
+                graph.nodes[module_id].update(self._module_attributes(module))
+                snapshot = self._install_training_graph(graph, index.with_attributes(graph, module_id))
+            else:
+                if module_id in graph:
+                    graph.remove_edges_from(list(graph.in_edges(module_id)))
+                graph.add_node(module_id, **self._module_attributes(module))
+                for prereq_id in prerequisites:
+                    graph.add_edge(prereq_id, module_id)
+                
+                snapshot = self._install_training_graph(graph)
+        self._save_training_snapshot(snapshot)
+    
+    def generate_learning_path(self, volunteer_id, role_id, context=None):
         """
         Generate a personalized learning path for a volunteer based on role
         
         Args:
             volunteer_id: Volunteer identifier
             role_id: Role identifier
+            context: Optional OnboardingDataContext with records already loaded
             
         Returns:
             Dictionary with learning path information
         """
+        if context is None:
+            context = OnboardingDataContext(self.sf)
+        
         # Get volunteer data
-        volunteer = self.sf.get_volunteer(volunteer_id)
+        volunteer = context.volunteer(volunteer_id)
         if not volunteer:
             self.logger.error(f"Volunteer {volunteer_id} not found")
             return {"error": "Volunteer not found"}
         
         # Get role data
-        role = self.sf.get_role(role_id)
+        role = context.role(role_id)
         if not role:
             self.logger.error(f"Role {role_id} not found")
             return {"error": "Role not found"}
         
         # Get volunteer's completed trainings
         completed_trainings = self.sf.get_volunteer_trainings(volunteer_id)
-        completed_module_ids = [
+        
+        path_info = self._build_learning_path(
+            volunteer_id, role_id, volunteer, role, completed_trainings, datetime.now()
+        )
+        
+        # Save learning path to Salesforce
+        path_id = self.sf.create_learning_path(path_info)
+        path_info['path_id'] = path_id
+        self.on_learning_path_changed(path_id, path_info)
+        
+        return path_info
+    
+    def generate_learning_paths(self, assignments):
+        """
+        Generate learning paths for a cohort of volunteers in bulk
+        
+        Volunteers, roles and trainings are fetched with bulk requests and
+        the paths are written with batched inserts. Volunteers with the same
+        relevant state share the computed module sequence and dates.
+        
+        Args:
+            assignments: Iterable of (volunteer_id, role_id) pairs
+            
+        Returns:
+            Dictionary with the created learning paths, errors for pairs that
+            could not be processed and per-stage timings in seconds
+        """
+        assignments = list(assignments)
+        batch_size = self.config['training'].get('bulk_batch_size', 200)
+        timings = {}
+        
+        # Fetch everything the cohort needs in bulk
+        started = time.perf_counter()
+        volunteer_ids = list(dict.fromkeys(volunteer_id for volunteer_id, _ in assignments))
+        role_ids = list(dict.fromkeys(role_id for _, role_id in assignments))
+        
+        volunteers = {}
+        trainings = defaultdict(list)
+        for offset in range(0, len(volunteer_ids), batch_size):
+            batch = volunteer_ids[offset:offset + batch_size]
+            volunteers.update((v['id'], v) for v in self.sf.get_volunteers(batch))
+            for training in self.sf.get_trainings_for_volunteers(batch):
+                trainings[training['volunteer_id']].append(training)
+        
+        roles = {}
+        for offset in range(0, len(role_ids), batch_size):
+            roles.update((r['id'], r) for r in self.sf.get_roles(role_ids[offset:offset + batch_size]))
+        timings['fetch'] = time.perf_counter() - started
+        
+        # Compute paths, sharing dated sequences across the cohort
+        started = time.perf_counter()
+        current_date = datetime.now()
+        dated_sequences = {}
+        paths = []
+        errors = []
+        
+        for volunteer_id, role_id in assignments:
+            if volunteer_id not in volunteers:
+                self.logger.error(f"Volunteer {volunteer_id} not found")
+                errors.append({'volunteer_id': volunteer_id, 'role_id': role_id, 'error': 'Volunteer not found'})
+                continue
+            if role_id not in roles:
+                self.logger.error(f"Role {role_id} not found")
+                errors.append({'volunteer_id': volunteer_id, 'role_id': role_id, 'error': 'Role not found'})
+                continue
+            
+            paths.append(self._build_learning_path(
+                volunteer_id, role_id, volunteers[volunteer_id], roles[role_id],
+                trainings[volunteer_id], current_date, dated_sequences
+            ))
+        timings['compute'] = time.perf_counter() - started
+        
+        # Save learning paths to Salesforce in batches
+        started = time.perf_counter()
+        for offset in range(0, len(paths), batch_size):
+            batch = paths[offset:offset + batch_size]
+            for path_info, path_id in zip(batch, self.sf.create_learning_paths(batch)):
+                path_info['path_id'] = path_id
+                self.on_learning_path_changed(path_id, path_info, current_date)
+        timings['write'] = time.perf_counter() - started
+        
+        return {
+            'total_requested': len(assignments),
+            'total_created': len(paths),
+            'errors': errors,
+            'timings': timings,
+            'paths': paths
+        }
+    
+    def _build_learning_path(self, volunteer_id, role_id, volunteer, role, completed_trainings,
+                             current_date, dated_sequences=None):
+        """
+        Build the learning path information for one volunteer and role
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            role_id: Role identifier
+            volunteer: Volunteer record
+            role: Role record
+            completed_trainings: Volunteer's training records
+            current_date: Date the path starts from
+            dated_sequences: Optional dictionary reusing dated module lists
+                between calls with the same current_date
+            
+        Returns:
+            Dictionary with learning path information (without path_id)
+        """
+        completed_module_ids = {
             t['module_id'] for t in completed_trainings 
             if t['status'] == 'Completed' and t['score'] >= self.config['training']['min_module_completion']
-        ]
+        }
         
         # Get role's required and recommended skills
         required_skills = role.get('required_skills', [])
@@ -121,104 +1175,135 @@ class OnboardingProAgent:
         # Get volunteer's existing skills
         volunteer_skills = volunteer.get('skills', [])
         
-        # Identify required modules based on role
-        required_modules = []
-        recommended_modules = []
-        
-        for node, attrs in self.training_graph.nodes(data=True):
-            # Skip modules already completed
-            if node in completed_module_ids:
-                continue
-            
-            # Check if module is required for the role
-            if role_id in attrs.get('required_roles', []):
-                required_modules.append(node)
-            elif role_id in attrs.get('optional_roles', []):
-                recommended_modules.append(node)
-            elif attrs.get('skill_category') in required_skills and attrs.get('skill_category') not in volunteer_skills:
-                required_modules.append(node)
-            elif attrs.get('skill_category') in recommended_skills and attrs.get('skill_category') not in volunteer_skills:
-                recommended_modules.append(node)
-        
-        # Find all prerequisites for required modules
-        all_required = set(required_modules)
-        for module in required_modules:
-            # Find all predecessors (prerequisites) using networkx
-            predecessors = list(nx.ancestors(self.training_graph, module))
-            # Add prerequisites to required modules if not already completed
-            for prereq in predecessors:
-                if prereq not in completed_module_ids:
-                    all_required.add(prereq)
-        
-        # Create a subgraph with required modules and their prerequisites
-        path_graph = self.training_graph.subgraph(all_required)
-        
-        # Topologically sort to get proper sequence with prerequisites first
-        try:
-            module_sequence = list(nx.topological_sort(path_graph))
-        except nx.NetworkXUnfeasible:
-            # Handle cycles in the graph (should not happen with proper data)
-            self.logger.error("Cycle detected in training module graph")
-            module_sequence = list(all_required)
-        
-        # Add recommended modules at the end if they don't have unmet prerequisites
-        for module in recommended_modules:
-            # Check if all prerequisites are either completed or in the required path
-            prereqs = list(self.training_graph.predecessors(module))
-            prereqs_satisfied = all(
-                prereq in completed_module_ids or prereq in all_required
-                for prereq in prereqs
-            )
-            
-            if prereqs_satisfied and module not in all_required:
-                module_sequence.append(module)
-        
-        # Create learning path with module details and estimated completion dates
-        learning_path = []
-        current_date = datetime.now()
-        accumulated_minutes = 0
+        # Module sequence, shared by volunteers with the same relevant state
+        sequence = self._module_sequence(
+            role_id, required_skills, recommended_skills, volunteer_skills, completed_module_ids
+        )
         
-        for module_id in module_sequence:
-            module_attrs = self.training_graph.nodes[module_id]
-            
-            # Calculate estimated completion date
-            duration_minutes = module_attrs.get('duration_minutes', 60)
-            accumulated_minutes += duration_minutes
+        dated = dated_sequences.get(id(sequence)) if dated_sequences is not None else None
+        if dated is not None and dated[0] is sequence:
+            _, learning_path, accumulated_minutes = dated
+            learning_path = [
+                {**module, 'prerequisites': list(module['prerequisites'])}
+                for module in learning_path
+            ]
+        else:
+            # Create learning path with module details and estimated completion dates
+            learning_path = []
+            accumulated_minutes = 0
             
-            # Assuming volunteers train up to max_daily_hours per day
-            days_needed = accumulated_minutes / (self.config['training']['max_daily_hours'] * 60)
-            estimated_completion = current_date + timedelta(days=int(days_needed))
+            for module in sequence['modules']:
+                # Calculate estimated completion date
+                accumulated_minutes += module['duration_minutes']
+                
+                # Assuming volunteers train up to max_daily_hours per day
+                days_needed = accumulated_minutes / (self.config['training']['max_daily_hours'] * 60)
+                estimated_completion = current_date + timedelta(days=int(days_needed))
+                
+                # Add module to learning path
+                learning_path.append({
+                    **module,
+                    'prerequisites': list(module['prerequisites']),
+                    'estimated_completion': estimated_completion.strftime('%Y-%m-%d')
+                })
             
-            # Add module to learning path
-            learning_path.append({
-                'module_id': module_id,
-                'name': module_attrs.get('name'),
-                'description': module_attrs.get('description'),
-                'duration_minutes': duration_minutes,
-                'skill_category': module_attrs.get('skill_category'),
-                'difficulty': module_attrs.get('difficulty'),
-                'prerequisites': list(self.training_graph.predecessors(module_id)),
-                'required': module_id in required_modules,
-                'estimated_completion': estimated_completion.strftime('%Y-%m-%d')
-            })
+            if dated_sequences is not None:
+                # Keep the sequence referenced so its id stays unique
+                dated_sequences[id(sequence)] = (
+                    sequence,
+                    [{**m, 'prerequisites': tuple(m['prerequisites'])} for m in learning_path],
+                    accumulated_minutes
+                )
         
         # Create overall learning path information
-        path_info = {
+        return {
             'volunteer_id': volunteer_id,
             'role_id': role_id,
             'created_date': current_date.strftime('%Y-%m-%d'),
             'total_modules': len(learning_path),
-            'required_modules': len(required_modules),
-            'recommended_modules': len(learning_path) - len(required_modules),
+            'required_modules': sequence['required_modules'],
+            'recommended_modules': len(learning_path) - sequence['required_modules'],
             'estimated_hours': accumulated_minutes / 60,
             'modules': learning_path
         }
+    
+    def _module_sequence(self, role_id, required_skills, recommended_skills, volunteer_skills,
+                         completed_module_ids):
+        """
+        Compute, or fetch from the path cache, the module sequence for a role
         
-        # Save learning path to Salesforce
-        path_id = self.sf.create_learning_path(path_info)
-        path_info['path_id'] = path_id
+        Only completed modules within the prerequisite closure of the role's
+        candidate modules, and volunteer skills the role asks for, can
+        change the sequence, so only those enter the cache key.
         
-        return path_info
+        Args:
+            role_id: Role identifier
+            required_skills: Skill categories the role requires
+            recommended_skills: Skill categories the role recommends
+            volunteer_skills: Volunteer's existing skills
+            completed_module_ids: Set of completed module ids
+            
+        Returns:
+            Dictionary with the module entries (without dates) and the number
+            of required modules; shared between callers, so not to be modified
+        """
+        # Read the snapshot once so a concurrent swap cannot mix versions
+        snapshot = self.training_snapshot
+        index = snapshot.index
+        required_mask, recommended_mask = index.role_modules(
+            role_id, required_skills, recommended_skills, volunteer_skills
+        )
+        relevant_mask = index.closure(required_mask | recommended_mask)
+        completed_mask = index.mask(completed_module_ids) & relevant_mask
+        role_skills = set(required_skills) | set(recommended_skills)
+        
+        key = (
+            role_id,
+            completed_mask,
+            (frozenset(required_skills), frozenset(recommended_skills),
+             frozenset(role_skills.intersection(volunteer_skills))),
+            snapshot.version
+        )
+        sequence = self.path_cache.get(key)
+        if sequence is not None:
+            return sequence
+        
+        # Skip modules already completed
+        required_mask &= ~completed_mask
+        
+        # Required modules plus all their prerequisites not already completed
+        all_required = index.closure(required_mask) & ~completed_mask
+        
+        # Positions follow a topological order, so prerequisites come first
+        positions = index.bit_positions(all_required)
+        
+        # Add recommended modules at the end if they don't have unmet prerequisites
+        satisfied = completed_mask | all_required
+        for position in index.bit_positions(recommended_mask & ~satisfied):
+            if not index.prerequisite_masks[position] & ~satisfied:
+                positions.append(position)
+        
+        modules = []
+        for position in positions:
+            module_attrs = index.attributes[position]
+            modules.append({
+                'module_id': index.module_ids[position],
+                'name': module_attrs.get('name'),
+                'description': module_attrs.get('description'),
+                'duration_minutes': module_attrs.get('duration_minutes', 60),
+                'skill_category': module_attrs.get('skill_category'),
+                'difficulty': module_attrs.get('difficulty'),
+                'prerequisites': tuple(index.prerequisites[position]),
+                'required': bool(required_mask >> position & 1)
+            })
+        
+        sequence = {
+            'modules': modules,
+            'required_modules': bin(required_mask).count('1')
+        }
+        self.path_cache.put(key, sequence)
+        
+        return sequence
     
     def track_training_progress(self, volunteer_id, path_id=None):
         """
@@ -231,6 +1316,11 @@ class OnboardingProAgent:
         Returns:
             Dictionary with training progress information
         """
+        # LMS progress is fetched while the Salesforce calls run
+        lms_progress = None
+        if self.lms is not None:
+            lms_progress = self.io_pool.submit(self.lms.get_volunteer_progress, volunteer_id)
+        
         # Get volunteer's learning path
         if path_id:
             path = self.sf.get_learning_path(path_id)
@@ -254,6 +1344,15 @@ class OnboardingProAgent:
             for t in completed_trainings
         }
         
+        # LMS records fill in modules Salesforce has no training record for;
+        # if the LMS fails, progress comes from Salesforce alone
+        lms_status = None
+        if lms_progress is not None:
+            try:
+                lms_status = {p['module_id']: p for p in lms_progress.result()}
+            except Exception as e:
+                self.logger.error(f"Error fetching LMS progress for {volunteer_id}: {str(e)}")
+        
         # Track progress for each module in the path
         modules_progress = []
         completed_count = 0
@@ -261,12 +1360,13 @@ class OnboardingProAgent:
         
         for module in path['modules']:
             module_id = module['module_id']
-            status = completion_status.get(module_id, {'status': 'Not Started', 'score': 0})
+            status = completion_status.get(module_id) or (lms_status or {}).get(module_id) or \
+                {'status': 'Not Started', 'score': 0}
             
             if status['status'] == 'Completed':
                 completed_count += 1
             
-            modules_progress.append({
+            module_progress = {
                 'module_id': module_id,
                 'name': module['name'],
                 'status': status['status'],
@@ -274,7 +1374,10 @@ class OnboardingProAgent:
                 'completion_date': status.get('completion_date'),
                 'required': module['required'],
                 'estimated_completion': module['estimated_completion']
-            })
+            }
+            if lms_status is not None:
+                module_progress['lms_progress'] = lms_status.get(module_id, {}).get('progress', 0)
+            modules_progress.append(module_progress)
         
         # Calculate overall progress
         progress_percentage = (completed_count / total_modules) * 100 if total_modules > 0 else 0
@@ -317,17 +1420,112 @@ class OnboardingProAgent:
         if not module:
             return {"error": "Module not found"}
         
+        # Resources are fetched while the volunteer is
+        resources = self.io_pool.submit(self._resources_for_modules, [module_id])
+        
         # Get volunteer data to personalize recommendations
         volunteer = self.sf.get_volunteer(volunteer_id)
         if not volunteer:
             return {"error": "Volunteer not found"}
         
+        return self._rank_resources(volunteer, resources.result().get(module_id, []))
+    
+    def recommend_resources_for_modules(self, volunteer_id, module_ids):
+        """
+        Recommend learning resources for several modules at once
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            module_ids: Training module identifiers
+            
+        Returns:
+            Dictionary of module id to list of recommended resources
+        """
+        # One bulk LMS request runs while the volunteer is fetched
+        resources = self.io_pool.submit(self._resources_for_modules, module_ids)
+        
+        volunteer = self.sf.get_volunteer(volunteer_id)
+        if not volunteer:
+            return {"error": "Volunteer not found"}
+        
+        resources = resources.result()
+        return {
+            module_id: self._rank_resources(volunteer, resources.get(module_id, []))
+            for module_id in module_ids
+        }
+    
+    async def recommend_resources_async(self, volunteer_id, module_id):
+        """
+        Recommend learning resources without blocking the event loop
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            module_id: Training module identifier
+            
+        Returns:
+            List of recommended resources
+        """
+        module = await asyncio.to_thread(self.sf.get_training_module, module_id)
+        if not module:
+            return {"error": "Module not found"}
+        
+        if self.lms_async is not None:
+            resources = self.lms_async.get_resources_for_modules([module_id])
+        else:
+            resources = asyncio.to_thread(self._resources_for_modules, [module_id])
+        
+        volunteer, resources = await asyncio.gather(
+            asyncio.to_thread(self.sf.get_volunteer, volunteer_id),
+            resources
+        )
+        if not volunteer:
+            return {"error": "Volunteer not found"}
+        
+        # Modules whose LMS request failed fall back to Salesforce
+        if module_id not in resources:
+            resources = await asyncio.to_thread(self._salesforce_resources, [module_id])
+        
+        return self._rank_resources(volunteer, resources.get(module_id, []))
+    
+    def _resources_for_modules(self, module_ids):
+        """
+        Learning resources by module, from the LMS when one is connected
+        
+        Modules whose LMS request failed fall back to Salesforce.
+        
+        Args:
+            module_ids: Training module identifiers
+            
+        Returns:
+            Dictionary of module id to list of resources
+        """
+        if self.lms is None:
+            return self._salesforce_resources(module_ids)
+        
+        resources = self.lms.get_resources_for_modules(module_ids)
+        failed = [module_id for module_id in module_ids if module_id not in resources]
+        if failed:
+            resources.update(self._salesforce_resources(failed))
+        return resources
+    
+    def _salesforce_resources(self, module_ids):
+        """Learning resources by module, from Salesforce"""
+        return {module_id: self.sf.get_module_resources(module_id) for module_id in module_ids}
+    
+    def _rank_resources(self, volunteer, resources):
+        """
+        Order resources by the volunteer's learning style
+        
+        Args:
+            volunteer: Volunteer record
+            resources: Resources for one module
+            
+        Returns:
+            Top 5 resources, style matches first
+        """
         # Get volunteer's learning style if available
         learning_style = volunteer.get('learning_preferences', {}).get('style', 'visual')
         
-        # Get resources for this module
-        resources = self.sf.get_module_resources(module_id)
-        
         # Filter and rank resources based on volunteer's learning style
         style_match_resources = [r for r in resources if r.get('learning_style') == learning_style]
         other_resources = [r for r in resources if r.get('learning_style') != learning_style]
@@ -388,17 +1586,7 @@ class OnboardingProAgent:
         
         # Create follow-up notifications in Salesforce
         for follow_up in follow_ups:
-            notification = {
-                'recipient_id': volunteer_id,
-                'recipient_type': 'volunteer',
-                'notification_type': follow_up['type'],
-                'subject': f"Training {follow_up['type'].capitalize()}: {follow_up['module_name']}",
-                'message': follow_up['message'],
-                'scheduled_date': follow_up['scheduled_date'],
-                'action_url': f"/volunteer/training/module/{follow_up['module_id']}",
-                'priority': 'high' if follow_up['type'] == 'escalation' else 'medium'
-            }
-            
+            notification = self._follow_up_notification(volunteer_id, follow_up)
             notification_id = self.sf.schedule_notification(notification)
             follow_up['notification_id'] = notification_id
         
@@ -411,6 +1599,291 @@ class OnboardingProAgent:
             'follow_ups': follow_ups
         }
     
+    def _follow_up_notification(self, volunteer_id, follow_up):
+        """
+        Build the notification for a follow-up
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            follow_up: Follow-up dictionary
+            
+        Returns:
+            Notification dictionary
+        """
+        return {
+            'recipient_id': volunteer_id,
+            'recipient_type': 'volunteer',
+            'notification_type': follow_up['type'],
+            'subject': f"Training {follow_up['type'].capitalize()}: {follow_up['module_name']}",
+            'message': follow_up['message'],
+            'scheduled_date': follow_up['scheduled_date'],
+            'action_url': f"/volunteer/training/module/{follow_up['module_id']}",
+            'priority': 'high' if follow_up['type'] == 'escalation' else 'medium'
+        }
+    
+    def load_follow_ups(self, now=None):
+        """
+        Build the org-wide follow-up queue from all active learning paths
+        
+        Every incomplete module gets one reminder per configured reminder
+        day, due that many days before its estimated completion, and one
+        escalation, due escalation_threshold days after it. Follow-ups
+        already sent (by key, from Salesforce) are not queued again. Of the
+        reminders already due, only the latest per module is queued, and
+        none once the deadline has passed, so reminders skipped by an
+        earlier run are not sent after a reload.
+        
+        This is the startup catch-up, and the only step that reads every
+        path and sent key; run_follow_ups calls it on its first run. The
+        queue is then kept across runs and updated through
+        on_learning_path_changed.
+        
+        Args:
+            now: Optional current datetime (defaults to now)
+            
+        Returns:
+            Number of follow-ups queued
+        """
+        if now is None:
+            now = datetime.now()
+        training_config = self.config['training']
+        batch_size = training_config.get('bulk_batch_size', 200)
+        today = now.date().toordinal()
+        
+        paths = self.sf.get_active_learning_paths()
+        volunteer_ids = list(dict.fromkeys(p['volunteer_id'] for p in paths))
+        queue = FollowUpQueue(self._sent_follow_up_keys(volunteer_ids, batch_size))
+        completed = self._completed_modules_by_volunteer(volunteer_ids, batch_size)
+        
+        for path in paths:
+            self._queue_path_follow_ups(queue, path, completed.get(path['volunteer_id'], ()), today)
+        
+        self.follow_up_queue = queue
+        
+        return len(queue)
+    
+    def on_learning_path_changed(self, path_id, path=None, now=None):
+        """
+        Update the follow-up queue for a learning path that was created or changed
+        
+        The path's queued follow-ups are replaced by ones for its current
+        modules and dates; follow-ups already sent are not queued again,
+        and a path that no longer exists is dropped. Completion is checked
+        when the follow-ups become due.
+        
+        Args:
+            path_id: Learning path identifier
+            path: Optional learning path record (fetched if not provided)
+            now: Optional current datetime (defaults to now)
+            
+        Returns:
+            True if the queue was updated, False when it is not loaded yet
+            (the first run loads the path with all the others)
+        """
+        if self.follow_up_queue is None:
+            return False
+        if now is None:
+            now = datetime.now()
+        
+        if path is None:
+            path = self.sf.get_learning_path(path_id)
+        
+        self.follow_up_queue.discard_group(path_id)
+        if path:
+            self._queue_path_follow_ups(self.follow_up_queue, {**path, 'path_id': path_id}, (),
+                                        now.date().toordinal())
+        return True
+    
+    def _queue_path_follow_ups(self, queue, path, done, today):
+        """
+        Queue the follow-ups of a learning path's incomplete modules
+        
+        Args:
+            queue: FollowUpQueue to add to
+            path: Learning path record
+            done: Completed module ids of the path's volunteer
+            today: Date ordinal of the current day
+        """
+        training_config = self.config['training']
+        volunteer_id = path['volunteer_id']
+        
+        for module in path['modules']:
+            if module['module_id'] in done:
+                continue
+            
+            deadline = date.fromisoformat(module['estimated_completion']).toordinal()
+            follow_up = (volunteer_id, path['path_id'], module['module_id'], module['name'], deadline)
+            
+            if deadline >= today:
+                # Reminders due before the latest one already due are superseded
+                latest_due = max(
+                    (deadline - days for days in training_config['reminder_days'] if deadline - days <= today),
+                    default=None
+                )
+                for reminder_days in training_config['reminder_days']:
+                    due_ordinal = deadline - reminder_days
+                    if latest_due is not None and due_ordinal < latest_due:
+                        continue
+                    key = f"{path['path_id']}:{module['module_id']}:reminder:{reminder_days}"
+                    queue.push(due_ordinal, key, ('reminder', reminder_days) + follow_up, path['path_id'])
+            
+            key = f"{path['path_id']}:{module['module_id']}:escalation"
+            queue.push(deadline + training_config['escalation_threshold'], key,
+                       ('escalation', None) + follow_up, path['path_id'])
+    
+    def run_follow_ups(self, now=None):
+        """
+        Send every follow-up that has become due across all volunteers
+        
+        Safe to run at any cadence: the queue is loaded from the active
+        learning paths on the first run and kept across runs, with paths
+        added through on_learning_path_changed as they are created or
+        changed. Follow-ups missed by earlier runs are caught up, and each
+        is sent at most once. When several reminders for a module are due
+        together only the latest is sent, and reminders whose deadline has
+        already passed are dropped in favor of the escalation. Modules
+        completed since the queue was loaded are skipped. Notifications are
+        scheduled in batches; if a batch fails, it and the remaining batches
+        are put back on the queue and the error is returned with the counts
+        of what was sent.
+        
+        Args:
+            now: Optional current datetime (defaults to now)
+            
+        Returns:
+            Dictionary with counts of sent and skipped follow-ups, the queue
+            size and per-stage timings in seconds
+        """
+        if now is None:
+            now = datetime.now()
+        training_config = self.config['training']
+        batch_size = training_config.get('bulk_batch_size', 200)
+        timings = {}
+        
+        started = time.perf_counter()
+        if self.follow_up_queue is None:
+            self.load_follow_ups(now)
+        queue = self.follow_up_queue
+        timings['load'] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        today = now.date().toordinal()
+        due = queue.pop_due(today)
+        
+        # Re-check completion for the volunteers with due follow-ups
+        volunteer_ids = list(dict.fromkeys(follow_up[2] for _, _, follow_up in due))
+        completed = self._completed_modules_by_volunteer(volunteer_ids, batch_size)
+        
+        # Latest reminder per module, in case a missed run left several due
+        latest_reminder = {}
+        for due_ordinal, key, follow_up in due:
+            kind, _, volunteer_id, path_id, module_id, _, _ = follow_up
+            if kind == 'reminder':
+                module_key = (path_id, module_id)
+                latest_reminder[module_key] = max(latest_reminder.get(module_key, due_ordinal), due_ordinal)
+        
+        skipped = {'completed': 0, 'superseded': 0}
+        pending = []
+        scheduled_dates = {
+            'reminder': (now + timedelta(days=1)).strftime('%Y-%m-%d'),
+            'escalation': now.strftime('%Y-%m-%d')
+        }
+        for due_ordinal, key, follow_up in due:
+            kind, reminder_days, volunteer_id, path_id, module_id, module_name, deadline = follow_up
+            
+            if module_id in completed.get(volunteer_id, ()):
+                skipped['completed'] += 1
+                queue.mark_sent(key)
+                continue
+            
+            if kind == 'reminder' and (due_ordinal < latest_reminder[(path_id, module_id)] or deadline < today):
+                skipped['superseded'] += 1
+                queue.mark_sent(key)
+                continue
+            
+            if kind == 'reminder':
+                message = f"Reminder: Your training module '{module_name}' is due in {deadline - today} days."
+            else:
+                message = f"Your training module '{module_name}' is {today - deadline} days overdue."
+            
+            notification = self._follow_up_notification(volunteer_id, {
+                'module_id': module_id,
+                'module_name': module_name,
+                'type': kind,
+                'scheduled_date': scheduled_dates[kind],
+                'message': message
+            })
+            notification['follow_up_key'] = key
+            pending.append((due_ordinal, key, follow_up, notification))
+        timings['select'] = time.perf_counter() - started
+        
+        # Schedule notifications in batches, marking each batch once accepted
+        started = time.perf_counter()
+        sent = []
+        error = None
+        for offset in range(0, len(pending), batch_size):
+            batch = pending[offset:offset + batch_size]
+            try:
+                self.sf.schedule_notifications([notification for _, _, _, notification in batch])
+            except Exception as e:
+                self.logger.error(f"Error scheduling follow-up notifications: {str(e)}")
+                error = str(e)
+                for due_ordinal, key, follow_up, _ in pending[offset:]:
+                    queue.push(due_ordinal, key, follow_up, follow_up[3])
+                break
+            for _, key, _, notification in batch:
+                queue.mark_sent(key)
+                sent.append(notification)
+        timings['notify'] = time.perf_counter() - started
+        
+        result = {
+            'run_date': now.strftime('%Y-%m-%d'),
+            'reminders': sum(1 for n in sent if n['notification_type'] == 'reminder'),
+            'escalations': sum(1 for n in sent if n['notification_type'] == 'escalation'),
+            'skipped_completed': skipped['completed'],
+            'skipped_superseded': skipped['superseded'],
+            'pending': len(queue),
+            'timings': timings
+        }
+        if error is not None:
+            result['error'] = error
+        
+        return result
+    
+    def _sent_follow_up_keys(self, volunteer_ids, batch_size):
+        """
+        Keys of follow-ups already sent to some volunteers, fetched in bulk
+        
+        Args:
+            volunteer_ids: List of volunteer identifiers
+            batch_size: Volunteers per request
+            
+        Returns:
+            Set of follow-up keys
+        """
+        sent_keys = set()
+        for offset in range(0, len(volunteer_ids), batch_size):
+            sent_keys.update(self.sf.get_follow_up_keys(volunteer_ids[offset:offset + batch_size]))
+        return sent_keys
+    
+    def _completed_modules_by_volunteer(self, volunteer_ids, batch_size):
+        """
+        Completed module ids per volunteer, fetched in bulk
+        
+        Args:
+            volunteer_ids: List of volunteer identifiers
+            batch_size: Volunteers per request
+            
+        Returns:
+            Dictionary of volunteer id to set of completed module ids
+        """
+        completed = defaultdict(set)
+        for offset in range(0, len(volunteer_ids), batch_size):
+            for training in self.sf.get_trainings_for_volunteers(volunteer_ids[offset:offset + batch_size]):
+                if training['status'] == 'Completed':
+                    completed[training['volunteer_id']].add(training['module_id'])
+        return completed
+    
     def verify_certifications(self, volunteer_id):
         """
         Verify volunteer certifications and identify expiring ones
@@ -425,7 +1898,7 @@ class OnboardingProAgent:
         certifications = self.sf.get_volunteer_certifications(volunteer_id)
         
         # Get current date
-        current_date = datetime.now()
+        today = datetime.now().date().toordinal()
         
         # Categorize certifications
         valid_certs = []
@@ -435,8 +1908,7 @@ class OnboardingProAgent:
         for cert in certifications:
             # Parse expiration date
             if cert.get('expiration_date'):
-                expiration = datetime.strptime(cert['expiration_date'], '%Y-%m-%d')
-                days_until_expiration = (expiration - current_date).days
+                days_until_expiration = _expiration_ordinal(cert['expiration_date']) - today
                 
                 if days_until_expiration < 0:
                     # Already expired
@@ -462,17 +1934,7 @@ class OnboardingProAgent:
         
         # Send notifications for expiring certifications
         for cert in expiring_certs:
-            notification = {
-                'recipient_id': volunteer_id,
-                'recipient_type': 'volunteer',
-                'notification_type': 'certification_expiring',
-                'subject': f"Certification Expiring: {cert['name']}",
-                'message': f"Your certification '{cert['name']}' will expire in {cert['days_until_expiration']} days. " +
-                           f"Please renew it to continue volunteering in roles requiring this certification.",
-                'action_url': f"/volunteer/certifications/{cert['certification_id']}/renew",
-                'priority': 'high' if cert['days_until_expiration'] <= 7 else 'medium'
-            }
-            
+            notification = self._certification_notification(volunteer_id, cert, cert['days_until_expiration'])
             self.sf.send_notification(notification)
         
         # Return certification status information
@@ -488,20 +1950,179 @@ class OnboardingProAgent:
             }
         }
     
-    def get_onboarding_checklist(self, volunteer_id, project_id):
+    def _certification_notification(self, volunteer_id, cert, days_until_expiration):
+        """
+        Build the notification for an expiring certification
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            cert: Certification record
+            days_until_expiration: Days left before the certification expires
+            
+        Returns:
+            Notification dictionary
+        """
+        return {
+            'recipient_id': volunteer_id,
+            'recipient_type': 'volunteer',
+            'notification_type': 'certification_expiring',
+            'subject': f"Certification Expiring: {cert['name']}",
+            'message': f"Your certification '{cert['name']}' will expire in {days_until_expiration} days. " +
+                       f"Please renew it to continue volunteering in roles requiring this certification.",
+            'action_url': f"/volunteer/certifications/{cert['certification_id']}/renew",
+            'priority': 'high' if days_until_expiration <= 7 else 'medium'
+        }
+    
+    def load_certification_index(self):
+        """
+        Build the certification expiry index from all volunteer certifications
+        
+        This is the startup catch-up, and the only step that reads every
+        certification; sweep_certifications calls it on its first sweep.
+        The index is then kept across sweeps and updated through
+        on_certification_updated and on_certification_removed.
+        
+        Returns:
+            Number of indexed certifications
+        """
+        self.certification_index = CertificationExpiryIndex(self.sf.get_all_volunteer_certifications())
+        return len(self.certification_index)
+    
+    def on_certification_updated(self, volunteer_id, cert):
+        """
+        Update the certification expiry index for an earned or renewed certification
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            cert: Volunteer certification record with certification_id, name
+                and expiration_date
+            
+        Returns:
+            True if the index was updated, False when it is not loaded yet
+            (the first sweep loads the certification with all the others)
+        """
+        if self.certification_index is None:
+            return False
+        
+        self.certification_index.update(volunteer_id, cert)
+        return True
+    
+    def on_certification_removed(self, volunteer_id, certification_id):
+        """
+        Remove a revoked or deleted certification from the expiry index
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            certification_id: Certification identifier
+            
+        Returns:
+            True if the index was updated, False when it is not loaded yet
+        """
+        if self.certification_index is None:
+            return False
+        
+        self.certification_index.remove(volunteer_id, certification_id)
+        return True
+    
+    def sweep_certifications(self, now=None):
+        """
+        Notify every volunteer whose certifications expire soon, org-wide
+        
+        The expiry index is loaded from Salesforce on the first sweep and
+        kept across sweeps, with certifications earned, renewed or revoked
+        since then applied through on_certification_updated and
+        on_certification_removed. Certifications expiring within
+        expiration_warning_days are range queries on the index, as are
+        those that expired since the previous sweep. Each certification
+        expiry is notified once across sweeps (by key, read back from
+        Salesforce for the volunteers concerned), and notifications are
+        sent in batches.
+        
+        Args:
+            now: Optional current datetime (defaults to now)
+            
+        Returns:
+            Dictionary with the expiring and newly expired certifications,
+            notification counts and per-stage timings in seconds
+        """
+        if now is None:
+            now = datetime.now()
+        batch_size = self.config['training'].get('bulk_batch_size', 200)
+        timings = {}
+        
+        started = time.perf_counter()
+        if self.certification_index is None:
+            self.load_certification_index()
+        index = self.certification_index
+        
+        today = now.date().toordinal()
+        warning_days = self.config['certification']['expiration_warning_days']
+        expiring_entries = index.expiring_between(today, today + warning_days)
+        
+        volunteer_ids = list(dict.fromkeys(volunteer_id for _, volunteer_id, _ in expiring_entries))
+        sent_keys = self._sent_follow_up_keys(volunteer_ids, batch_size)
+        timings['load'] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        expiring = []
+        notifications = []
+        for ordinal, volunteer_id, cert in expiring_entries:
+            days_until_expiration = ordinal - today
+            expiring.append({**cert, 'volunteer_id': volunteer_id, 'days_until_expiration': days_until_expiration})
+            
+            key = f"certification:{volunteer_id}:{cert['certification_id']}:{cert['expiration_date']}"
+            if key in sent_keys:
+                continue
+            sent_keys.add(key)
+            
+            notification = self._certification_notification(volunteer_id, cert, days_until_expiration)
+            notification['follow_up_key'] = key
+            notifications.append(notification)
+        
+        # Expired since the previous sweep (or ever, on the first one)
+        since = self.last_certification_sweep
+        expired = [
+            {**cert, 'volunteer_id': volunteer_id, 'days_expired': today - ordinal}
+            for ordinal, volunteer_id, cert in index.expiring_between(since, today - 1)
+        ]
+        timings['select'] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        for offset in range(0, len(notifications), batch_size):
+            self.sf.send_notifications(notifications[offset:offset + batch_size])
+        timings['notify'] = time.perf_counter() - started
+        
+        self.last_certification_sweep = today
+        
+        return {
+            'sweep_date': now.strftime('%Y-%m-%d'),
+            'expiring_certifications': len(expiring),
+            'expired_since_last_sweep': len(expired),
+            'notifications_sent': len(notifications),
+            'expiring': expiring,
+            'expired': expired,
+            'timings': timings
+        }
+    
+    def get_onboarding_checklist(self, volunteer_id, project_id, context=None):
         """
         Generate a personalized onboarding checklist for a volunteer-project assignment
         
         Args:
             volunteer_id: Volunteer identifier
             project_id: Project identifier
+            context: Optional OnboardingDataContext with records already loaded
             
         Returns:
             Dictionary with onboarding checklist items
         """
+        # Records are fetched once per request through the context
+        if context is None:
+            context = OnboardingDataContext(self.sf)
+        
         # Get data
-        volunteer = self.sf.get_volunteer(volunteer_id)
-        project = self.sf.get_project(project_id)
+        volunteer = context.volunteer(volunteer_id)
+        project = context.project(project_id)
         
         if not volunteer or not project:
             self.logger.error(f"Volunteer {volunteer_id} or Project {project_id} not found")
@@ -513,14 +2134,19 @@ class OnboardingProAgent:
             self.logger.error(f"No role defined for project {project_id}")
             return {"error": "Project role not defined"}
         
+        role = context.role(role_id)
+        if not role:
+            self.logger.error(f"Role {role_id} not found")
+            return {"error": "Role not found"}
+        
         # Generate learning path if not already created
-        paths = self.sf.get_volunteer_learning_paths(volunteer_id)
+        paths = context.volunteer_learning_paths(volunteer_id)
         matching_paths = [p for p in paths if p.get('role_id') == role_id]
         
         if matching_paths:
             path = matching_paths[0]
         else:
-            path = self.generate_learning_path(volunteer_id, role_id)
+            path = self.generate_learning_path(volunteer_id, role_id, context)
         
         # Create checklist with training modules
         checklist_items = []
@@ -553,19 +2179,19 @@ class OnboardingProAgent:
                 'estimated_minutes': module.get('duration_minutes', 60),
                 'required': module.get('required', True),
                 'link': f"/volunteer/training/module/{module['module_id']}",
-                'due_date': module.get('estimated_completion')
+                'due_date': module.get('estimated_completion'),
+                'module_id': module['module_id']
             })
         
-        # Add required certifications
-        role = self.sf.get_role(role_id)
+        # Add required certifications, fetched in one request
         required_certifications = role.get('required_certifications', [])
+        certifications = context.certifications_by_id(required_certifications)
         
         for cert_id in required_certifications:
-            cert = self.sf.get_certification(cert_id)
+            cert = certifications.get(cert_id)
             if cert:
                 # Check if volunteer already has this certification
-                volunteer_certs = self.sf.get_volunteer_certifications(volunteer_id)
-                has_cert = any(vc['certification_id'] == cert_id for vc in volunteer_certs)
+                has_cert = cert_id in context.volunteer_certification_ids(volunteer_id)
                 
                 if not has_cert:
                     checklist_items.append({
@@ -574,7 +2200,8 @@ class OnboardingProAgent:
                         'description': cert.get('description', ''),
                         'estimated_minutes': cert.get('estimated_time_minutes', 90),
                         'required': True,
-                        'link': f"/volunteer/certifications/{cert_id}"
+                        'link': f"/volunteer/certifications/{cert_id}",
+                        'certification_id': cert_id
                     })
         
         # Add equipment/resources items
@@ -596,6 +2223,8 @@ class OnboardingProAgent:
             'status': 'In Progress',
             'total_items': len(checklist_items),
             'completed_items': 0,
+            'required_items': sum(1 for item in checklist_items if item.get('required', True)),
+            'completed_required_items': 0,
             'items': checklist_items
         }
         
@@ -620,58 +2249,178 @@ class OnboardingProAgent:
         if not checklist:
             return {"error": "Checklist not found"}
         
+        today = datetime.now().strftime('%Y-%m-%d')
+        items = checklist['items']
+        
         # If no completed items provided, recalculate based on current data
         if completed_items is None:
-            # Get volunteer's completed trainings
             volunteer_id = checklist['volunteer_id']
-            completed_trainings = self.sf.get_volunteer_trainings(volunteer_id)
-            completed_module_ids = [
-                t['module_id'] for t in completed_trainings 
-                if t['status'] == 'Completed'
-            ]
-            
-            # Get volunteer's certifications
-            volunteer_certs = self.sf.get_volunteer_certifications(volunteer_id)
-            completed_cert_ids = [vc['certification_id'] for vc in volunteer_certs]
+            completions = self._completion_dates(
+                self.sf.get_volunteer_trainings(volunteer_id),
+                self.sf.get_volunteer_certifications(volunteer_id)
+            )
             
             # Update checklist items
-            for i, item in enumerate(checklist['items']):
-                if item['type'] == 'training' and 'module_id' in item:
-                    if item['module_id'] in completed_module_ids:
-                        item['completed'] = True
-                        item['completion_date'] = next(
-                            (t['completion_date'] for t in completed_trainings if t['module_id'] == item['module_id']),
-                            datetime.now().strftime('%Y-%m-%d')
-                        )
-                
-                elif item['type'] == 'certification' and 'certification_id' in item:
-                    if item['certification_id'] in completed_cert_ids:
-                        item['completed'] = True
-                        item['completion_date'] = next(
-                            (c['issue_date'] for c in volunteer_certs if c['certification_id'] == item['certification_id']),
-                            datetime.now().strftime('%Y-%m-%d')
-                        )
+            for item in items:
+                key = self._checklist_item_key(item)
+                if key in completions:
+                    item['completed'] = True
+                    item['completion_date'] = completions[key]
         else:
             # Update specified items
             for index in completed_items:
-                if 0 <= index < len(checklist['items']):
-                    checklist['items'][index]['completed'] = True
-                    checklist['items'][index]['completion_date'] = datetime.now().strftime('%Y-%m-%d')
+                if 0 <= index < len(items):
+                    items[index]['completed'] = True
+                    items[index]['completion_date'] = today
+        
+        self._count_checklist_progress(checklist)
+        
+        return self._save_checklist_progress(checklist, today)
+    
+    def apply_completion_events(self, checklist_id, trainings=None, certifications=None):
+        """
+        Apply newly completed trainings and certifications to a checklist
+        
+        Only the checklist items matching the events are updated, and the
+        progress counters are adjusted rather than recounted.
+        
+        Args:
+            checklist_id: Checklist identifier
+            trainings: Optional list of volunteer training records
+            certifications: Optional list of volunteer certification records
+            
+        Returns:
+            Updated checklist information
+        """
+        checklist = self.sf.get_onboarding_checklist(checklist_id)
+        if not checklist:
+            return {"error": "Checklist not found"}
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        completions = self._completion_dates(trainings or [], certifications or [])
+        
+        # Locate the affected items through the id index
+        item_index = self._checklist_item_index(checklist['items'])
+        dates = {}
+        for key, completion_date in completions.items():
+            for position in item_index.get(key, ()):
+                dates[position] = completion_date
+        
+        self._mark_checklist_items(checklist, list(dates), dates)
+        
+        return self._save_checklist_progress(checklist, today)
+    
+    def _checklist_item_key(self, item):
+        """Completion key of a checklist item, or None if it is not tracked"""
+        if item['type'] == 'training' and 'module_id' in item:
+            return ('training', item['module_id'])
+        if item['type'] == 'certification' and 'certification_id' in item:
+            return ('certification', item['certification_id'])
+        return None
+    
+    def _checklist_item_index(self, items):
+        """
+        Index checklist items by completion key
+        
+        Args:
+            items: Checklist items
+            
+        Returns:
+            Dictionary of completion key to item positions
+        """
+        index = defaultdict(list)
+        for position, item in enumerate(items):
+            key = self._checklist_item_key(item)
+            if key is not None:
+                index[key].append(position)
+        return index
+    
+    def _completion_dates(self, trainings, certifications):
+        """
+        Index completed trainings and held certifications by completion key
+        
+        The date of the first record for each module or certification is
+        used, and may be None.
+        
+        Args:
+            trainings: Volunteer training records
+            certifications: Volunteer certification records
+            
+        Returns:
+            Dictionary of completion key to completion date
+        """
+        first_dates = {}
+        completed = set()
+        for training in trainings:
+            key = ('training', training['module_id'])
+            first_dates.setdefault(key, training.get('completion_date'))
+            if training['status'] == 'Completed':
+                completed.add(key)
+        
+        completions = {key: first_dates[key] for key in completed}
+        for cert in certifications:
+            completions.setdefault(('certification', cert['certification_id']), cert.get('issue_date'))
+        
+        return completions
+    
+    def _count_checklist_progress(self, checklist):
+        """
+        Recount completed and required checklist items in one pass
+        
+        Args:
+            checklist: Checklist record, updated in place
+        """
+        completed_count = required_count = completed_required = 0
+        for item in checklist['items']:
+            completed = item.get('completed', False)
+            required = item.get('required', True)
+            completed_count += completed
+            required_count += required
+            completed_required += required and completed
         
-        # Update completion count
-        completed_count = sum(1 for item in checklist['items'] if item.get('completed', False))
         checklist['completed_items'] = completed_count
+        checklist['required_items'] = required_count
+        checklist['completed_required_items'] = completed_required
+    
+    def _mark_checklist_items(self, checklist, positions, dates):
+        """
+        Mark checklist items completed and adjust the progress counters
         
-        # Update status if all required items are completed
-        required_items = sum(1 for item in checklist['items'] if item.get('required', True))
-        completed_required = sum(
-            1 for item in checklist['items'] 
-            if item.get('required', True) and item.get('completed', False)
-        )
+        Args:
+            checklist: Checklist record
+            positions: Positions of the items to mark
+            dates: Dictionary of position to completion date
+        """
+        items = checklist['items']
+        
+        # Checklists saved before the counters existed are counted once
+        if 'required_items' not in checklist or 'completed_required_items' not in checklist:
+            self._count_checklist_progress(checklist)
+        
+        for position in positions:
+            item = items[position]
+            if not item.get('completed', False):
+                checklist['completed_items'] += 1
+                if item.get('required', True):
+                    checklist['completed_required_items'] += 1
+            item['completed'] = True
+            item['completion_date'] = dates[position]
+    
+    def _save_checklist_progress(self, checklist, today):
+        """
+        Update checklist status, save it and notify the manager on completion
         
-        if completed_required == required_items:
+        Args:
+            checklist: Checklist record with current progress counters
+            today: Current date as YYYY-MM-DD
+            
+        Returns:
+            Updated checklist information
+        """
+        # Update status if all required items are completed
+        if checklist['completed_required_items'] == checklist['required_items']:
             checklist['status'] = 'Completed'
-            checklist['completion_date'] = datetime.now().strftime('%Y-%m-%d')
+            checklist['completion_date'] = today
         
         # Update checklist in Salesforce
         self.sf.update_onboarding_checklist(checklist)
@@ -680,15 +2429,16 @@ class OnboardingProAgent:
         if checklist['status'] == 'Completed':
             project = self.sf.get_project(checklist['project_id'])
             if project and 'manager_id' in project:
+                volunteer_name = checklist.get('volunteer_name', checklist['volunteer_id'])
                 notification = {
                     'recipient_id': project['manager_id'],
                     'recipient_type': 'staff',
                     'notification_type': 'onboarding_completed',
-                    'subject': f"Onboarding Completed: {checklist['volunteer_name']}",
-                    'message': f"{checklist['volunteer_name']} has completed all required onboarding steps for {project['name']}.",
+                    'subject': f"Onboarding Completed: {volunteer_name}",
+                    'message': f"{volunteer_name} has completed all required onboarding steps for {project['name']}.",
                     'action_url': f"/staff/volunteers/{checklist['volunteer_id']}",
                     'priority': 'medium'
                 }
                 self.sf.send_notification(notification)
         
-        return checklist
\ No newline at end of file
+        return checklist
@@ -1,12 +1,643 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from bisect import insort
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import itertools
 import json
 import logging
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import joblib
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
 from nltk.sentiment import SentimentIntensityAnalyzer
 import nltk
-from collections import Counter
+from collections import Counter, OrderedDict, defaultdict
+import math
+
+# Columns of the engagement feature matrix, in _extract_engagement_features order
+ENGAGEMENT_FEATURES = [
+    'activity_frequency',
+    'days_since_last_activity',
+    'weekly_hours',
+    'hours_volatility',
+    'total_hours',
+    'projects_count',
+    'feedback_sentiment',
+    'satisfaction_trend'
+]
+
+# Relative model directories in the config are resolved against this root
+MODEL_ROOT = os.environ.get(
+    'VOLUNTEERFORCE_MODEL_ROOT',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')
+)
+
+# Model inputs, in the order predict_burnout_risk has always used
+MODEL_FEATURES = [
+    'activity_frequency',
+    'days_since_last_activity',
+    'weekly_hours',
+    'hours_volatility',
+    'feedback_sentiment',
+    'satisfaction_trend'
+]
+
+
+def _sequential_group_sums(codes, values, n_groups):
+    """
+    Per-group sums added left to right in record order
+    
+    Matches Python's sum() over each group bit for bit, where a
+    compensated or pairwise groupby sum can differ in the last place.
+    The loop runs once per position within a group, not once per group.
+    
+    Args:
+        codes: Integer group code of each value
+        values: Float values
+        n_groups: Number of groups
+        
+    Returns:
+        Array of per-group sums
+    """
+    sums = np.zeros(n_groups)
+    if len(codes) == 0:
+        return sums
+    
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    values = values[order]
+    counts = np.bincount(codes, minlength=n_groups)
+    ranks = np.arange(len(codes)) - (np.cumsum(counts) - counts)[codes]
+    
+    # Each rank holds at most one value per group
+    by_rank = np.argsort(ranks, kind='stable')
+    bounds = np.searchsorted(ranks[by_rank], np.arange(counts.max() + 1))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        block = by_rank[start:stop]
+        sums[codes[block]] += values[block]
+    
+    return sums
+
+
+def _equal_size_groups(codes, values):
+    """
+    Split values into blocks of equally sized groups
+    
+    Rows of each block keep record order, so NumPy row reductions give
+    the same results as reducing each group's values on its own.
+    
+    Args:
+        codes: Integer group code of each value
+        values: Float values
+        
+    Yields:
+        Tuples of (group codes, 2-D array with one row per group)
+    """
+    if len(codes) == 0:
+        return
+    
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    values = values[order]
+    groups, starts, counts = np.unique(codes, return_index=True, return_counts=True)
+    
+    for size in np.unique(counts):
+        selected = counts == size
+        rows = starts[selected][:, None] + np.arange(size)
+        yield groups[selected], values[rows]
+
+
+# Analyzer and comments of each running batch scorer, by batch key.
+# Registered in the parent before its pool forks so workers read them
+# copy-on-write; concurrent batches each use their own key.
+_sentiment_contexts = {}
+_sentiment_keys = itertools.count()
+_sentiment_lock = threading.Lock()
+
+
+def _score_comment_chunk(key, start, stop):
+    """
+    Compound sentiment scores for one chunk of a batch's comments
+    
+    Args:
+        key: Key of the batch in _sentiment_contexts
+        start: Index of the first comment of the chunk
+        stop: Index past the last comment of the chunk
+        
+    Returns:
+        List of compound scores
+    """
+    analyzer, comments = _sentiment_contexts[key]
+    return [analyzer.polarity_scores(text)['compound'] for text in comments[start:stop]]
+
+
+class SentimentCache:
+    """
+    Compound sentiment scores keyed by a hash of the comment text
+    
+    Feedback comments do not change after submission, so each distinct
+    text is scored once. The most recently used scores are kept in
+    memory and, when a path is given, all of them in a SQLite table that
+    survives restarts.
+    """
+    
+    def __init__(self, path=None, maxsize=100000):
+        """
+        Initialize the cache
+        
+        Args:
+            path: Optional SQLite database file backing the cache
+            maxsize: Maximum number of scores kept in memory
+        """
+        self.scores = OrderedDict()
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = None
+        
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment (text_hash TEXT PRIMARY KEY, compound REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def key(text):
+        """Cache key of a comment"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get_many(self, keys):
+        """
+        Look up scores, reading through to the database for memory misses
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Tuple of (dictionary of key to score, list of missing keys)
+        """
+        with self._lock:
+            found = {}
+            for k in keys:
+                if k in self.scores:
+                    self.scores.move_to_end(k)
+                    found[k] = self.scores[k]
+            missing = [k for k in dict.fromkeys(keys) if k not in found]
+            
+            if missing and self._db is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = self._db.execute(
+                        f"SELECT text_hash, compound FROM sentiment WHERE text_hash IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    self._remember(rows)
+                    found.update(rows)
+                missing = [k for k in missing if k not in found]
+            
+            # Every lookup of a missing key is a miss, repeated keys included
+            misses = sum(1 for k in keys if k not in found)
+            self.hits += len(keys) - misses
+            self.misses += misses
+            return found, missing
+    
+    def _remember(self, scores):
+        """Keep scores in memory, evicting the least recently used ones"""
+        for k, score in scores:
+            self.scores[k] = score
+            self.scores.move_to_end(k)
+        while len(self.scores) > self.maxsize:
+            self.scores.popitem(last=False)
+    
+    def put_many(self, scores):
+        """
+        Store scores in memory and in the database
+        
+        Args:
+            scores: Dictionary of key to compound score
+        """
+        with self._lock:
+            self._remember(scores.items())
+            if self._db is not None and scores:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sentiment (text_hash, compound) VALUES (?, ?)",
+                    scores.items()
+                )
+                self._db.commit()
+    
+    def stats(self):
+        """Cache size and hit statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.scores),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def close(self):
+        """Close the database connection"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class VolunteerEngagementWindow:
+    """
+    Rolling-window engagement state of one volunteer
+    
+    Activities and feedback are kept in buckets by day ordinal, so
+    expiring a day removes its whole bucket. Running totals, a Welford
+    mean and variance of daily hours, and regression sums for the
+    satisfaction trend are updated in O(1) per record.
+    """
+    
+    __slots__ = (
+        'activity_days', 'days', 'hours', 'activities', 'projects',
+        'day_count', 'day_mean', 'day_m2',
+        'feedback_days', 'feedback_order', 'feedback_count', 'sum_y', 'sum_xy',
+        'sentiment_sum', 'sentiment_count'
+    )
+    
+    def __init__(self):
+        """Initialize an empty window"""
+        # Day ordinal -> [hours, activity count, {project_id: count}]
+        self.activity_days = {}
+        self.days = []
+        self.hours = 0.0
+        self.activities = 0
+        self.projects = Counter()
+        self.day_count = 0
+        self.day_mean = 0.0
+        self.day_m2 = 0.0
+        
+        # Day ordinal -> list of [satisfaction, compound sentiment or None]
+        self.feedback_days = {}
+        self.feedback_order = []
+        self.feedback_count = 0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        self.sentiment_sum = 0.0
+        self.sentiment_count = 0
+    
+    def _add_day_hours(self, value):
+        self.day_count += 1
+        delta = value - self.day_mean
+        self.day_mean += delta / self.day_count
+        self.day_m2 += delta * (value - self.day_mean)
+    
+    def _remove_day_hours(self, value):
+        if self.day_count <= 1:
+            self.day_count = 0
+            self.day_mean = 0.0
+            self.day_m2 = 0.0
+            return
+        mean = (self.day_count * self.day_mean - value) / (self.day_count - 1)
+        self.day_m2 = max(self.day_m2 - (value - self.day_mean) * (value - mean), 0.0)
+        self.day_mean = mean
+        self.day_count -= 1
+        if self.day_count == 1:
+            self.day_m2 = 0.0
+    
+    def add_activity(self, day, hours, project_id):
+        """
+        Add one activity record
+        
+        Args:
+            day: Day ordinal of the activity
+            hours: Hours logged
+            project_id: Project identifier, may be None
+        """
+        bucket = self.activity_days.get(day)
+        if bucket is None:
+            bucket = self.activity_days[day] = [0.0, 0, Counter()]
+            insort(self.days, day)
+        else:
+            self._remove_day_hours(bucket[0])
+        
+        bucket[0] += hours
+        bucket[1] += 1
+        bucket[2][project_id] += 1
+        self._add_day_hours(bucket[0])
+        
+        self.hours += hours
+        self.activities += 1
+        self.projects[project_id] += 1
+    
+    def add_feedback(self, day, satisfaction, sentiment):
+        """
+        Add one feedback record
+        
+        Args:
+            day: Day ordinal of the feedback
+            satisfaction: Satisfaction score
+            sentiment: Compound sentiment of the comments, or None without comments
+        """
+        bucket = self.feedback_days.get(day)
+        in_order = not self.feedback_order or day >= self.feedback_order[-1]
+        if bucket is None:
+            bucket = self.feedback_days[day] = []
+            insort(self.feedback_order, day)
+        bucket.append([satisfaction, sentiment])
+        
+        if in_order:
+            # Appended at the end of the date order, so it takes the next x
+            self.sum_xy += self.feedback_count * satisfaction
+            self.sum_y += satisfaction
+            self.feedback_count += 1
+        else:
+            self._recount_feedback()
+        
+        if sentiment is not None:
+            self.sentiment_sum += sentiment
+            self.sentiment_count += 1
+    
+    def _recount_feedback(self):
+        """Recompute the regression sums after an out-of-order record"""
+        self.feedback_count = 0
+        self.sum_y = 0.0
+        self.sum_xy = 0.0
+        for day in self.feedback_order:
+            for satisfaction, _ in self.feedback_days[day]:
+                self.sum_xy += self.feedback_count * satisfaction
+                self.sum_y += satisfaction
+                self.feedback_count += 1
+    
+    def expire(self, horizon):
+        """
+        Drop the buckets of days before the window
+        
+        Args:
+            horizon: Day ordinal of the first day in the window
+        """
+        while self.days and self.days[0] < horizon:
+            hours, count, projects = self.activity_days.pop(self.days.pop(0))
+            self._remove_day_hours(hours)
+            self.hours -= hours
+            self.activities -= count
+            self.projects -= projects
+        
+        if not self.activities:
+            self.hours = 0.0
+        
+        while self.feedback_order and self.feedback_order[0] < horizon:
+            for satisfaction, sentiment in self.feedback_days.pop(self.feedback_order.pop(0)):
+                # The oldest record has x = 0 and every other x moves down by one
+                self.sum_y -= satisfaction
+                self.sum_xy -= self.sum_y
+                self.feedback_count -= 1
+                if sentiment is not None:
+                    self.sentiment_sum -= sentiment
+                    self.sentiment_count -= 1
+        
+        if not self.feedback_count:
+            self.sum_y = 0.0
+            self.sum_xy = 0.0
+        if not self.sentiment_count:
+            self.sentiment_sum = 0.0
+    
+    def is_empty(self):
+        """Whether the window holds no records"""
+        return not self.days and not self.feedback_order
+    
+    def features(self, today, days_back):
+        """
+        Engagement features over the window
+        
+        Args:
+            today: Day ordinal of the end of the window
+            days_back: Window length in days
+            
+        Returns:
+            Dictionary of engagement features
+        """
+        n = self.feedback_count
+        if n >= 2:
+            sum_x = n * (n - 1) / 2
+            sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+            satisfaction_trend = (n * self.sum_xy - sum_x * self.sum_y) / (n * sum_x2 - sum_x ** 2)
+        else:
+            satisfaction_trend = 0
+        
+        return {
+            'activity_frequency': self.activities / days_back,
+            'days_since_last_activity': today - self.days[-1] if self.days else days_back,
+            'weekly_hours': (self.hours / days_back) * 7,
+            'hours_volatility': math.sqrt(self.day_m2 / self.day_count) if self.day_count else 0,
+            'total_hours': self.hours,
+            'projects_count': len(self.projects),
+            'feedback_sentiment': self.sentiment_sum / self.sentiment_count if self.sentiment_count else 0,
+            'satisfaction_trend': satisfaction_trend
+        }
+    
+    def to_dict(self):
+        """JSON-serializable buckets of the window"""
+        return {
+            'activity_days': [
+                [day, hours, count, [[project_id, c] for project_id, c in projects.items()]]
+                for day, (hours, count, projects) in self.activity_days.items()
+            ],
+            'feedback_days': [[day, records] for day, records in self.feedback_days.items()]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a window and its running sums from saved buckets"""
+        window = cls()
+        for day, hours, count, projects in data['activity_days']:
+            window.activity_days[day] = [hours, count, Counter(dict((p, c) for p, c in projects))]
+            window.days.append(day)
+            window._add_day_hours(hours)
+            window.hours += hours
+            window.activities += count
+            for project_id, c in projects:
+                window.projects[project_id] += c
+        window.days.sort()
+        
+        for day, records in data['feedback_days']:
+            window.feedback_days[day] = records
+            window.feedback_order.append(day)
+            for _, sentiment in records:
+                if sentiment is not None:
+                    window.sentiment_sum += sentiment
+                    window.sentiment_count += 1
+        window.feedback_order.sort()
+        window._recount_feedback()
+        
+        return window
+
+
+class EngagementAggregator:
+    """
+    Streaming engagement features for all volunteers
+    
+    Consumes activity and feedback records as they are logged and keeps
+    one VolunteerEngagementWindow per volunteer. Windows are expired
+    lazily when they are read or written, so reading a volunteer's
+    features does not rescan their history.
+    """
+    
+    def __init__(self, days_back=90):
+        """
+        Initialize an empty aggregator
+        
+        Args:
+            days_back: Window length in days
+        """
+        self.days_back = days_back
+        self.windows = {}
+        self._lock = threading.Lock()
+    
+    def _horizon(self, now):
+        """Day ordinal of the first day in the window ending at now"""
+        return (now - timedelta(days=self.days_back)).date().toordinal()
+    
+    def add_activity(self, activity, now=None):
+        """Add an activity record to its volunteer's window"""
+        day = date.fromisoformat(activity['date'][:10]).toordinal()
+        with self._lock:
+            window = self.windows.get(activity['volunteer_id'])
+            if window is None:
+                window = self.windows[activity['volunteer_id']] = VolunteerEngagementWindow()
+            window.add_activity(day, activity.get('hours', 0), activity.get('project_id'))
+            window.expire(self._horizon(now or datetime.now()))
+    
+    def add_feedback(self, feedback, sentiment=None, now=None):
+        """
+        Add a feedback record to its volunteer's window
+        
+        Args:
+            feedback: Feedback record
+            sentiment: Compound sentiment of its comments, None if it has none
+            now: Optional current time
+        """
+        day = date.fromisoformat(feedback['date'][:10]).toordinal()
+        with self._lock:
+            window = self.windows.get(feedback['volunteer_id'])
+            if window is None:
+                window = self.windows[feedback['volunteer_id']] = VolunteerEngagementWindow()
+            window.add_feedback(day, float(feedback.get('satisfaction_score', 3)), sentiment)
+            window.expire(self._horizon(now or datetime.now()))
+    
+    def features(self, volunteer_id, now=None):
+        """
+        Engagement features of a volunteer for the window ending at now
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            now: Optional end of the window (defaults to now)
+            
+        Returns:
+            Dictionary of engagement features
+        """
+        now = now or datetime.now()
+        with self._lock:
+            window = self.windows.get(volunteer_id)
+            if window is None:
+                window = VolunteerEngagementWindow()
+            else:
+                window.expire(self._horizon(now))
+                if window.is_empty():
+                    del self.windows[volunteer_id]
+            
+            # Baseline days since last activity counts from the time of day, not midnight
+            features = window.features(now.date().toordinal(), self.days_back)
+            if window.days:
+                features['days_since_last_activity'] = (now - datetime.fromordinal(window.days[-1])).days
+            return features
+    
+    def feature_matrix(self, volunteer_ids, now=None):
+        """
+        Engagement features of several volunteers
+        
+        Args:
+            volunteer_ids: Volunteer identifiers
+            now: Optional end of the window (defaults to now)
+            
+        Returns:
+            DataFrame indexed by volunteer_id with ENGAGEMENT_FEATURES columns
+        """
+        now = now or datetime.now()
+        index = pd.Index(list(dict.fromkeys(volunteer_ids)), name='volunteer_id')
+        rows = [self.features(volunteer_id, now) for volunteer_id in index]
+        return pd.DataFrame(rows, index=index, columns=ENGAGEMENT_FEATURES)
+    
+    def drop_days_from(self, day):
+        """
+        Drop every bucket on or after a day, so its records can be replayed
+        
+        Args:
+            day: Day ordinal of the first day to drop
+        """
+        with self._lock:
+            for volunteer_id, window in list(self.windows.items()):
+                if (window.days and window.days[-1] >= day) or \
+                        (window.feedback_order and window.feedback_order[-1] >= day):
+                    data = window.to_dict()
+                    data['activity_days'] = [bucket for bucket in data['activity_days'] if bucket[0] < day]
+                    data['feedback_days'] = [bucket for bucket in data['feedback_days'] if bucket[0] < day]
+                    window = VolunteerEngagementWindow.from_dict(data)
+                    if window.is_empty():
+                        del self.windows[volunteer_id]
+                    else:
+                        self.windows[volunteer_id] = window
+    
+    def save(self, path):
+        """
+        Write all windows to a JSON snapshot, atomically
+        
+        Args:
+            path: Snapshot file path
+        """
+        with self._lock:
+            snapshot = {
+                'days_back': self.days_back,
+                'saved_at': datetime.now().isoformat(),
+                'windows': {v: w.to_dict() for v, w in self.windows.items()}
+            }
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Rebuild an aggregator from a JSON snapshot
+        
+        Args:
+            path: Snapshot file path
+            
+        Returns:
+            Tuple of (EngagementAggregator, saved_at ISO timestamp)
+        """
+        with open(path) as f:
+            snapshot = json.load(f)
+        
+        aggregator = cls(snapshot['days_back'])
+        aggregator.windows = {
+            v: VolunteerEngagementWindow.from_dict(data) for v, data in snapshot['windows'].items()
+        }
+        return aggregator, snapshot['saved_at']
+
 
 class RetentionGuardAgent:
     """
@@ -37,8 +668,20 @@ class RetentionGuardAgent:
         
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
         
-        # Initialize burnout prediction model
-        self.burnout_model = self._initialize_burnout_model()
+        # Scores of comments already analyzed, by text hash
+        sentiment_config = self.config.get('sentiment', {})
+        self.sentiment_cache = SentimentCache(
+            sentiment_config.get('cache_path'), sentiment_config.get('cache_size', 100000)
+        )
+        
+        # Initialize burnout prediction model from the latest trained artifact
+        self.burnout_model, self.burnout_model_version = self._initialize_burnout_model()
+        
+        # Streaming engagement features, set up by load_engagement_aggregates
+        # and loaded at startup when a snapshot path is configured
+        self.engagement_aggregates = None
+        if self.config.get('aggregates', {}).get('snapshot_path'):
+            self.load_engagement_aggregates()
     
     def _default_config(self):
         """Default configuration settings"""
@@ -66,42 +709,298 @@ class RetentionGuardAgent:
                     'medium': ['role_adjustment', 'schedule_check', 'feedback_session'],
                     'high': ['personal_outreach', 'break_suggestion', 'recognition_event']
                 }
+            },
+            'sentiment': {
+                'cache_path': None,  # SQLite file keeping comment scores across restarts
+                'cache_size': 100000,  # Comment scores kept in memory
+                'workers': None,  # Processes scoring new feedback, defaults to the CPU count
+                'chunk_size': 2000  # Comments per worker task
+            },
+            'scan': {
+                'bulk_batch_size': 200,  # Records per bulk Salesforce request
+                'alert_levels': ['high']  # Risk levels included in manager digests
+            },
+            'aggregates': {
+                'window_days': 90,  # Rolling window of the streaming engagement features
+                'snapshot_path': None  # JSON snapshot loaded at startup and caught up from Salesforce
+            },
+            'burnout_model': {
+                'model_dir': 'burnout_model',  # Versioned artifacts, relative to MODEL_ROOT; the latest is loaded at startup
+                'n_jobs': -1,  # Cores used when scoring in batch
+                'positive_levels': ['medium', 'high'],  # Assessed risk levels labeled as burnout risk
+                'history_days': 365,  # Days of past assessments used for training
+                'min_training_samples': 50
             }
         }
     
     def _initialize_burnout_model(self):
         """
-        Initialize the machine learning model for burnout prediction
+        Load the latest trained burnout model artifact
         
         Returns:
-            Scikit-learn model for burnout prediction
-        """
-        # In production, this would load a pre-trained model
-        # For demo purposes, we'll create a new model
-        model = RandomForestClassifier(
-            n_estimators=100,
-            max_depth=5,
-            random_state=42
+            Tuple of (scikit-learn model, version), or (None, None) when no
+            model has been trained yet and the rule-based score is used
+        """
+        path = self._latest_model_artifact()
+        if path is None:
+            return None, None
+        
+        try:
+            artifact = joblib.load(path)
+        except Exception as e:
+            self.logger.error(f"Failed to load burnout model {path}: {str(e)}")
+            return None, None
+        
+        if artifact.get('features') != MODEL_FEATURES:
+            self.logger.error(f"Burnout model {path} was trained on different features")
+            return None, None
+        
+        return artifact['model'], artifact['version']
+    
+    def _model_directory(self):
+        """Absolute directory holding burnout model artifacts, or None if unset"""
+        model_dir = self.config.get('burnout_model', {}).get('model_dir')
+        return os.path.join(MODEL_ROOT, model_dir) if model_dir else None
+    
+    def _latest_model_artifact(self):
+        """Path of the newest model artifact in the model directory, or None"""
+        model_dir = self._model_directory()
+        if not model_dir or not os.path.isdir(model_dir):
+            return None
+        
+        # Versions are timestamps, so names sort in training order
+        artifacts = sorted(
+            name for name in os.listdir(model_dir)
+            if name.startswith('burnout_model-') and name.endswith('.joblib')
         )
+        return os.path.join(model_dir, artifacts[-1]) if artifacts else None
+    
+    def build_burnout_training_set(self, since=None):
+        """
+        Build a labeled dataset from past burnout assessments
+        
+        Assessments that stored numeric engagement metrics use them as
+        they were at assessment time. The others get features extracted
+        for the window ending on their assessment date.
+        
+        Args:
+            since: Optional earliest assessment date (YYYY-MM-DD)
+            
+        Returns:
+            Tuple of (feature DataFrame with MODEL_FEATURES columns, label array)
+        """
+        model_config = self.config.get('burnout_model', {})
+        if since is None:
+            since = (datetime.now() - timedelta(days=model_config.get('history_days', 365))).strftime('%Y-%m-%d')
+        positive_levels = {level.lower() for level in model_config.get('positive_levels', ['medium', 'high'])}
+        
+        rows = []
+        labels = []
+        pending = {}
+        for assessment in self.sf.get_burnout_assessments(since):
+            level = (assessment.get('risk_level') or '').lower()
+            if not level:
+                continue
+            
+            metrics = assessment.get('engagement_metrics') or {}
+            if isinstance(metrics, str):
+                try:
+                    metrics = json.loads(metrics)
+                except ValueError:
+                    metrics = {}
+            
+            if all(isinstance(metrics.get(name), (int, float)) for name in MODEL_FEATURES):
+                rows.append([metrics[name] for name in MODEL_FEATURES])
+                labels.append(level in positive_levels)
+            else:
+                date = assessment['assessment_date'][:10]
+                pending.setdefault(date, []).append((assessment['volunteer_id'], level in positive_levels))
+        
+        # Recompute features for the rest, one batch per assessment date
+        for date, assessed in pending.items():
+            matrix = self.extract_engagement_feature_matrix(
+                [volunteer_id for volunteer_id, _ in assessed],
+                now=datetime.strptime(date, '%Y-%m-%d')
+            )
+            for volunteer_id, label in assessed:
+                rows.append(matrix.loc[volunteer_id, MODEL_FEATURES].to_numpy(dtype=float))
+                labels.append(label)
+        
+        X = pd.DataFrame(rows, columns=MODEL_FEATURES, dtype=float)
+        return X, np.array(labels, dtype=int)
+    
+    def train_burnout_model(self, since=None, save=True):
+        """
+        Train the burnout model on past assessments and install it
+        
+        Args:
+            since: Optional earliest assessment date (YYYY-MM-DD)
+            save: Whether to write the model as a new versioned artifact
+            
+        Returns:
+            Dictionary describing the trained model
+        """
+        model_config = self.config.get('burnout_model', {})
+        X, y = self.build_burnout_training_set(since)
+        
+        if len(y) < model_config.get('min_training_samples', 50) or len(set(y)) < 2:
+            self.logger.error(f"Not enough labeled assessments to train the burnout model ({len(y)})")
+            return {"error": "Not enough labeled assessments"}
+        
+        X = X.to_numpy()
+        
+        # Holdout score first, then fit on everything
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+        model = RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42)
+        model.fit(X_train, y_train)
+        holdout_auc = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+        
+        model = RandomForestClassifier(n_estimators=100, max_depth=5, random_state=42)
+        model.fit(X, y)
+        
+        # Microsecond timestamps; saving moves past any version already taken
+        version = datetime.now().strftime('%Y%m%d%H%M%S%f')
+        summary = {
+            'version': version,
+            'training_samples': len(y),
+            'positive_rate': float(y.mean()),
+            'holdout_auc': float(holdout_auc)
+        }
+        
+        if save:
+            summary['artifact_path'] = self._save_burnout_model(model, summary)
+        
+        self.burnout_model = model
+        self.burnout_model_version = summary['version']
+        
+        return summary
+    
+    def _save_burnout_model(self, model, summary):
+        """
+        Write a model artifact atomically into the model directory
+        
+        The artifact is written to a temporary file and linked into place,
+        which fails rather than overwrites if the version is taken. A taken
+        version is bumped to the next free one and summary['version'] is
+        updated to match.
+        
+        Args:
+            model: Fitted classifier
+            summary: Training summary including the version
+            
+        Returns:
+            Path of the artifact, or None when no model directory is configured
+        """
+        model_dir = self._model_directory()
+        if not model_dir:
+            self.logger.error("No model directory configured, burnout model not saved")
+            return None
+        
+        os.makedirs(model_dir, exist_ok=True)
+        version = summary['version']
+        while True:
+            path = os.path.join(model_dir, f"burnout_model-{version}.joblib")
+            if os.path.exists(path):
+                version = str(int(version) + 1)
+                continue
+            
+            artifact = {'model': model, 'features': MODEL_FEATURES, **summary, 'version': version}
+            
+            # Write then link, so a crash never leaves a partial artifact
+            fd, tmp_path = tempfile.mkstemp(dir=model_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    joblib.dump(artifact, f)
+                os.link(tmp_path, path)
+            except FileExistsError:
+                # Another training took the version meanwhile
+                version = str(int(version) + 1)
+                continue
+            finally:
+                os.unlink(tmp_path)
+            
+            summary['version'] = version
+            return path
+    
+    def score_burnout_risk(self, features):
+        """
+        Burnout risk probabilities for a whole feature matrix
+        
+        Uses the trained model's predict_proba across n_jobs cores, or the
+        rule-based score when no model is loaded.
+        
+        Args:
+            features: DataFrame with MODEL_FEATURES columns, one row per volunteer
+            
+        Returns:
+            Array of risk probabilities aligned with the rows
+        """
+        if len(features) == 0:
+            return np.zeros(0)
+        
+        if self.burnout_model is None:
+            return self._rule_based_risk(features)
+        
+        X = features[MODEL_FEATURES].to_numpy(dtype=float)
+        with joblib.parallel_config(n_jobs=self.config.get('burnout_model', {}).get('n_jobs', -1)):
+            return self.burnout_model.predict_proba(X)[:, 1]
+    
+    def _risk_factor_flags(self, features):
+        """
+        Which concerning signs the engagement features show
+        
+        Args:
+            features: Dictionary of engagement features, or a DataFrame of them
+            
+        Returns:
+            Dictionary of sign name to boolean, or to boolean Series for a DataFrame
+        """
+        engagement = self.config['engagement']
+        return {
+            'inactivity': features['days_since_last_activity'] > engagement['low_activity_threshold'],
+            'high_workload': features['weekly_hours'] > engagement['high_load_threshold'],
+            'negative_feedback': features['feedback_sentiment'] < engagement['feedback_threshold'],
+            'declining_satisfaction': features['satisfaction_trend'] < -0.1,
+            'volatile_hours': features['hours_volatility'] > 5  # High variability in hours
+        }
+    
+    def _rule_based_risk(self, features):
+        """
+        Rule-based risk probabilities, the fallback when no model is trained
         
-        # We would normally train this model here, but for demo we'll
-        # assume it's already trained when making predictions
+        Each concerning sign counts one risk factor, volatile hours half of
+        one, and four factors make a probability of 1.
         
-        return model
+        Args:
+            features: DataFrame of engagement features
+            
+        Returns:
+            Array of risk probabilities
+        """
+        flags = {name: np.asarray(flag, dtype=float) for name, flag in self._risk_factor_flags(features).items()}
+        risk_factors = (
+            flags['inactivity']
+            + flags['high_workload']
+            + flags['negative_feedback']
+            + flags['declining_satisfaction']
+            + 0.5 * flags['volatile_hours']
+        )
+        return np.minimum(risk_factors / 4, 1.0)
     
-    def _extract_engagement_features(self, volunteer_id, days_back=90):
+    def _extract_engagement_features(self, volunteer_id, days_back=90, now=None):
         """
         Extract engagement features for a volunteer
         
         Args:
             volunteer_id: Volunteer identifier
             days_back: Number of days of history to analyze
+            now: Optional end of the window (defaults to now)
             
         Returns:
             Dictionary of engagement features
         """
         # Calculate date range
-        end_date = datetime.now()
+        end_date = now or datetime.now()
         start_date = end_date - timedelta(days=days_back)
         
         # Get volunteer activity data
@@ -158,11 +1057,10 @@ class RetentionGuardAgent:
         # Calculate feedback metrics
         if feedback:
             # Analyze sentiment of feedback comments
-            sentiment_scores = []
-            for item in feedback:
-                if 'comments' in item and item['comments']:
-                    score = self.sentiment_analyzer.polarity_scores(item['comments'])
-                    sentiment_scores.append(score['compound'])
+            sentiment_scores = self._comment_sentiments([
+                item['comments'] for item in feedback
+                if 'comments' in item and item['comments']
+            ])
             
             # Average sentiment (-1 to 1 scale)
             avg_sentiment = np.mean(sentiment_scores) if sentiment_scores else 0
@@ -204,6 +1102,340 @@ class RetentionGuardAgent:
         
         return features
     
+    def _comment_sentiments(self, comments):
+        """
+        Compound sentiment scores of comments, analyzing only uncached texts
+        
+        Args:
+            comments: List of comment texts
+            
+        Returns:
+            List of compound scores in the same order
+        """
+        keys = [SentimentCache.key(text) for text in comments]
+        scores, missing = self.sentiment_cache.get_many(keys)
+        
+        if missing:
+            missing = set(missing)
+            new_scores = {}
+            for key, text in zip(keys, comments):
+                if key in missing and key not in new_scores:
+                    new_scores[key] = self.sentiment_analyzer.polarity_scores(text)['compound']
+            self.sentiment_cache.put_many(new_scores)
+            scores.update(new_scores)
+        
+        return [scores[key] for key in keys]
+    
+    def score_new_feedback(self, feedback=None, since=None, workers=None):
+        """
+        Score newly arrived feedback comments into the sentiment cache
+        
+        Only texts missing from the cache are analyzed, spread over a
+        process pool, so later risk assessments only do cache lookups.
+        
+        Args:
+            feedback: Optional feedback records (fetched from Salesforce if not provided)
+            since: Earliest feedback date to fetch (defaults to yesterday)
+            workers: Number of worker processes (default from config)
+            
+        Returns:
+            Dictionary with comment counts and timing
+        """
+        started = time.perf_counter()
+        sentiment_config = self.config.get('sentiment', {})
+        if workers is None:
+            workers = sentiment_config.get('workers') or os.cpu_count() or 1
+        chunk_size = sentiment_config.get('chunk_size', 2000)
+        
+        if feedback is None:
+            if since is None:
+                since = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+            feedback = self.sf.get_feedback(since)
+        
+        # Distinct comment texts not scored yet
+        texts = {}
+        for item in feedback:
+            if item.get('comments'):
+                texts.setdefault(SentimentCache.key(item['comments']), item['comments'])
+        _, missing = self.sentiment_cache.get_many(list(texts))
+        comments = [texts[key] for key in missing]
+        
+        chunks = [(start, min(start + chunk_size, len(comments))) for start in range(0, len(comments), chunk_size)]
+        workers = min(workers, len(chunks))
+        
+        with _sentiment_lock:
+            key = next(_sentiment_keys)
+            _sentiment_contexts[key] = (self.sentiment_analyzer, comments)
+        try:
+            # Sharing the analyzer by copy-on-write needs the fork start method
+            if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+                results = [_score_comment_chunk(key, *chunk) for chunk in chunks]
+            else:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+                    results = list(pool.map(_score_comment_chunk, itertools.repeat(key), *zip(*chunks)))
+        finally:
+            with _sentiment_lock:
+                del _sentiment_contexts[key]
+        
+        scores = [score for chunk in results for score in chunk]
+        self.sentiment_cache.put_many(dict(zip(missing, scores)))
+        
+        return {
+            'comments': sum(1 for item in feedback if item.get('comments')),
+            'distinct': len(texts),
+            'already_cached': len(texts) - len(comments),
+            'scored': len(comments),
+            'workers': max(workers, 1) if comments else 0,
+            'elapsed': time.perf_counter() - started
+        }
+    
+    def load_engagement_aggregates(self, now=None):
+        """
+        Set up streaming engagement features
+        
+        Restores the configured snapshot if there is one and replays the
+        records logged since the day it was saved, otherwise replays the
+        activities and feedback of the whole window in bulk. The snapshot's
+        buckets for the day it was saved are replaced by the replay, so
+        records logged that day are counted once.
+        
+        Args:
+            now: Optional end of the window (defaults to now)
+            
+        Returns:
+            Dictionary summarizing the loaded state
+        """
+        config = self.config.get('aggregates', {})
+        days_back = config.get('window_days', 90)
+        snapshot_path = config.get('snapshot_path')
+        started = time.perf_counter()
+        end_date = now or datetime.now()
+        start_date = end_date - timedelta(days=days_back)
+        
+        summary = {'source': 'replay'}
+        aggregator = None
+        if snapshot_path and os.path.exists(snapshot_path):
+            try:
+                aggregator, saved_at = EngagementAggregator.load(snapshot_path)
+                if aggregator.days_back == days_back:
+                    start_date = max(start_date, datetime.fromisoformat(saved_at))
+                    aggregator.drop_days_from(start_date.date().toordinal())
+                    summary = {'source': 'snapshot', 'saved_at': saved_at}
+                else:
+                    self.logger.warning(f"Ignoring engagement snapshot with a {aggregator.days_back}-day window")
+                    aggregator = None
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.error(f"Error loading engagement snapshot {snapshot_path}: {str(e)}")
+                aggregator = None
+        
+        if aggregator is None:
+            aggregator = EngagementAggregator(days_back)
+        
+        start = start_date.strftime('%Y-%m-%d')
+        end = end_date.strftime('%Y-%m-%d')
+        activities = self.sf.get_activities(start, end)
+        feedback = self.sf.get_feedback(start, end)
+        
+        for activity in activities:
+            aggregator.add_activity(activity, end_date)
+        
+        commented = [item for item in feedback if item.get('comments')]
+        sentiments = dict(zip(
+            map(id, commented),
+            self._comment_sentiments([item['comments'] for item in commented])
+        ))
+        for item in feedback:
+            aggregator.add_feedback(item, sentiments.get(id(item)), end_date)
+        
+        self.engagement_aggregates = aggregator
+        return {
+            **summary,
+            'activities': len(activities),
+            'feedback': len(feedback),
+            'volunteers': len(aggregator.windows),
+            'elapsed': time.perf_counter() - started
+        }
+    
+    def save_engagement_aggregates(self, path=None):
+        """
+        Snapshot the streaming engagement state to disk
+        
+        Args:
+            path: Optional snapshot path (defaults to the configured one)
+            
+        Returns:
+            Path written, or None if there is nothing to save
+        """
+        path = path or self.config.get('aggregates', {}).get('snapshot_path')
+        if self.engagement_aggregates is None or not path:
+            return None
+        
+        self.engagement_aggregates.save(path)
+        return path
+    
+    def on_activity_logged(self, activity):
+        """
+        Update the streaming features with a newly logged activity
+        
+        Args:
+            activity: Activity record with volunteer_id, date, hours and project_id
+            
+        Returns:
+            True if the streaming features were updated, False if they are not loaded
+        """
+        if self.engagement_aggregates is None:
+            return False
+        self.engagement_aggregates.add_activity(activity)
+        return True
+    
+    def on_feedback_submitted(self, feedback):
+        """
+        Update the streaming features with newly submitted feedback
+        
+        Args:
+            feedback: Feedback record with volunteer_id, date, satisfaction_score and comments
+            
+        Returns:
+            True if the streaming features were updated, False if they are not loaded
+        """
+        if self.engagement_aggregates is None:
+            return False
+        sentiment = self._comment_sentiments([feedback['comments']])[0] if feedback.get('comments') else None
+        self.engagement_aggregates.add_feedback(feedback, sentiment)
+        return True
+    
+    def engagement_features(self, volunteer_id, now=None):
+        """
+        Engagement features from the streaming state when loaded, else from Salesforce
+        
+        Args:
+            volunteer_id: Volunteer identifier
+            now: Optional end of the window (defaults to now)
+            
+        Returns:
+            Dictionary of engagement features
+        """
+        if self.engagement_aggregates is not None:
+            return self.engagement_aggregates.features(volunteer_id, now)
+        return self._extract_engagement_features(volunteer_id, now=now)
+    
+    def extract_engagement_feature_matrix(self, volunteer_ids=None, days_back=90, now=None):
+        """
+        Extract engagement features for many volunteers at once
+        
+        Activities and feedback for the whole window are fetched in one
+        request each and reduced with grouped array operations. Each row
+        holds the same numbers _extract_engagement_features returns for
+        that volunteer.
+        
+        Args:
+            volunteer_ids: Optional volunteer identifiers (defaults to all active volunteers)
+            days_back: Number of days of history to analyze
+            now: Optional end of the window (defaults to now)
+            
+        Returns:
+            DataFrame indexed by volunteer_id with ENGAGEMENT_FEATURES columns
+        """
+        # Calculate date range
+        end_date = now or datetime.now()
+        start_date = end_date - timedelta(days=days_back)
+        window = (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        
+        if volunteer_ids is None:
+            volunteer_ids = [v['id'] for v in self.sf.get_active_volunteers()]
+        index = pd.Index(list(dict.fromkeys(volunteer_ids)), name='volunteer_id')
+        n = len(index)
+        
+        # Columnar activity and feedback records for the window
+        activities = pd.DataFrame.from_records(
+            self.sf.get_activities(*window, volunteer_ids=list(index)),
+            columns=['volunteer_id', 'project_id', 'date', 'hours']
+        )
+        feedback = pd.DataFrame.from_records(
+            self.sf.get_feedback(*window, volunteer_ids=list(index)),
+            columns=['volunteer_id', 'date', 'satisfaction_score', 'comments']
+        )
+        activities = activities[activities['volunteer_id'].isin(index)]
+        feedback = feedback[feedback['volunteer_id'].isin(index)]
+        
+        # Defaults for volunteers without activities or feedback
+        features = pd.DataFrame({
+            'activity_frequency': np.zeros(n),
+            'days_since_last_activity': np.full(n, days_back, dtype=np.int64),
+            'weekly_hours': np.zeros(n),
+            'hours_volatility': np.zeros(n),
+            'total_hours': np.zeros(n),
+            'projects_count': np.zeros(n, dtype=np.int64),
+            'feedback_sentiment': np.zeros(n),
+            'satisfaction_trend': np.zeros(n)
+        }, index=index)
+        
+        # Activity metrics
+        if len(activities):
+            codes = index.get_indexer(activities['volunteer_id'])
+            hours = activities['hours'].fillna(0).to_numpy(dtype=float)
+            active = np.unique(codes)
+            
+            counts = np.bincount(codes, minlength=n)
+            hours_logged = _sequential_group_sums(codes, hours, n)
+            features.iloc[active, features.columns.get_loc('activity_frequency')] = counts[active] / days_back
+            features.iloc[active, features.columns.get_loc('total_hours')] = hours_logged[active]
+            features.iloc[active, features.columns.get_loc('weekly_hours')] = (hours_logged[active] / days_back) * 7
+            
+            # Project ids may be missing, which counts as one more project
+            projects = activities.groupby(codes)['project_id'].nunique(dropna=False)
+            features.iloc[projects.index, features.columns.get_loc('projects_count')] = projects.to_numpy()
+            
+            # Days since last activity, from the latest activity date
+            dates = pd.to_datetime(activities['date'], format='%Y-%m-%d')
+            last_dates = dates.groupby(codes).max()
+            days_since = (pd.Timestamp(end_date) - last_dates).dt.days
+            features.iloc[days_since.index, features.columns.get_loc('days_since_last_activity')] = days_since.to_numpy()
+            
+            # Volatility of daily hours, days in order of first appearance
+            day_numbers = dates.to_numpy(dtype='datetime64[D]').astype(np.int64)
+            day_keys = codes.astype(np.int64) * (day_numbers.max() - day_numbers.min() + 1) + (day_numbers - day_numbers.min())
+            day_codes, days = pd.factorize(day_keys)
+            daily_hours = _sequential_group_sums(day_codes, hours, len(days))
+            day_volunteers = days // (day_numbers.max() - day_numbers.min() + 1)
+            for groups, rows in _equal_size_groups(day_volunteers, daily_hours):
+                features.iloc[groups, features.columns.get_loc('hours_volatility')] = np.std(rows, axis=1)
+        
+        # Feedback metrics
+        if len(feedback):
+            codes = index.get_indexer(feedback['volunteer_id'])
+            
+            # Average sentiment of the non-empty comments
+            has_comments = feedback['comments'].notna() & feedback['comments'].astype(bool)
+            comments = feedback['comments'][has_comments].tolist()
+            scores = np.array(self._comment_sentiments(comments), dtype=float)
+            for groups, rows in _equal_size_groups(codes[has_comments.to_numpy()], scores):
+                features.iloc[groups, features.columns.get_loc('feedback_sentiment')] = np.mean(rows, axis=1)
+            
+            # Satisfaction trend over feedback sorted by date, for two or more entries
+            date_ranks = pd.factorize(feedback['date'], sort=True)[0]
+            order = np.lexsort((date_ranks, codes))
+            sorted_codes = codes[order]
+            y = feedback['satisfaction_score'].fillna(3).to_numpy(dtype=float)[order]
+            sizes = np.bincount(sorted_codes, minlength=n)
+            x = np.arange(len(sorted_codes)) - (np.cumsum(sizes) - sizes)[sorted_codes]
+            
+            y_means = np.zeros(n)
+            for groups, rows in _equal_size_groups(sorted_codes, y):
+                y_means[groups] = np.mean(rows, axis=1)
+            x_means = (sizes - 1) / 2
+            
+            dx = x - x_means[sorted_codes]
+            numerator = _sequential_group_sums(sorted_codes, dx * (y - y_means[sorted_codes]), n)
+            denominator = _sequential_group_sums(sorted_codes, dx ** 2, n)
+            
+            trended = np.flatnonzero((sizes >= 2) & (denominator != 0))
+            features.iloc[trended, features.columns.get_loc('satisfaction_trend')] = (
+                numerator[trended] / denominator[trended]
+            )
+        
+        return features
+    
     def predict_burnout_risk(self, volunteer_id):
         """
         Predict burnout risk for a volunteer
@@ -221,132 +1453,307 @@ class RetentionGuardAgent:
             return {"error": "Volunteer not found"}
         
         # Extract engagement features
-        features = self._extract_engagement_features(volunteer_id)
-        
-        # Convert features to format expected by model
-        feature_array = [
-            features['activity_frequency'],
-            features['days_since_last_activity'],
-            features['weekly_hours'],
-            features['hours_volatility'],
-            features['feedback_sentiment'],
-            features['satisfaction_trend']
-        ]
+        features = self.engagement_features(volunteer_id)
         
-        # Reshaping for scikit-learn
-        X = np.array(feature_array).reshape(1, -1)
+        # Score as a one-row batch, so single and bulk assessments agree
+        risk_probability = float(self.score_burnout_risk(pd.DataFrame([features]))[0])
         
-        # For demo purposes, we'll simulate a prediction
-        # In production, this would use the trained model
-        # risk_probability = self.burnout_model.predict_proba(X)[0, 1]
-        
-        # Simulate prediction based on features
-        risk_factors = 0
-        
-        # Check for concerning signs
-        if features['days_since_last_activity'] > self.config['engagement']['low_activity_threshold']:
-            risk_factors += 1
+        # Determine risk level
+        risk_level = self._risk_levels(np.array([risk_probability]))[0]
         
-        if features['weekly_hours'] > self.config['engagement']['high_load_threshold']:
-            risk_factors += 1
+        # Generate risk factors explanation
+        risk_factors_explanation = self._explain_risk_factors(features)
         
-        if features['feedback_sentiment'] < self.config['engagement']['feedback_threshold']:
-            risk_factors += 1
+        # Create risk assessment
+        assessment = self._burnout_assessment(
+            volunteer_id, volunteer, features, risk_probability, risk_level,
+            risk_factors_explanation, datetime.now().strftime('%Y-%m-%d')
+        )
         
-        if features['satisfaction_trend'] < -0.1:
-            risk_factors += 1
+        # Save assessment to Salesforce
+        assessment_id = self.sf.create_burnout_assessment(assessment)
+        assessment['assessment_id'] = assessment_id
         
-        if features['hours_volatility'] > 5:  # High variability in hours
-            risk_factors += 0.5
+        # Create alert for high-risk volunteers
+        if risk_level == 'high':
+            # Get volunteer's manager or coordinator
+            assignments = self.sf.get_volunteer_assignments(volunteer_id)
+            managers = set()
+            
+            for assignment in assignments:
+                project_id = assignment.get('project_id')
+                if project_id:
+                    project = self.sf.get_project(project_id)
+                    if project and 'manager_id' in project:
+                        managers.add(project['manager_id'])
+            
+            # Send alert to each manager
+            for manager_id in managers:
+                alert = {
+                    'recipient_id': manager_id,
+                    'recipient_type': 'staff',
+                    'notification_type': 'burnout_alert',
+                    'subject': f"Burnout Risk Alert: {volunteer.get('name', '')}",
+                    'message': f"High burnout risk detected for {volunteer.get('name', '')}. " +
+                               f"Key factors: {', '.join(risk_factors_explanation)}. " +
+                               f"Please review the assessment and recommended interventions.",
+                    'action_url': f"/staff/volunteers/{volunteer_id}/retention",
+                    'priority': 'high'
+                }
+                
+                self.sf.send_notification(alert)
         
-        # Calculate risk probability (0-1 scale)
-        risk_probability = min(risk_factors / 4, 1.0)
+        return assessment
+    
+    def _risk_levels(self, probabilities):
+        """
+        Bucket risk probabilities into risk levels
         
-        # Determine risk level
-        if risk_probability >= self.config['intervention']['risk_thresholds']['high']:
-            risk_level = 'high'
-        elif risk_probability >= self.config['intervention']['risk_thresholds']['medium']:
-            risk_level = 'medium'
-        elif risk_probability >= self.config['intervention']['risk_thresholds']['low']:
-            risk_level = 'low'
-        else:
-            risk_level = 'minimal'
+        Args:
+            probabilities: Array of risk probabilities
+            
+        Returns:
+            Array of 'high', 'medium', 'low' or 'minimal'
+        """
+        thresholds = self.config['intervention']['risk_thresholds']
+        return np.select(
+            [probabilities >= thresholds['high'],
+             probabilities >= thresholds['medium'],
+             probabilities >= thresholds['low']],
+            ['high', 'medium', 'low'],
+            default='minimal'
+        ).astype(object)
+    
+    def _explain_risk_factors(self, features):
+        """
+        Readable explanations of the concerning signs in engagement features
         
-        # Generate risk factors explanation
+        Args:
+            features: Dictionary of engagement features
+            
+        Returns:
+            List of explanation strings
+        """
+        flags = self._risk_factor_flags(features)
         risk_factors_explanation = []
         
-        if features['days_since_last_activity'] > self.config['engagement']['low_activity_threshold']:
+        if flags['inactivity']:
             risk_factors_explanation.append(
                 f"Inactivity: No activity recorded in {features['days_since_last_activity']} days"
             )
         
-        if features['weekly_hours'] > self.config['engagement']['high_load_threshold']:
+        if flags['high_workload']:
             risk_factors_explanation.append(
                 f"High workload: Averaging {features['weekly_hours']:.1f} hours per week"
             )
         
-        if features['feedback_sentiment'] < self.config['engagement']['feedback_threshold']:
+        if flags['negative_feedback']:
             risk_factors_explanation.append(
                 "Negative feedback: Recent communications show signs of frustration"
             )
         
-        if features['satisfaction_trend'] < -0.1:
+        if flags['declining_satisfaction']:
             risk_factors_explanation.append(
                 "Declining satisfaction: Ratings have been trending downward"
             )
         
+        return risk_factors_explanation
+    
+    def _burnout_assessment(self, volunteer_id, volunteer, features, risk_probability, risk_level,
+                            risk_factors_explanation, assessment_date):
+        """Burnout assessment record as saved to Salesforce"""
         # Get recommended intervention strategies
         if risk_level in self.config['intervention']['reengagement_strategies']:
             strategies = self.config['intervention']['reengagement_strategies'][risk_level]
         else:
             strategies = []
         
-        # Create risk assessment
-        assessment = {
+        return {
             'volunteer_id': volunteer_id,
             'volunteer_name': volunteer.get('name', ''),
-            'assessment_date': datetime.now().strftime('%Y-%m-%d'),
+            'assessment_date': assessment_date,
             'risk_probability': risk_probability,
             'risk_level': risk_level,
             'risk_factors': risk_factors_explanation,
             'engagement_metrics': features,
-            'recommended_strategies': strategies
+            'recommended_strategies': strategies,
+            'model_version': self.burnout_model_version or 'rules'
         }
+    
+    def scan_burnout_risk(self, volunteer_ids=None, now=None):
+        """
+        Assess burnout risk for every volunteer, org-wide
         
-        # Save assessment to Salesforce
-        assessment_id = self.sf.create_burnout_assessment(assessment)
-        assessment['assessment_id'] = assessment_id
+        Features come from the batch extraction (or the streaming
+        aggregates when loaded) and are scored in one vectorized call.
+        Assessments are written with batched inserts; a batch that fails
+        is reported and the scan goes on, alerting only on saved
+        assessments. Managers of the high-risk volunteers are looked up
+        with bulk assignment and project requests, and each manager gets
+        one digest instead of one alert per volunteer.
         
-        # Create alert for high-risk volunteers
-        if risk_level == 'high':
-            # Get volunteer's manager or coordinator
-            assignments = self.sf.get_volunteer_assignments(volunteer_id)
-            managers = set()
+        Args:
+            volunteer_ids: Optional volunteer identifiers (defaults to all active volunteers)
+            now: Optional current datetime (defaults to now)
             
-            for assignment in assignments:
-                project_id = assignment.get('project_id')
-                if project_id:
-                    project = self.sf.get_project(project_id)
-                    if project and 'manager_id' in project:
-                        managers.add(project['manager_id'])
+        Returns:
+            Dictionary with risk level counts, the high-risk assessments,
+            write and notification counts, the batches that failed to save
+            with their volunteers and errors, throughput in volunteers per
+            second and per-stage timings in seconds
+        """
+        if now is None:
+            now = datetime.now()
+        batch_size = self.config.get('scan', {}).get('bulk_batch_size', 200)
+        alert_levels = set(self.config.get('scan', {}).get('alert_levels', ['high']))
+        timings = {}
+        scan_started = time.perf_counter()
+        
+        # Volunteers and their engagement features
+        started = time.perf_counter()
+        if volunteer_ids is None:
+            volunteers = {v['id']: v for v in self.sf.get_active_volunteers()}
+        else:
+            volunteer_ids = list(dict.fromkeys(volunteer_ids))
+            volunteers = {}
+            for offset in range(0, len(volunteer_ids), batch_size):
+                volunteers.update((v['id'], v) for v in self.sf.get_volunteers(volunteer_ids[offset:offset + batch_size]))
             
-            # Send alert to each manager
+            missing = [volunteer_id for volunteer_id in volunteer_ids if volunteer_id not in volunteers]
+            if missing:
+                self.logger.error(f"{len(missing)} volunteers not found for burnout scan")
+        
+        volunteer_ids = list(volunteers)
+        if self.engagement_aggregates is not None:
+            features = self.engagement_aggregates.feature_matrix(volunteer_ids, now)
+        else:
+            features = self.extract_engagement_feature_matrix(volunteer_ids, now=now)
+        timings['features'] = time.perf_counter() - started
+        
+        # Score and bucket every volunteer at once
+        started = time.perf_counter()
+        probabilities = self.score_burnout_risk(features)
+        levels = self._risk_levels(probabilities)
+        
+        assessment_date = now.strftime('%Y-%m-%d')
+        assessments = [
+            self._burnout_assessment(
+                volunteer_id, volunteers[volunteer_id], row, float(probability), level,
+                self._explain_risk_factors(row), assessment_date
+            )
+            for volunteer_id, row, probability, level in zip(
+                features.index, features.to_dict('records'), probabilities, levels
+            )
+        ]
+        timings['score'] = time.perf_counter() - started
+        
+        # Save assessments in batches; a failed batch does not stop the scan
+        started = time.perf_counter()
+        saved = []
+        errors = []
+        for offset in range(0, len(assessments), batch_size):
+            batch = assessments[offset:offset + batch_size]
+            try:
+                assessment_ids = self.sf.create_burnout_assessments(batch)
+            except Exception as e:
+                self.logger.error(f"Error saving burnout assessments {offset}-{offset + len(batch) - 1}: {str(e)}")
+                errors.append({
+                    'offset': offset,
+                    'volunteer_ids': [assessment['volunteer_id'] for assessment in batch],
+                    'error': str(e)
+                })
+                continue
+            for assessment, assessment_id in zip(batch, assessment_ids):
+                assessment['assessment_id'] = assessment_id
+            saved.extend(batch)
+        timings['write'] = time.perf_counter() - started
+        
+        # One manager map for the alerted volunteers whose assessments were saved
+        started = time.perf_counter()
+        alerted = [assessment for assessment in saved if assessment['risk_level'] in alert_levels]
+        alerted_ids = [assessment['volunteer_id'] for assessment in alerted]
+        
+        projects_by_volunteer = defaultdict(set)
+        for offset in range(0, len(alerted_ids), batch_size):
+            for assignment in self.sf.get_assignments_for_volunteers(alerted_ids[offset:offset + batch_size]):
+                if assignment.get('project_id'):
+                    projects_by_volunteer[assignment['volunteer_id']].add(assignment['project_id'])
+        
+        project_ids = list(set().union(*projects_by_volunteer.values()))
+        manager_by_project = {}
+        for offset in range(0, len(project_ids), batch_size):
+            for project in self.sf.get_projects(project_ids[offset:offset + batch_size]):
+                if project and 'manager_id' in project:
+                    manager_by_project[project['id']] = project['manager_id']
+        
+        volunteers_by_manager = defaultdict(list)
+        for assessment in alerted:
+            managers = {
+                manager_by_project[project_id]
+                for project_id in projects_by_volunteer.get(assessment['volunteer_id'], ())
+                if project_id in manager_by_project
+            }
             for manager_id in managers:
-                alert = {
-                    'recipient_id': manager_id,
-                    'recipient_type': 'staff',
-                    'notification_type': 'burnout_alert',
-                    'subject': f"Burnout Risk Alert: {volunteer.get('name', '')}",
-                    'message': f"High burnout risk detected for {volunteer.get('name', '')}. " +
-                               f"Key factors: {', '.join(risk_factors_explanation)}. " +
-                               f"Please review the assessment and recommended interventions.",
-                    'action_url': f"/staff/volunteers/{volunteer_id}/retention",
-                    'priority': 'high'
-                }
-                
-                self.sf.send_notification(alert)
+                volunteers_by_manager[manager_id].append(assessment)
+        timings['managers'] = time.perf_counter() - started
+        
+        # One digest per manager
+        started = time.perf_counter()
+        digests = [
+            self._burnout_digest(manager_id, manager_assessments)
+            for manager_id, manager_assessments in volunteers_by_manager.items()
+        ]
+        for offset in range(0, len(digests), batch_size):
+            self.sf.send_notifications(digests[offset:offset + batch_size])
+        timings['notify'] = time.perf_counter() - started
         
-        return assessment
+        elapsed = time.perf_counter() - scan_started
+        
+        return {
+            'scan_date': assessment_date,
+            'volunteers_scanned': len(assessments),
+            'risk_levels': dict(Counter(levels)),
+            'assessments_created': len(saved),
+            'failed_batches': errors,
+            'alerted_volunteers': len(alerted),
+            'managers_notified': len(digests),
+            'alerts': alerted,
+            'model_version': self.burnout_model_version or 'rules',
+            'throughput': len(assessments) / elapsed if elapsed else 0.0,
+            'elapsed': elapsed,
+            'timings': timings
+        }
+    
+    def _burnout_digest(self, manager_id, assessments):
+        """
+        Consolidated burnout alert for one manager
+        
+        Args:
+            manager_id: Staff identifier of the manager
+            assessments: Assessments of the manager's at-risk volunteers
+            
+        Returns:
+            Notification dictionary
+        """
+        assessments = sorted(assessments, key=lambda a: a['risk_probability'], reverse=True)
+        lines = [
+            f"- {a['volunteer_name'] or a['volunteer_id']} ({a['risk_level']}, {a['risk_probability']:.0%}): " +
+            (', '.join(a['risk_factors']) or 'no single factor stands out')
+            for a in assessments
+        ]
+        
+        return {
+            'recipient_id': manager_id,
+            'recipient_type': 'staff',
+            'notification_type': 'burnout_digest',
+            'subject': f"Burnout Risk Digest: {len(assessments)} volunteer{'s' if len(assessments) != 1 else ''} need attention",
+            'message': "Burnout risk was detected for volunteers on your projects:\n" +
+                       '\n'.join(lines) +
+                       "\nPlease review the assessments and recommended interventions.",
+            'action_url': "/staff/retention/burnout",
+            'volunteer_ids': [a['volunteer_id'] for a in assessments],
+            'priority': 'high'
+        }
     
     def identify_achievements(self, volunteer_id):
         """
@@ -594,4 +2001,64 @@ class RetentionGuardAgent:
         
         # Get volunteer data
         volunteer = self.sf.get_volunteer(volunteer_id)
-        if not
\ No newline at end of file
+        if not volunteer:
+            self.logger.error(f"Volunteer {volunteer_id} not found")
+            return {"error": "Volunteer not found"}
+        
+        # Describe the configured strategies for this risk level
+        strategy_types = self.config['intervention']['reengagement_strategies'].get(risk_level, [])
+        priority = risk_level if risk_level in ('low', 'medium', 'high') else 'low'
+        name = volunteer.get('name', '')
+        
+        details = {
+            'achievement_highlight': ("Highlight recent contributions and milestones", [
+                f"Share a summary of {name}'s recent contributions",
+                "Mention upcoming milestones they are close to reaching"
+            ]),
+            'impact_story': ("Share the impact of their volunteer work", [
+                "Send a story or metrics from a project they supported"
+            ]),
+            'skill_development': ("Offer a training or growth opportunity", [
+                "Suggest a training module related to their interests",
+                "Invite them to mentor or learn a new role"
+            ]),
+            'role_adjustment': ("Review whether their current role is a good fit", [
+                "Discuss role preferences with the volunteer",
+                "Offer alternative roles or projects"
+            ]),
+            'schedule_check': ("Check that their schedule and workload are sustainable", [
+                "Review recent hours and upcoming shifts",
+                "Offer more flexible or fewer shifts"
+            ]),
+            'feedback_session': ("Hold a feedback conversation", [
+                "Schedule a one-on-one check-in",
+                "Ask what would improve their experience"
+            ]),
+            'personal_outreach': ("Reach out personally as soon as possible", [
+                f"Call or meet with {name} this week",
+                "Listen for concerns before proposing changes"
+            ]),
+            'break_suggestion': ("Suggest a break without losing their place", [
+                "Offer a temporary pause in assignments",
+                "Agree on a date to reconnect"
+            ]),
+            'recognition_event': ("Recognize their service publicly", [
+                "Nominate them for recognition at the next team event"
+            ])
+        }
+        
+        strategies = []
+        for strategy_type in strategy_types:
+            description, action_items = details.get(strategy_type, (strategy_type.replace('_', ' ').capitalize(), []))
+            strategies.append({
+                'type': strategy_type,
+                'description': description,
+                'priority': priority,
+                'action_items': action_items
+            })
+        
+        return {
+            'volunteer_id': volunteer_id,
+            'risk_level': risk_level,
+            'strategies': strategies
+        }
@@ -0,0 +1,89 @@
+import hashlib
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import retentionguard
+from matchmaker import MatchMakerAgent
+from onboardingpro import OnboardingProAgent
+from synthetic import SyntheticConnection, SyntheticOnboardingConnection, SyntheticRetentionConnection
+
+
+class HashSentimentAnalyzer:
+    """Deterministic stand-in for VADER, so tests need no lexicon download"""
+    
+    def polarity_scores(self, text):
+        digest = int(hashlib.md5(text.encode()).hexdigest(), 16)
+        return {'compound': ((digest % 20001) - 10000) / 10000.0 * 0.987654321}
+
+
+@pytest.fixture
+def match_sf():
+    """Synthetic MatchMaker data; some records only have a postal code"""
+    return SyntheticConnection(400, 40, seed=11)
+
+
+@pytest.fixture
+def match_agent(match_sf, tmp_path):
+    """MatchMakerAgent with a skill model fitted on the synthetic data"""
+    config = MatchMakerAgent(None).config
+    config['skill_model']['directory'] = str(tmp_path / 'skill_model')
+    # The default threshold is rarely reachable on random profiles
+    config['threshold']['min_match_score'] = 0.02
+    
+    agent = MatchMakerAgent(match_sf, config)
+    agent.fit_skill_model()
+    return agent
+
+
+@pytest.fixture
+def retention_sf():
+    """Synthetic RetentionGuard data with awkward hours and missing fields"""
+    sf = SyntheticRetentionConnection(400, 40, seed=7)
+    rng = random.Random(3)
+    for activities in sf.activities.values():
+        for activity in activities:
+            activity['hours'] = rng.choice([activity['hours'], 0.1, 0.7, 1 / 3])
+        if activities and rng.random() < 0.2:
+            del activities[0]['hours']
+    for feedback in sf.feedback.values():
+        for item in feedback:
+            if rng.random() < 0.1:
+                del item['satisfaction_score']
+            if rng.random() < 0.1:
+                del item['comments']
+    return sf
+
+
+@pytest.fixture
+def retention_agent(retention_sf, monkeypatch, tmp_path):
+    """RetentionGuardAgent on the synthetic data, using the rule-based score"""
+    monkeypatch.setattr(retentionguard.nltk.data, 'find', lambda *args: True)
+    monkeypatch.setattr(retentionguard, 'SentimentIntensityAnalyzer', HashSentimentAnalyzer)
+    
+    agent = retentionguard.RetentionGuardAgent(retention_sf)
+    agent.config['burnout_model']['model_dir'] = str(tmp_path / 'burnout_model')
+    agent.burnout_model, agent.burnout_model_version = None, None
+    return agent
+
+
+@pytest.fixture
+def onboarding_sf():
+    """Synthetic OnboardingPro data with a five-module learning path per volunteer"""
+    sf = SyntheticOnboardingConnection(300, 200, 20, seed=5)
+    sf.add_learning_paths(5, seed=5)
+    return sf
+
+
+@pytest.fixture
+def onboarding_agent(onboarding_sf):
+    """OnboardingProAgent on the synthetic data, without an LMS"""
+    agent = OnboardingProAgent(onboarding_sf)
+    yield agent
+    agent.close()
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+import lmsconnector
+from fake_lms import FakeLMSServer
+from lmsconnector import AsyncLMSConnector, HTTPLMSConnector, LMSConnector, ResponseCache
+from onboardingpro import OnboardingProAgent
+
+
+@pytest.fixture
+def lms_server(onboarding_sf):
+    with FakeLMSServer.from_synthetic(onboarding_sf, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def module_ids(onboarding_sf):
+    return [module['id'] for module in onboarding_sf.modules[:30]]
+
+
+class FailingLMSConnector(LMSConnector):
+    """Connector whose LMS is unreachable"""
+    
+    def get_resources_for_modules(self, module_ids):
+        raise ConnectionError('LMS unavailable')
+    
+    def get_progress_for_volunteers(self, volunteer_ids):
+        raise ConnectionError('LMS unavailable')
+
+
+def test_bulk_requests_are_batched(lms_server, module_ids):
+    connector = HTTPLMSConnector(lms_server.url, batch_size=7)
+    
+    resources = connector.get_resources_for_modules(module_ids + module_ids[:5])
+    
+    assert resources == {module_id: lms_server.resources[module_id] for module_id in module_ids}
+    assert lms_server.requests['/modules/resources'] == 5
+    connector.close()
+
+
+def test_failed_batches_are_left_out(lms_server, module_ids):
+    lms_server.fail_ids = {module_ids[10]}
+    connector = HTTPLMSConnector(lms_server.url, batch_size=7, max_retries=0)
+    
+    resources = connector.get_resources_for_modules(module_ids)
+    assert set(resources) == set(module_ids) - set(module_ids[7:14])
+    
+    # Only the failed batch is asked for again
+    lms_server.fail_ids = set()
+    resources = connector.get_resources_for_modules(module_ids)
+    assert set(resources) == set(module_ids)
+    assert lms_server.requests['/modules/resources'] == 6
+    connector.close()
+
+
+def test_response_cache_expires_after_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(lmsconnector.time, 'monotonic', lambda: clock[0])
+    cache = ResponseCache(maxsize=10, ttl=30)
+    
+    cache.put_many({'a': 1, 'b': 2})
+    clock[0] += 29
+    assert cache.get_many(['a', 'b', 'c']) == ({'a': 1, 'b': 2}, ['c'])
+    
+    clock[0] += 1
+    assert cache.get_many(['a', 'b']) == ({}, ['a', 'b'])
+    assert cache.stats()['size'] == 0
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=2, ttl=30)
+    
+    cache.put_many({'a': 1, 'b': 2})
+    cache.get_many(['a'])
+    cache.put_many({'c': 3})
+    
+    assert cache.get_many(['a', 'b', 'c']) == ({'a': 1, 'c': 3}, ['b'])
+
+
+def test_resources_are_cached_and_progress_is_not(lms_server, module_ids, onboarding_sf):
+    connector = HTTPLMSConnector(lms_server.url, batch_size=10)
+    volunteer_ids = list(onboarding_sf.volunteers)[:10]
+    
+    for _ in range(3):
+        connector.get_resources_for_modules(module_ids)
+        connector.get_progress_for_volunteers(volunteer_ids)
+    
+    assert lms_server.requests['/modules/resources'] == 3
+    assert lms_server.requests['/volunteers/progress'] == 3
+    connector.close()
+
+
+def test_async_gather_matches_sync_fetch(lms_server, module_ids, onboarding_sf):
+    lms_server.fail_ids = {module_ids[10]}
+    connector = AsyncLMSConnector(HTTPLMSConnector(lms_server.url, batch_size=7, cache_ttl=0, max_retries=0))
+    volunteer_ids = list(onboarding_sf.volunteers)[:40]
+    
+    resources = asyncio.run(connector.get_resources_for_modules(module_ids))
+    progress = asyncio.run(connector.get_progress_for_volunteers(volunteer_ids))
+    
+    assert resources == connector.connector.get_resources_for_modules(module_ids)
+    assert set(resources) == set(module_ids) - set(module_ids[7:14])
+    assert progress == {volunteer_id: lms_server.progress[volunteer_id] for volunteer_id in volunteer_ids}
+    assert lms_server.requests['/modules/resources'] == 10
+    connector.close()
+
+
+def test_training_progress_merges_lms_records(lms_server, onboarding_sf):
+    agent = OnboardingProAgent(onboarding_sf, HTTPLMSConnector(lms_server.url))
+    salesforce_only = OnboardingProAgent(onboarding_sf)
+    
+    # Put LMS records on some path modules, half of them with a Salesforce record too
+    for path in list(onboarding_sf.learning_paths.values())[:50]:
+        volunteer_id = path['volunteer_id']
+        for k, module in enumerate(path['modules'][:2]):
+            lms_server.progress[volunteer_id].append({
+                'module_id': module['module_id'], 'status': 'In Progress', 'progress': 40 + k,
+                'score': 0, 'completion_date': None
+            })
+            if k:
+                onboarding_sf.trainings[volunteer_id].append({
+                    'volunteer_id': volunteer_id, 'module_id': module['module_id'], 'status': 'Completed',
+                    'score': 0.9, 'completion_date': '2024-05-01'
+                })
+    
+    from_lms = 0
+    for volunteer_id in list(onboarding_sf.volunteers)[:50]:
+        merged = agent.track_training_progress(volunteer_id)
+        baseline = salesforce_only.track_training_progress(volunteer_id)
+        salesforce_modules = {t['module_id'] for t in onboarding_sf.trainings[volunteer_id]}
+        lms_records = {p['module_id']: p for p in lms_server.progress[volunteer_id]}
+        
+        for module, expected in zip(merged['modules'], baseline['modules']):
+            module_id = module['module_id']
+            assert module['lms_progress'] == lms_records.get(module_id, {}).get('progress', 0)
+            if module_id in salesforce_modules or module_id not in lms_records:
+                assert {k: v for k, v in module.items() if k != 'lms_progress'} == expected
+            else:
+                assert module['status'] == lms_records[module_id]['status']
+                from_lms += 1
+    
+    assert from_lms >= 40
+    agent.close()
+    salesforce_only.close()
+
+
+def test_training_progress_falls_back_when_lms_fails(onboarding_sf):
+    agent = OnboardingProAgent(onboarding_sf, FailingLMSConnector())
+    salesforce_only = OnboardingProAgent(onboarding_sf)
+    
+    for volunteer_id in list(onboarding_sf.volunteers)[:20]:
+        assert agent.track_training_progress(volunteer_id) == salesforce_only.track_training_progress(volunteer_id)
+    
+    agent.close()
+    salesforce_only.close()
+
+
+def test_recommended_resources_fall_back_to_salesforce(lms_server, module_ids, onboarding_sf):
+    salesforce_resources = {
+        module_id: [{'id': f"{module_id}-SF", 'title': 'Salesforce resource', 'learning_style': 'visual'}]
+        for module_id in module_ids
+    }
+    onboarding_sf.get_module_resources = lambda module_id: salesforce_resources.get(module_id, [])
+    lms_server.fail_ids = {module_ids[3]}
+    agent = OnboardingProAgent(onboarding_sf, HTTPLMSConnector(lms_server.url, batch_size=1, max_retries=0))
+    volunteer_id = next(iter(onboarding_sf.volunteers))
+    
+    for module_id in module_ids:
+        expected_resources = salesforce_resources if module_id == module_ids[3] else lms_server.resources
+        expected = agent._rank_resources(onboarding_sf.volunteers[volunteer_id], expected_resources[module_id])
+        assert agent.recommend_resources(volunteer_id, module_id) == expected
+        assert asyncio.run(agent.recommend_resources_async(volunteer_id, module_id)) == expected
+    
+    agent.close()
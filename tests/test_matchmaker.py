@@ -0,0 +1,200 @@
+import numpy as np
+import pytest
+
+from matchmaker import MatchMakerAgent, _haversine_km
+
+COMPONENTS = ('skill_match', 'availability_match', 'location_match')
+
+
+def pair_scores(agent, volunteers, projects):
+    """Brute-force calculate_match_score for every pair"""
+    return {
+        (volunteer['id'], project['id']): agent.calculate_match_score(volunteer, project)
+        for volunteer in volunteers
+        for project in projects
+    }
+
+
+def assert_same_score(match, expected):
+    assert match['overall_score'] == pytest.approx(expected['overall_score'], rel=1e-12, abs=1e-12)
+    for name in COMPONENTS + ('performance_factor',):
+        assert match['component_scores'][name] == pytest.approx(
+            expected['component_scores'][name], rel=1e-12, abs=1e-12), name
+
+
+def test_match_matrix_matches_per_pair_scores(match_agent, match_sf):
+    volunteers = match_sf.get_active_volunteers()[:60]
+    projects = match_sf.get_active_projects()
+    expected = pair_scores(match_agent, volunteers, projects)
+    
+    matrix = match_agent.calculate_match_matrix(volunteers, projects)
+    
+    assert matrix['volunteer_ids'] == [v['id'] for v in volunteers]
+    assert matrix['project_ids'] == [p['id'] for p in projects]
+    for row, volunteer_id in enumerate(matrix['volunteer_ids']):
+        for col, project_id in enumerate(matrix['project_ids']):
+            assert_same_score(match_agent._build_match_result(matrix, row, col), expected[(volunteer_id, project_id)])
+
+
+def test_pruned_match_matrix_keeps_every_passing_pair(match_agent, match_sf):
+    volunteers = match_sf.get_active_volunteers()[:60]
+    projects = match_sf.get_active_projects()
+    expected = pair_scores(match_agent, volunteers, projects)
+    min_score = match_agent.config['threshold']['min_match_score']
+    
+    matrix = match_agent.calculate_match_matrix(volunteers, projects, prune=True)
+    passing = {
+        (matrix['volunteer_ids'][row], matrix['project_ids'][col]): float(matrix['overall_score'][row, col])
+        for row, col in zip(*np.nonzero(matrix['overall_score'] >= min_score))
+    }
+    
+    assert passing.keys() == {pair for pair, score in expected.items() if score['overall_score'] >= min_score}
+    for pair, score in passing.items():
+        assert score == pytest.approx(expected[pair]['overall_score'], rel=1e-12, abs=1e-12)
+
+
+def brute_force_top(agent, scores, top_n):
+    """Overall scores of the top N pairs that reach the minimum match score"""
+    min_score = agent.config['threshold']['min_match_score']
+    return sorted((s['overall_score'] for s in scores if s['overall_score'] >= min_score), reverse=True)[:top_n]
+
+
+def test_find_matches_for_volunteer_matches_brute_force(match_agent, match_sf):
+    projects = match_sf.get_active_projects()
+    
+    for volunteer in match_sf.get_active_volunteers()[:40]:
+        expected = pair_scores(match_agent, [volunteer], projects)
+        matches = match_agent.find_matches_for_volunteer(volunteer['id'], top_n=5)
+        
+        assert [m['overall_score'] for m in matches] == pytest.approx(
+            brute_force_top(match_agent, expected.values(), 5), rel=1e-12, abs=1e-12)
+        for match in matches:
+            assert_same_score(match, expected[(volunteer['id'], match['project_id'])])
+
+
+def test_find_matches_for_project_matches_brute_force(match_agent, match_sf):
+    volunteers = match_sf.get_active_volunteers()
+    
+    for project in match_sf.get_active_projects()[:8]:
+        expected = pair_scores(match_agent, volunteers, [project])
+        matches = match_agent.find_matches_for_project(project['id'], top_n=10)
+        
+        assert [m['overall_score'] for m in matches] == pytest.approx(
+            brute_force_top(match_agent, expected.values(), 10), rel=1e-12, abs=1e-12)
+        for match in matches:
+            assert_same_score(match, expected[(match['volunteer_id'], project['id'])])
+
+
+def distance_km(agent, volunteer, project):
+    """Brute-force distance between the located volunteer and project"""
+    volunteer_point = agent.postal_centroids.locate(agent.volunteer_store.get(volunteer)['location'])
+    project_point = agent.postal_centroids.locate(agent.project_store.get(project)['location'])
+    return float(_haversine_km(*np.radians(volunteer_point), *np.radians(project_point)))
+
+
+def test_volunteers_within_matches_brute_force(match_agent, match_sf):
+    volunteers = match_sf.get_active_volunteers()
+    
+    for project in match_sf.get_active_projects()[:8]:
+        nearby = match_agent.volunteers_within(project, 25)
+        expected = {v['id']: distance_km(match_agent, v, project) for v in volunteers}
+        
+        # Distances right at the radius may fall on either side
+        assert {v for v, km in expected.items() if km < 25 - 1e-6} <= nearby.keys()
+        assert nearby.keys() <= {v for v, km in expected.items() if km <= 25 + 1e-6}
+        for volunteer_id, km in nearby.items():
+            assert km == pytest.approx(expected[volunteer_id], rel=1e-9, abs=1e-9)
+
+
+def test_radius_matches_for_project_match_brute_force(match_agent, match_sf):
+    volunteers = match_sf.get_active_volunteers()
+    
+    for project in match_sf.get_active_projects()[:8]:
+        nearby = [v for v in volunteers if v['id'] in match_agent.volunteers_within(project, 25)]
+        expected = pair_scores(match_agent, nearby, [project])
+        matches = match_agent.find_matches_for_project(project['id'], top_n=10, radius_km=25)
+        
+        assert [m['overall_score'] for m in matches] == pytest.approx(
+            brute_force_top(match_agent, expected.values(), 10), rel=1e-9, abs=1e-9)
+        for match in matches:
+            assert match['overall_score'] == pytest.approx(
+                expected[(match['volunteer_id'], project['id'])]['overall_score'], rel=1e-9, abs=1e-9)
+
+
+def test_reloaded_agent_scores_pairs_without_fetching_rosters(match_agent, match_sf, monkeypatch):
+    volunteers = match_sf.get_active_volunteers()[:30]
+    projects = match_sf.get_active_projects()
+    expected = pair_scores(match_agent, volunteers, projects)
+    
+    fetches = []
+    for method in ('get_active_volunteers', 'get_active_projects'):
+        monkeypatch.setattr(match_sf, method, lambda method=method: fetches.append(method))
+    
+    restarted = MatchMakerAgent(match_sf, match_agent.config)
+    assert restarted.postal_centroids.centroids == match_agent.postal_centroids.centroids
+    for pair, score in pair_scores(restarted, volunteers, projects).items():
+        assert_same_score(score, expected[pair])
+    assert fetches == []
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_sweep_matches_find_matches_for_volunteer(match_agent, match_sf, workers):
+    volunteer_ids = [v['id'] for v in match_sf.get_active_volunteers()[:120]]
+    
+    shards = list(match_agent.sweep_volunteer_matches(volunteer_ids, top_n=5, workers=workers, shard_size=25))
+    swept = {volunteer_id: matches for shard in shards for volunteer_id, matches in shard['matches'].items()}
+    
+    assert len(shards) == 5
+    assert swept.keys() == set(volunteer_ids)
+    for volunteer_id in volunteer_ids:
+        expected = match_agent.find_matches_for_volunteer(volunteer_id, top_n=5)
+        assert [m['project_id'] for m in swept[volunteer_id]] == [m['project_id'] for m in expected], volunteer_id
+        for match, expected_match in zip(swept[volunteer_id], expected):
+            assert_same_score(match, expected_match)
+
+
+def assert_same_matches(matches, expected, key):
+    assert [m[key] for m in matches] == [m[key] for m in expected]
+    for match, expected_match in zip(matches, expected):
+        assert_same_score(match, expected_match)
+
+
+def test_incremental_updates_match_fresh_materialize(match_agent, match_sf):
+    match_agent.materialize_matches(top_n=5)
+    volunteers = list(match_sf.volunteers.values())
+    projects = list(match_sf.projects.values())
+    
+    # Locations are left alone: moved records only shift the postal
+    # centroids on the next full materialize
+    departed = next(v for v in volunteers if v['latitude'] is None)
+    match_sf.volunteers[volunteers[0]['id']] = {**volunteers[0], 'skills': projects[0]['required_skills']}
+    match_sf.volunteers[volunteers[1]['id']] = {**volunteers[1], 'availability': volunteers[2]['availability']}
+    del match_sf.volunteers[departed['id']]
+    match_sf.projects[projects[1]['id']] = {**projects[1], 'required_skills': volunteers[4]['skills']}
+    match_sf.projects['P99999'] = {
+        **projects[2], 'id': 'P99999', 'required_skills': volunteers[5]['skills'],
+        'latitude': None, 'longitude': None
+    }
+    
+    for volunteer in (volunteers[0], volunteers[1], departed):
+        assert match_agent.on_volunteer_updated(volunteer['id'])['removed'] == (volunteer is departed)
+    for project_id in (projects[1]['id'], 'P99999'):
+        assert not match_agent.on_project_updated(project_id)['removed']
+    
+    fresh = MatchMakerAgent(match_sf, match_agent.config)
+    fresh.materialize_matches(top_n=5)
+    
+    assert match_agent.cached_matches_for_volunteer(departed['id']) is None
+    for volunteer_id in match_sf.volunteers:
+        assert_same_matches(match_agent.cached_matches_for_volunteer(volunteer_id),
+                            fresh.cached_matches_for_volunteer(volunteer_id), 'project_id')
+    for project_id in match_sf.projects:
+        assert_same_matches(match_agent.cached_matches_for_project(project_id),
+                            fresh.cached_matches_for_project(project_id), 'volunteer_id')
+    
+    # Spot-check the refreshed rows against on-demand matching
+    for volunteer in volunteers[:2]:
+        assert_same_matches(match_agent.cached_matches_for_volunteer(volunteer['id']),
+                            match_agent.find_matches_for_volunteer(volunteer['id'], top_n=5), 'project_id')
+    assert_same_matches(match_agent.cached_matches_for_project('P99999'),
+                        match_agent.find_matches_for_project('P99999', top_n=5), 'volunteer_id')
@@ -0,0 +1,243 @@
+from collections import Counter
+from datetime import datetime, timedelta
+
+import networkx as nx
+import pytest
+
+from onboardingpro import OnboardingProAgent
+
+
+@pytest.fixture
+def now():
+    return datetime.now()
+
+
+def follow_up_keys(sf):
+    return Counter(n['follow_up_key'] for n in sf.notifications if 'follow_up_key' in n)
+
+
+def test_follow_ups_are_sent_once_across_runs_and_restarts(onboarding_agent, onboarding_sf, now):
+    first = onboarding_agent.run_follow_ups(now)
+    assert first['reminders'] + first['escalations'] > 0
+    
+    again = onboarding_agent.run_follow_ups(now)
+    assert again['reminders'] + again['escalations'] == 0
+    
+    restarted = OnboardingProAgent(onboarding_sf)
+    try:
+        after_restart = restarted.run_follow_ups(now)
+    finally:
+        restarted.close()
+    assert after_restart['reminders'] + after_restart['escalations'] == 0
+    
+    later = onboarding_agent.run_follow_ups(now + timedelta(days=10))
+    assert later['reminders'] + later['escalations'] > 0
+    assert max(follow_up_keys(onboarding_sf).values()) == 1
+
+
+def test_follow_up_queue_is_loaded_once(onboarding_agent, onboarding_sf, now):
+    onboarding_agent.run_follow_ups(now)
+    queue = onboarding_agent.follow_up_queue
+    loads = dict(onboarding_sf.round_trips)
+    
+    for days in range(1, 6):
+        onboarding_agent.run_follow_ups(now + timedelta(days=days))
+    
+    assert onboarding_agent.follow_up_queue is queue
+    for method in ('get_active_learning_paths', 'get_follow_up_keys'):
+        assert onboarding_sf.round_trips[method] == loads[method], method
+
+
+def generate_path(agent, sf):
+    """Learning path with modules for a volunteer without training history"""
+    volunteer_id = next(v for v in sf.volunteers if not sf.trainings[v])
+    for role_id in sf.roles:
+        path = agent.generate_learning_path(volunteer_id, role_id)
+        if path['total_modules']:
+            return path
+
+
+def test_created_learning_path_is_queued(onboarding_agent, onboarding_sf, now):
+    onboarding_agent.run_follow_ups(now)
+    path = generate_path(onboarding_agent, onboarding_sf)
+    deadlines = {
+        module['module_id']: datetime.strptime(module['estimated_completion'], '%Y-%m-%d')
+        for module in path['modules']
+    }
+    last_module = max(deadlines, key=deadlines.get)
+    
+    onboarding_agent.run_follow_ups(deadlines[last_module] - timedelta(days=1))
+    assert follow_up_keys(onboarding_sf)[f"{path['path_id']}:{last_module}:reminder:1"] == 1
+    
+    escalation_threshold = onboarding_agent.config['training']['escalation_threshold']
+    onboarding_agent.run_follow_ups(deadlines[last_module] + timedelta(days=escalation_threshold))
+    sent = follow_up_keys(onboarding_sf)
+    for module_id in deadlines:
+        assert sent[f"{path['path_id']}:{module_id}:escalation"] == 1
+
+
+def test_changed_learning_path_is_requeued(onboarding_agent, onboarding_sf, now):
+    onboarding_agent.run_follow_ups(now)
+    path_id = generate_path(onboarding_agent, onboarding_sf)['path_id']
+    
+    modules = onboarding_sf.learning_paths[path_id]['modules']
+    for module in modules:
+        module['estimated_completion'] = (now + timedelta(days=30)).strftime('%Y-%m-%d')
+    assert onboarding_agent.on_learning_path_changed(path_id)
+    
+    # Nothing is due on the old dates any more
+    onboarding_agent.run_follow_ups(now + timedelta(days=25))
+    assert not any(key.startswith(f"{path_id}:") for key in follow_up_keys(onboarding_sf))
+    
+    onboarding_agent.run_follow_ups(now + timedelta(days=29))
+    sent = follow_up_keys(onboarding_sf)
+    for module in modules:
+        assert sent[f"{path_id}:{module['module_id']}:reminder:1"] == 1
+        assert sent[f"{path_id}:{module['module_id']}:reminder:3"] == 0
+
+
+def test_failed_follow_up_batch_is_retried_on_the_next_run(onboarding_agent, onboarding_sf, now):
+    onboarding_agent.config['training']['bulk_batch_size'] = 50
+    schedule_notifications = onboarding_sf.schedule_notifications
+    batches = []
+    
+    def flaky_schedule(notifications):
+        batches.append([n['follow_up_key'] for n in notifications])
+        if len(batches) == 2:
+            raise ConnectionError('Salesforce unavailable')
+        return schedule_notifications(notifications)
+    
+    onboarding_sf.schedule_notifications = flaky_schedule
+    failed = onboarding_agent.run_follow_ups(now)
+    assert 'Salesforce unavailable' in failed['error']
+    assert failed['reminders'] + failed['escalations'] == 50
+    
+    retried = onboarding_agent.run_follow_ups(now)
+    assert 'error' not in retried
+    assert retried['reminders'] + retried['escalations'] == sum(len(batch) for batch in batches[2:])
+    
+    sent = follow_up_keys(onboarding_sf)
+    assert set(batches[1]) <= set(sent)
+    assert max(sent.values()) == 1
+    assert onboarding_agent.run_follow_ups(now)['reminders'] == 0
+
+
+def test_certification_sweep_matches_per_volunteer_verification(onboarding_agent, onboarding_sf):
+    swept = onboarding_agent.sweep_certifications()
+    
+    expected = {}
+    for volunteer_id in onboarding_sf.volunteers:
+        for cert in onboarding_agent.verify_certifications(volunteer_id)['certification_details']['expiring']:
+            expected[(volunteer_id, cert['certification_id'])] = cert['days_until_expiration']
+    
+    assert {(c['volunteer_id'], c['certification_id']): c['days_until_expiration']
+            for c in swept['expiring']} == expected
+    assert swept['notifications_sent'] == len(expected)
+
+
+def test_certification_warnings_are_sent_once(onboarding_agent, onboarding_sf, now):
+    first = onboarding_agent.sweep_certifications(now)
+    assert first['notifications_sent'] > 0
+    
+    assert onboarding_agent.sweep_certifications(now)['notifications_sent'] == 0
+    assert onboarding_agent.sweep_certifications(now + timedelta(days=1))['notifications_sent'] < \
+        first['notifications_sent']
+    
+    restarted = OnboardingProAgent(onboarding_sf)
+    try:
+        assert restarted.sweep_certifications(now)['notifications_sent'] == 0
+    finally:
+        restarted.close()
+    
+    assert max(follow_up_keys(onboarding_sf).values()) == 1
+    assert onboarding_sf.round_trips['get_all_volunteer_certifications'] == 2
+
+
+def test_certification_hooks_update_the_expiry_index(onboarding_agent, onboarding_sf, now):
+    renewed, revoked = onboarding_agent.sweep_certifications(now)['expiring'][:2]
+    
+    renewal = {**renewed, 'expiration_date': (now + timedelta(days=400)).strftime('%Y-%m-%d')}
+    assert onboarding_agent.on_certification_updated(renewed['volunteer_id'], renewal)
+    assert onboarding_agent.on_certification_removed(revoked['volunteer_id'], revoked['certification_id'])
+    
+    later = onboarding_agent.sweep_certifications(now + timedelta(days=1))
+    expiring = {(c['volunteer_id'], c['certification_id']) for c in later['expiring']}
+    assert (renewed['volunteer_id'], renewed['certification_id']) not in expiring
+    assert (revoked['volunteer_id'], revoked['certification_id']) not in expiring
+    
+    # The renewed certification is warned about again before its new date
+    onboarding_agent.sweep_certifications(now + timedelta(days=380))
+    key = f"certification:{renewed['volunteer_id']}:{renewed['certification_id']}:{renewal['expiration_date']}"
+    assert follow_up_keys(onboarding_sf)[key] == 1
+    assert onboarding_sf.round_trips['get_all_volunteer_certifications'] == 1
+
+
+def baseline_path(agent, volunteer, role, trainings):
+    """
+    Module ids and required flags of a learning path, worked out on the
+    training graph with networkx like generate_learning_path used to
+    """
+    graph = agent.training_graph
+    completed = {
+        t['module_id'] for t in trainings
+        if t['status'] == 'Completed' and t['score'] >= agent.config['training']['min_module_completion']
+    }
+    skills = volunteer.get('skills', [])
+    required, recommended = [], []
+    for node, attrs in graph.nodes(data=True):
+        if node in completed:
+            continue
+        if role['id'] in attrs.get('required_roles', []):
+            required.append(node)
+        elif role['id'] in attrs.get('optional_roles', []):
+            recommended.append(node)
+        elif attrs.get('skill_category') in role.get('required_skills', []) and attrs.get('skill_category') not in skills:
+            required.append(node)
+        elif attrs.get('skill_category') in role.get('recommended_skills', []) and \
+                attrs.get('skill_category') not in skills:
+            recommended.append(node)
+    
+    all_required = set(required)
+    for module in required:
+        all_required |= nx.ancestors(graph, module) - completed
+    path = {module: module in required for module in all_required}
+    for module in recommended:
+        if module not in all_required and all(p in completed or p in all_required for p in graph.predecessors(module)):
+            path[module] = False
+    return path, len(required), all_required
+
+
+def assert_baseline_path(agent, sf, path):
+    volunteer, role = sf.volunteers[path['volunteer_id']], sf.roles[path['role_id']]
+    expected, required, all_required = baseline_path(agent, volunteer, role, sf.trainings[volunteer['id']])
+    modules = [m['module_id'] for m in path['modules']]
+    
+    assert {m['module_id']: m['required'] for m in path['modules']} == expected
+    assert len(modules) == len(expected)
+    assert path['required_modules'] == required
+    assert path['estimated_hours'] == sum(agent.training_graph.nodes[m].get('duration_minutes', 60) for m in modules) / 60
+    
+    # Prerequisites come first, and recommended extras after the required path
+    position = {module_id: k for k, module_id in enumerate(modules)}
+    for module in path['modules']:
+        assert module['prerequisites'] == list(agent.training_graph.predecessors(module['module_id']))
+        assert all(position[p] < position[module['module_id']] for p in module['prerequisites'] if p in position)
+    in_required_path = [module_id in all_required for module_id in modules]
+    assert in_required_path == sorted(in_required_path, reverse=True)
+
+
+def test_learning_paths_match_baseline(onboarding_agent, onboarding_sf):
+    assignments = [
+        (volunteer_id, role_id)
+        for k, volunteer_id in enumerate(list(onboarding_sf.volunteers)[:100])
+        for role_id in list(onboarding_sf.roles)[k % 4::8]
+    ]
+    
+    cohort = onboarding_agent.generate_learning_paths(assignments)
+    assert cohort['total_created'] == len(assignments)
+    
+    for path in cohort['paths']:
+        assert_baseline_path(onboarding_agent, onboarding_sf, path)
+        single = onboarding_agent.generate_learning_path(path['volunteer_id'], path['role_id'])
+        assert single['modules'] == path['modules']
+        assert {k: v for k, v in single.items() if k != 'path_id'} == {k: v for k, v in path.items() if k != 'path_id'}
@@ -0,0 +1,288 @@
+import os
+from datetime import datetime, timedelta
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from retentionguard import ENGAGEMENT_FEATURES, MODEL_FEATURES, EngagementAggregator, SentimentCache
+
+
+@pytest.fixture
+def now():
+    return datetime.now()
+
+
+def test_feature_matrix_matches_per_volunteer(retention_agent, retention_sf, now):
+    matrix = retention_agent.extract_engagement_feature_matrix(now=now)
+    
+    assert list(matrix.columns) == ENGAGEMENT_FEATURES
+    assert set(matrix.index) == set(retention_sf.volunteers)
+    for volunteer_id in retention_sf.volunteers:
+        features = retention_agent._extract_engagement_features(volunteer_id, now=now)
+        for name in ENGAGEMENT_FEATURES:
+            # Same numbers, not just close ones
+            assert float(matrix.at[volunteer_id, name]) == float(features[name]), (volunteer_id, name)
+
+
+def test_feature_matrix_matches_per_volunteer_in_past_window(retention_agent, retention_sf, now):
+    past = now - timedelta(days=25)
+    volunteer_ids = list(retention_sf.volunteers)[::3]
+    matrix = retention_agent.extract_engagement_feature_matrix(volunteer_ids, now=past)
+    
+    assert list(matrix.index) == volunteer_ids
+    for volunteer_id in volunteer_ids:
+        features = retention_agent._extract_engagement_features(volunteer_id, now=past)
+        for name in ENGAGEMENT_FEATURES:
+            assert float(matrix.at[volunteer_id, name]) == float(features[name]), (volunteer_id, name)
+
+
+def test_rule_based_risk_matches_predict(retention_agent, retention_sf):
+    volunteer_ids = list(retention_sf.volunteers)[:150]
+    matrix = retention_agent.extract_engagement_feature_matrix(volunteer_ids)
+    probabilities = retention_agent.score_burnout_risk(matrix[MODEL_FEATURES])
+    
+    for volunteer_id, probability in zip(volunteer_ids, probabilities):
+        assessment = retention_agent.predict_burnout_risk(volunteer_id)
+        assert assessment['risk_probability'] == probability, volunteer_id
+
+
+def test_scan_matches_predict(retention_agent, retention_sf, now):
+    volunteer_ids = list(retention_sf.volunteers)[:150]
+    expected = {
+        volunteer_id: retention_agent.predict_burnout_risk(volunteer_id)
+        for volunteer_id in volunteer_ids
+    }
+    retention_sf.notifications.clear()
+    
+    result = retention_agent.scan_burnout_risk(volunteer_ids, now=now)
+    scanned = {a['volunteer_id']: a for a in retention_sf.assessments[-len(volunteer_ids):]}
+    
+    assert result['volunteers_scanned'] == len(volunteer_ids)
+    for volunteer_id, assessment in expected.items():
+        for field in ('risk_probability', 'risk_level', 'risk_factors', 'recommended_strategies'):
+            assert scanned[volunteer_id][field] == assessment[field], (volunteer_id, field)
+    
+    alerted = {v for digest in retention_sf.notifications for v in digest['volunteer_ids']}
+    high_risk = {v for v, a in expected.items() if a['risk_level'] == 'high'}
+    assert alerted <= high_risk
+
+
+def test_risk_levels_match_thresholds(retention_agent):
+    thresholds = retention_agent.config['intervention']['risk_thresholds']
+    probabilities = np.array([0.0, thresholds['low'], thresholds['medium'], thresholds['high'], 1.0])
+    
+    assert list(retention_agent._risk_levels(probabilities)) == ['minimal', 'low', 'medium', 'high', 'high']
+
+
+@pytest.mark.parametrize('days_later', [0, 30, 60, 89, 90])
+def test_aggregates_match_extraction(retention_agent, retention_sf, now, days_later):
+    retention_agent.load_engagement_aggregates(now)
+    later = now + timedelta(days=days_later)
+    
+    for volunteer_id in retention_sf.volunteers:
+        streamed = retention_agent.engagement_aggregates.features(volunteer_id, later)
+        extracted = retention_agent._extract_engagement_features(volunteer_id, now=later)
+        for name in ENGAGEMENT_FEATURES:
+            # Expiring days removes values from running sums, which drifts
+            # by a few 1e-7 at most before the window empties
+            assert float(streamed[name]) == pytest.approx(float(extracted[name]), rel=1e-6, abs=1e-6), \
+                (volunteer_id, name)
+
+
+def test_aggregates_snapshot_round_trip(retention_agent, retention_sf, now, tmp_path):
+    retention_agent.load_engagement_aggregates(now)
+    path = str(tmp_path / 'engagement.json')
+    retention_agent.save_engagement_aggregates(path)
+    
+    restored, _ = EngagementAggregator.load(path)
+    volunteer_ids = list(retention_sf.volunteers)
+    expected = retention_agent.engagement_aggregates.feature_matrix(volunteer_ids, now)
+    pd.testing.assert_frame_equal(restored.feature_matrix(volunteer_ids, now), expected, rtol=1e-12)
+
+
+def test_aggregates_snapshot_catches_up_on_load(retention_agent, retention_sf, now, tmp_path):
+    retention_agent.config['aggregates']['snapshot_path'] = str(tmp_path / 'engagement.json')
+    retention_agent.load_engagement_aggregates(now)
+    retention_agent.save_engagement_aggregates()
+    
+    # Logged after the snapshot was saved, on the same day
+    today = now.strftime('%Y-%m-%d')
+    volunteer_ids = list(retention_sf.volunteers)[:20]
+    for volunteer_id in volunteer_ids:
+        retention_sf.activities[volunteer_id].append(
+            {'volunteer_id': volunteer_id, 'project_id': None, 'date': today, 'hours': 3.0}
+        )
+        retention_sf.feedback[volunteer_id].append(
+            {'volunteer_id': volunteer_id, 'project_id': None, 'date': today,
+             'satisfaction_score': 2.0, 'comments': 'Too many shifts lately'}
+        )
+    
+    restarted = type(retention_agent)(retention_sf, config=retention_agent.config)
+    assert restarted.engagement_aggregates is not None
+    
+    for volunteer_id in retention_sf.volunteers:
+        streamed = restarted.engagement_aggregates.features(volunteer_id, now)
+        extracted = restarted._extract_engagement_features(volunteer_id, now=now)
+        for name in ENGAGEMENT_FEATURES:
+            assert float(streamed[name]) == pytest.approx(float(extracted[name]), rel=1e-9, abs=1e-9), \
+                (volunteer_id, name)
+
+
+def test_scan_reports_failed_assessment_batches(retention_agent, retention_sf, now):
+    retention_agent.config['scan']['bulk_batch_size'] = 50
+    retention_agent.config['scan']['alert_levels'] = ['high', 'medium', 'low', 'minimal']
+    create_burnout_assessments = retention_sf.create_burnout_assessments
+    calls = []
+    
+    def flaky_create(assessments):
+        calls.append(len(assessments))
+        if len(calls) == 2:
+            raise ConnectionError('Salesforce unavailable')
+        return create_burnout_assessments(assessments)
+    
+    retention_sf.create_burnout_assessments = flaky_create
+    volunteer_ids = list(retention_sf.volunteers)[:200]
+    result = retention_agent.scan_burnout_risk(volunteer_ids, now=now)
+    
+    failed_ids = set(volunteer_ids[50:100])
+    assert result['volunteers_scanned'] == 200
+    assert result['assessments_created'] == 150
+    assert len(result['failed_batches']) == 1
+    assert set(result['failed_batches'][0]['volunteer_ids']) == failed_ids
+    assert 'Salesforce unavailable' in result['failed_batches'][0]['error']
+    
+    digested = {v for digest in retention_sf.notifications for v in digest['volunteer_ids']}
+    assert digested
+    assert not digested & failed_ids
+
+
+def test_burnout_model_round_trip(retention_agent, retention_sf, now):
+    retention_agent.scan_burnout_risk(now=now)
+    summary = retention_agent.train_burnout_model()
+    assert 'error' not in summary
+    assert os.path.dirname(summary['artifact_path']) == retention_agent.config['burnout_model']['model_dir']
+    
+    restarted = type(retention_agent)(retention_sf, config=retention_agent.config)
+    assert restarted.burnout_model_version == summary['version']
+    
+    matrix = retention_agent.extract_engagement_feature_matrix(now=now)[MODEL_FEATURES]
+    np.testing.assert_array_equal(restarted.score_burnout_risk(matrix), retention_agent.score_burnout_risk(matrix))
+
+
+def test_burnout_model_save_bumps_taken_version(retention_agent, retention_sf, now):
+    retention_agent.scan_burnout_risk(now=now)
+    summary = retention_agent.train_burnout_model()
+    
+    taken = {'version': summary['version']}
+    path = retention_agent._save_burnout_model(retention_agent.burnout_model, taken)
+    
+    assert taken['version'] == str(int(summary['version']) + 1)
+    assert path != summary['artifact_path']
+    assert joblib.load(path)['version'] == taken['version']
+    assert joblib.load(summary['artifact_path'])['version'] == summary['version']
+    
+    restarted = type(retention_agent)(retention_sf, config=retention_agent.config)
+    assert restarted.burnout_model_version == taken['version']
+
+
+def test_burnout_model_with_other_features_is_rejected(retention_agent, retention_sf, now):
+    retention_agent.scan_burnout_risk(now=now)
+    summary = retention_agent.train_burnout_model()
+    
+    # A newer artifact trained on a different feature list
+    stale = joblib.load(summary['artifact_path'])
+    stale.update({'features': MODEL_FEATURES[:-1], 'version': str(int(summary['version']) + 1)})
+    model_dir = retention_agent.config['burnout_model']['model_dir']
+    joblib.dump(stale, os.path.join(model_dir, f"burnout_model-{stale['version']}.joblib"))
+    
+    restarted = type(retention_agent)(retention_sf, config=retention_agent.config)
+    assert restarted.burnout_model is None
+    assert restarted.burnout_model_version is None
+
+
+class CountingAnalyzer:
+    """Sentiment analyzer wrapper that counts the texts it scores"""
+    
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.calls = 0
+    
+    def polarity_scores(self, text):
+        self.calls += 1
+        return self.analyzer.polarity_scores(text)
+
+
+def distinct_feedback(sf):
+    """All feedback, with comments made distinct per volunteer and day"""
+    feedback = [item for items in sf.feedback.values() for item in items]
+    for item in feedback:
+        if item.get('comments'):
+            item['comments'] = f"{item['comments']} ({item['volunteer_id']}, {item['date']})"
+    return feedback
+
+
+def test_sentiment_cache_persists_across_restarts(retention_agent, retention_sf, now, tmp_path):
+    retention_agent.config['sentiment']['cache_path'] = str(tmp_path / 'sentiment.db')
+    feedback = distinct_feedback(retention_sf)
+    first = type(retention_agent)(retention_sf, config=retention_agent.config)
+    scored = first.score_new_feedback(feedback, workers=1)
+    assert scored['scored'] == scored['distinct'] > 0
+    expected = first.extract_engagement_feature_matrix(now=now)
+    first.sentiment_cache.close()
+    
+    restarted = type(retention_agent)(retention_sf, config=retention_agent.config)
+    restarted.sentiment_analyzer = CountingAnalyzer(restarted.sentiment_analyzer)
+    
+    again = restarted.score_new_feedback(feedback, workers=1)
+    assert again['scored'] == 0
+    assert again['already_cached'] == scored['distinct']
+    pd.testing.assert_frame_equal(restarted.extract_engagement_feature_matrix(now=now), expected)
+    assert restarted.sentiment_analyzer.calls == 0
+    restarted.sentiment_cache.close()
+
+
+def test_sentiment_cache_evicts_least_recently_used(tmp_path):
+    cache = SentimentCache(str(tmp_path / 'sentiment.db'), maxsize=2)
+    
+    cache.put_many({'a': 0.1, 'b': 0.2})
+    cache.get_many(['a'])
+    cache.put_many({'c': 0.3})
+    assert list(cache.scores) == ['a', 'c']
+    
+    # Evicted scores are still read back from the database
+    assert cache.get_many(['b', 'd']) == ({'b': 0.2}, ['d'])
+    assert list(cache.scores) == ['c', 'b']
+    assert cache.stats()['size'] == 2
+    cache.close()
+
+
+def test_sentiment_cache_counts_repeated_misses():
+    cache = SentimentCache(maxsize=10)
+    
+    assert cache.get_many(['a', 'a', 'b']) == ({}, ['a', 'b'])
+    cache.put_many({'a': 0.5})
+    assert cache.get_many(['a', 'b', 'a']) == ({'a': 0.5}, ['b'])
+    
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 4)
+    assert stats['hit_rate'] == pytest.approx(2 / 6)
+
+
+def test_score_new_feedback_in_worker_processes(retention_agent, retention_sf):
+    retention_agent.config['sentiment']['chunk_size'] = 50
+    feedback = distinct_feedback(retention_sf)
+    comments = {SentimentCache.key(item['comments']): item['comments'] for item in feedback if item.get('comments')}
+    
+    result = retention_agent.score_new_feedback(feedback, workers=3)
+    assert result['workers'] == 3
+    assert result['scored'] == len(comments) > 150
+    
+    found, missing = retention_agent.sentiment_cache.get_many(list(comments))
+    assert missing == []
+    assert found == {
+        key: retention_agent.sentiment_analyzer.polarity_scores(text)['compound']
+        for key, text in comments.items()
+    }
+    assert retention_agent.score_new_feedback(feedback, workers=3)['scored'] == 0